@@ -50,8 +50,10 @@ import platform
 import time
 import shlex
 import errno
+import json
 from threading import Lock
 from contextlib import contextmanager
+from functools import partial
 from functools import wraps
 
 from omero_ext.argparse import ArgumentError
@@ -105,6 +107,10 @@ else:
 
 OMERO_COMPONENTS = ['common', 'model', 'romio', 'renderer', 'server', 'blitz']
 
+# Environment variables changing which commands the plugins register.
+# The plugin manifest is only used if they have not changed.
+PLUGIN_ENVIRONMENT = ("OMERO_DEV_PLUGINS", "OMERO_NO_DEPRECATED_PLUGINS")
+
 COMMENT = re.compile(r"^\s*#")
 RELFILE = re.compile(r"^\w")
 LINEWSP = re.compile(r"^\s*\w+\s+")
@@ -1195,6 +1201,43 @@ class CLI(cmd.Cmd, Context):
             finally:
                 self.lock.release()
 
+    class LazyControl(object):
+        """
+        Placeholder for a control found in the plugin manifest whose
+        plugin file has not been executed yet. See loadplugins()
+        """
+        def __init__(self, plugin, help, epilog):
+            self.plugin = plugin
+            self.help = help
+            self.epilog = epilog
+            self.parser = None
+
+    class Controls(dict):
+        """
+        Registered controls by name. Accessing a control which is
+        still a LazyControl loads its plugin first, so that plugins
+        calling each other via ctx.controls keep working.
+        """
+        def __init__(self, cli):
+            dict.__init__(self)
+            self.cli = cli
+
+        def __getitem__(self, name):
+            if isinstance(dict.get(self, name), CLI.LazyControl):
+                self.cli.loadcontrol(name)
+            return dict.__getitem__(self, name)
+
+        def get(self, name, default=None):
+            if name in self:
+                return self[name]
+            return default
+
+        def values(self):
+            return [self[name] for name in list(self)]
+
+        def items(self):
+            return [(name, self[name]) for name in list(self)]
+
     def __init__(self, prog=sys.argv[0]):
         """
         Also sets the "_client" field for this instance to None. Each cli
@@ -1211,6 +1254,8 @@ class CLI(cmd.Cmd, Context):
         #: Paths to be loaded; initially official plugins
         self._plugin_paths = [old_div(OMEROCLI, "plugins")]
         self._pluginsLoaded = CLI.PluginsLoaded()
+        self._parsers = {}   #: Parsers created for not yet loaded controls
+        self.controls = CLI.Controls(self)
 
     def assertRC(self):
         if self.rv != 0:
@@ -1355,6 +1400,7 @@ class CLI(cmd.Cmd, Context):
             self.exit("")
             return
 
+        self.loadcontrols(args)
         args = self.parser.parse_args(args, previous_args)
         args.prog = self.parser.prog
         self.waitForPlugins()
@@ -1627,18 +1673,30 @@ class CLI(cmd.Cmd, Context):
     def configure_plugins(self):
         """
         Run to instantiate and configure all plugins
-        which were registered via register_only()
+        which were registered via register_only(). Controls
+        which have not been loaded yet only get an empty parser
+        so that they are listed in the help.
         """
         for name in sorted(self.controls):
-            control = self.controls[name]
-            if isinstance(control, tuple):
+            control = dict.get(self.controls, name)
+            if isinstance(control, CLI.LazyControl):
+                if control.parser is None:
+                    parser = self.subparsers.add_parser(name, help=control.help)
+                    parser.description = control.help
+                    parser.epilog = control.epilog
+                    control.parser = parser
+                    setattr(self, "complete_%s" % name,
+                            partial(self._complete_lazy, name))
+            elif isinstance(control, tuple):
                 Control = control[0]
                 help = control[1]
                 epilog = control[2]
                 control = Control(ctx=self, dir=self.dir)
                 self.controls[name] = control
                 setattr(self, "complete_%s" % name, control._complete)
-                parser = self.subparsers.add_parser(name, help=help)
+                parser = self._parsers.pop(name, None)
+                if parser is None:
+                    parser = self.subparsers.add_parser(name, help=help)
                 parser.description = help
                 parser.epilog = epilog
                 if hasattr(control, "_configure"):
@@ -1647,6 +1705,9 @@ class CLI(cmd.Cmd, Context):
                     parser.set_defaults(func=control.__call__)
                 control.parser = parser
 
+    def _complete_lazy(self, name, *args):
+        return self.controls[name]._complete(*args)
+
     def waitForPlugins(self):
         if True:
             return  # Disabling. See comment in argv
@@ -1661,6 +1722,16 @@ class CLI(cmd.Cmd, Context):
         themselves with the CLI instance. Here register_only()
         is used to guarantee the orderedness of the plugins
         in the parser
+
+        The commands registered by each plugin file are kept in a
+        manifest in the user cache directory. Unchanged plugin files
+        (same modification time and size) are not executed but their
+        commands registered as LazyControl instances which are only
+        loaded once they are used. See loadcontrols()
+
+        The manifest is ignored if any of PLUGIN_ENVIRONMENT changed.
+        Plugin files which emit warnings while loading, e.g. deprecated
+        plugins, are not recorded so that they keep warning.
         """
 
         paths = set(self._plugin_paths)
@@ -1673,29 +1744,160 @@ class CLI(cmd.Cmd, Context):
             else:
                 if self.isdebug:
                     print("Can't load %s" % x)
+
+        cached = self._read_manifest()
+        manifest = {}
         for plugin_path in paths:
-            self.loadpath(path(plugin_path))
+            for plugin in self._plugin_files(path(plugin_path)):
+                self._loadplugin(plugin, cached, manifest)
+        if manifest != cached:
+            self._write_manifest(manifest)
 
         self.configure_plugins()
         self._pluginsLoaded.set()
         self.post_process()
 
     def loadpath(self, pathobj):
+        for plugin in self._plugin_files(pathobj):
+            self._execplugin(plugin)
+
+    def loadcontrol(self, name):
+        """
+        Executes the plugin file of a LazyControl and configures
+        the controls it registers on the parsers already created.
+        """
+        lazy = dict.get(self.controls, name)
+        if not isinstance(lazy, CLI.LazyControl):
+            return
+        for other, control in list(dict.items(self.controls)):
+            if (isinstance(control, CLI.LazyControl) and
+                    control.plugin == lazy.plugin):
+                if control.parser is not None:
+                    self._parsers[other] = control.parser
+                del self.controls[other]
+        self._execplugin(path(lazy.plugin))
+        self.configure_plugins()
+        if self._parsers:
+            # The plugin did not register these commands again, so the
+            # manifest is out of date
+            self._write_manifest(dict(
+                (k, v) for k, v in self._read_manifest().items()
+                if k != lazy.plugin))
+            for other, parser in list(self._parsers.items()):
+                parser.set_defaults(func=partial(self._unavailable, other))
+                self.__dict__.pop("complete_%s" % other, None)
+                del self._parsers[other]
+
+    def _unavailable(self, name, args):
+        self.die(2, "Command %s is no longer available, try again" % name)
+
+    def loadcontrols(self, args):
+        """
+        Loads the LazyControl instances named in args, or all of
+        them if help was requested.
+        """
+        lazy = [name for name, control in dict.items(self.controls)
+                if isinstance(control, CLI.LazyControl)]
+        if not lazy:
+            return
+        if "help" not in args:
+            lazy = [name for name in lazy if name in args]
+        for name in lazy:
+            self.loadcontrol(name)
+
+    def _plugin_files(self, pathobj):
         if pathobj.isdir():
             for plugin in sorted(pathobj.walkfiles("*.py")):
                 if -1 == plugin.find("#"):  # Omit emacs files
-                    self.loadpath(path(plugin))
+                    yield path(plugin)
         else:
-            if self.isdebug:
-                print("Loading %s" % pathobj)
-            try:
-                loc = {"register": self.register_only}
+            yield pathobj
+
+    def _loadplugin(self, pathobj, cached, manifest):
+        key = str(pathobj.abspath())
+        try:
+            stat = os.stat(key)
+        except OSError:
+            self._execplugin(pathobj)  # Reports the error
+            return
+        stamp = [stat.st_mtime, stat.st_size]
+        entry = cached.get(key)
+        if entry and entry.get("stamp") == stamp:
+            for name, help, epilog in entry["commands"]:
+                self.controls[name] = CLI.LazyControl(key, help, epilog)
+            manifest[key] = entry
+            return
+        commands = self._execplugin(pathobj, record=True)
+        if commands is not None and all(
+                isinstance(x, basestring) or x is None
+                for command in commands for x in command):
+            manifest[key] = {"stamp": stamp, "commands": commands}
+
+    def _execplugin(self, pathobj, record=False):
+        """
+        Executes a single plugin file, returning the list of
+        [name, help, epilog] it registered or None on error.
+        If record is True, None is also returned if the plugin
+        emitted warnings, so that it is not added to the manifest.
+        """
+        if self.isdebug:
+            print("Loading %s" % pathobj)
+        commands = []
+
+        def register(name, Control, help, epilog=None):
+            commands.append([name, help, epilog])
+            self.register_only(name, Control, help, epilog=epilog)
+
+        try:
+            loc = {"register": register}
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
                 execfile(str(pathobj), loc)
-            except KeyboardInterrupt:
-                raise
-            except:
-                self.err("Error loading: %s" % pathobj)
-                traceback.print_exc()
+            # Shown as usual, subject to the warning filters
+            for w in caught:
+                warnings.warn_explicit(
+                    w.message, w.category, w.filename, w.lineno)
+            if record and caught:
+                return None
+            return commands
+        except KeyboardInterrupt:
+            raise
+        except:
+            self.err("Error loading: %s" % pathobj)
+            traceback.print_exc()
+
+    def _plugin_environment(self):
+        return dict((x, os.environ.get(x)) for x in PLUGIN_ENVIRONMENT)
+
+    def _manifest_file(self):
+        from omero.util import get_omero_user_cache_dir
+        return get_omero_user_cache_dir() / "cli" / "plugins.json"
+
+    def _read_manifest(self):
+        try:
+            with open(self._manifest_file(), "r") as f:
+                data = json.load(f)
+            if (data.get("version") == VERSION and
+                    data.get("environment") == self._plugin_environment()):
+                return data["plugins"]
+        except (IOError, OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def _write_manifest(self, manifest):
+        import tempfile
+        target = self._manifest_file()
+        try:
+            if not target.dirname().exists():
+                target.dirname().makedirs_p()
+            fd, tmp = tempfile.mkstemp(dir=target.dirname(), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": VERSION,
+                           "environment": self._plugin_environment(),
+                           "plugins": manifest}, f)
+            os.replace(tmp, target)
+        except (IOError, OSError) as e:
+            self.dbg("Failed to write plugin manifest: %s" % e)
 
     def get_event_context(self):
         return getattr(self, '_event_context', None)
@@ -1742,6 +1944,200 @@ def cli_login(*args, **kwargs):
         cli.close()
 
 
+CLI_SOCKET = "OMERO_CLI_SOCKET"
+LOGIN_OPTIONS = ("-C", "--create", "-s", "--server", "-p", "--port",
+                 "-g", "--group", "-u", "--user", "-w", "--password",
+                 "-k", "--key", "--sudo")
+
+
+class CLIServer(object):
+    """
+    Runs the commands forwarded by omero.main over a Unix socket so
+    that the loaded plugins as well as the communicator and session of
+    a single CLI stay warm between invocations. See "omero shell
+    --server" and OMERO_CLI_SOCKET.
+
+    Requests and replies are single lines of JSON:
+    {"argv": [...], "cwd": "...", "env": {...}} and
+    {"rc": 0, "out": "...", "err": "..."}. Commands are run one at
+    a time by the same CLI and cannot read from standard in.
+    """
+
+    MAX_REQUEST = 16 * 1024 * 1024
+
+    def __init__(self, cli, socket_path):
+        self.cli = cli
+        self.socket_path = str(socket_path)
+        self.stopped = False
+
+    def serve(self):
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+                self.cli.die(1, "CLI server already running on %s"
+                             % self.socket_path)
+            except socket.error:
+                os.remove(self.socket_path)  # Stale
+            finally:
+                probe.close()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(umask)
+        server.listen(16)
+        self.cli.err("Listening on %s" % self.socket_path)
+        self.cli.input = self.input
+        try:
+            while not self.stopped:
+                conn = server.accept()[0]
+                try:
+                    self.handle(conn)
+                except Exception:
+                    self.cli.dbg(traceback.format_exc())
+                finally:
+                    conn.close()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            del self.cli.input
+            server.close()
+            os.remove(self.socket_path)
+            self.drop_client()
+
+    def stop(self):
+        """
+        Stops serve() once the current command has completed.
+        """
+        self.stopped = True
+        wakeup = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            wakeup.connect(self.socket_path)
+        except socket.error:
+            pass
+        finally:
+            wakeup.close()
+
+    def input(self, prompt, hidden=False, required=False):
+        self.cli.die(1, "Input is not available through the CLI server. "
+                     "Unset %s to run this command." % CLI_SOCKET)
+
+    def handle(self, conn):
+        if hasattr(socket, "SO_PEERCRED"):
+            import struct
+            creds = conn.getsockopt(
+                socket.SOL_SOCKET, socket.SO_PEERCRED,
+                struct.calcsize("3i"))
+            if struct.unpack("3i", creds)[1] != os.getuid():
+                return
+        conn.settimeout(60)
+        chunks = []
+        size = 0
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            if chunk.endswith(b"\n") or size > self.MAX_REQUEST:
+                break
+        request = json.loads(b"".join(chunks).decode("utf-8"))
+        conn.settimeout(None)
+        reply = self.run(request["argv"], request.get("cwd"),
+                         request.get("env", {}))
+        conn.sendall((json.dumps(reply) + "\n").encode("utf-8"))
+
+    def run(self, argv, cwd=None, env=None):
+        """
+        Runs a single command with the given working directory and
+        OMERO* environment variables, returning its exit code and
+        output.
+
+        File descriptors 0, 1 and 2 of the server are redirected while
+        the command runs so that the output of subprocesses, e.g. the
+        Java importer, is returned as well. Standard in is /dev/null.
+        """
+        from io import FileIO, StringIO, TextIOWrapper
+        from tempfile import TemporaryFile
+        out = TemporaryFile()
+        err = TemporaryFile()
+        null = os.open(os.devnull, os.O_RDONLY)
+        saved = (sys.stdin, sys.stdout, sys.stderr)
+        for stream in saved[1:]:
+            stream.flush()
+        saved_fds = [os.dup(fd) for fd in (0, 1, 2)]
+        old_cwd = os.getcwd()
+        old_env = dict(os.environ)
+        try:
+            for key in list(os.environ):
+                if key.startswith("OMERO"):
+                    del os.environ[key]
+            os.environ.update(env or {})
+            if cwd:
+                os.chdir(cwd)
+            self.check_session(argv)
+            for fd, target in ((0, null), (1, out.fileno()),
+                               (2, err.fileno())):
+                os.dup2(target, fd)
+            # Sharing the descriptors keeps the output of the command
+            # and of its subprocesses in order
+            sys.stdin = StringIO()
+            sys.stdout, sys.stderr = [
+                TextIOWrapper(FileIO(fd, "w", closefd=False),
+                              encoding="utf-8", errors="replace",
+                              write_through=True)
+                for fd in (1, 2)]
+            self.cli.interrupt_loop = False
+            try:
+                self.cli.onecmd(argv)
+                rc = self.cli.rv or 0
+            except Exception:
+                sys.stderr.write(traceback.format_exc())
+                rc = 1
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                stream.flush()
+            sys.stdin, sys.stdout, sys.stderr = saved
+            for fd, target in zip((0, 1, 2), saved_fds):
+                os.dup2(target, fd)
+                os.close(target)
+            os.close(null)
+            os.chdir(old_cwd)
+            os.environ.clear()
+            os.environ.update(old_env)
+        rv = {"rc": rc}
+        for name, f in (("out", out), ("err", err)):
+            f.seek(0)
+            rv[name] = f.read().decode("utf-8", "replace")
+            f.close()
+        return rv
+
+    def check_session(self, argv):
+        """
+        Keeps the warm client only if no login options were passed
+        and its session is still the current one of the sessions store.
+        """
+        client = self.cli.get_client()
+        if client is None:
+            return
+        if not [a for a in argv if a.split("=")[0] in LOGIN_OPTIONS]:
+            try:
+                store = self.cli.controls["sessions"].store(None)
+                if store.get_current()[2] == client.getSessionId():
+                    return
+            except Exception:
+                self.cli.dbg(traceback.format_exc())
+        self.drop_client()
+
+    def drop_client(self):
+        self.cli.close()
+        self.cli.set_client(None)
+        self.cli.set_event_context(None)
+
+
 def argv(args=sys.argv):
     """
     Main entry point for the OMERO command-line interface. First
@@ -55,6 +55,9 @@ class AbstractColumn(object):
     Base logic for all columns
     """
 
+    # Whether the values are held as a numpy array. See marshal()
+    _numpy = False
+
     def __init__(self):
         # Note: don't rely on any properties such as self.name being set if
         # this has been called through Ice
@@ -119,6 +122,8 @@ class AbstractColumn(object):
         """
         if size is None:
             self.values = None
+        elif self._numpy:
+            self.values = numpy.zeros(size, dtype=self._types[0])
         else:
             self.values = [None for x in range(size)]
 
@@ -151,16 +156,30 @@ class AbstractColumn(object):
         # WORKAROUND:
         # http://www.zeroc.com/forums/bug-reports/4165-icepy-can-not-handle-buffers-longs-i64.html#post20468
         # see ticket:1951 and #2160
-        # d = self.recarrtypes[0][1]
-        # Disabled until Ice 3.4
-        # if isinstance(d, str):
-        #     d = numpy.dtype(d)
-        # if d.kind == "S" or (d.kind == "i" and d.itemsize == "8"):
-        self.values = self.values.tolist()
+        # Numeric columns keep the numpy array, see marshal()
+        if not self._numpy:
+            self.values = self.values.tolist()
+
+    def marshal(self):
+        """
+        Called by tables.py before returning the column over Ice.
+        Ice marshals sequences of primitive types straight from the buffer
+        of C-contiguous numpy arrays, so values of the column's type are
+        passed on as they are. Values of another type or byte order are
+        converted to lists.
+        """
+        if self._numpy and isinstance(self.values, numpy.ndarray):
+            if self.values.dtype == numpy.dtype(self._types[0]):
+                self.values = numpy.ascontiguousarray(self.values)
+            else:
+                self.values = self.values.tolist()
+        return self
 
 
 class FileColumnI(AbstractColumn, omero.grid.FileColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.FileColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -171,6 +190,8 @@ class FileColumnI(AbstractColumn, omero.grid.FileColumn):
 
 class ImageColumnI(AbstractColumn, omero.grid.ImageColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.ImageColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -181,6 +202,8 @@ class ImageColumnI(AbstractColumn, omero.grid.ImageColumn):
 
 class WellColumnI(AbstractColumn, omero.grid.WellColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.WellColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -191,6 +214,8 @@ class WellColumnI(AbstractColumn, omero.grid.WellColumn):
 
 class PlateColumnI(AbstractColumn, omero.grid.PlateColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.PlateColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -200,6 +225,8 @@ class PlateColumnI(AbstractColumn, omero.grid.PlateColumn):
 
 class DatasetColumnI(AbstractColumn, omero.grid.DatasetColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.DatasetColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -210,6 +237,8 @@ class DatasetColumnI(AbstractColumn, omero.grid.DatasetColumn):
 
 class RoiColumnI(AbstractColumn, omero.grid.RoiColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.RoiColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -220,6 +249,8 @@ class RoiColumnI(AbstractColumn, omero.grid.RoiColumn):
 
 class BoolColumnI(AbstractColumn, omero.grid.BoolColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.BoolColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -230,6 +261,8 @@ class BoolColumnI(AbstractColumn, omero.grid.BoolColumn):
 
 class DoubleColumnI(AbstractColumn, omero.grid.DoubleColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.DoubleColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -240,6 +273,8 @@ class DoubleColumnI(AbstractColumn, omero.grid.DoubleColumn):
 
 class LongColumnI(AbstractColumn, omero.grid.LongColumn):
 
+    _numpy = True
+
     def __init__(self, name="Unknown", *args):
         omero.grid.LongColumn.__init__(self, name, *args)
         AbstractColumn.__init__(self)
@@ -286,6 +321,17 @@ class StringColumnI(AbstractColumn, omero.grid.StringColumn):
         Check for strings longer than the initialised column width
         This will always return bytes
         """
+        if isinstance(self.values, numpy.ndarray):
+            bytevalues = self.values
+            if bytevalues.dtype.kind == "U":
+                bytevalues = numpy.char.encode(bytevalues, "utf-8")
+            if (len(bytevalues) and bytevalues.dtype.itemsize > self.size and
+                    numpy.char.str_len(bytevalues).max() > self.size):
+                raise omero.ValidationException(
+                    None, None,
+                    "Maximum string (byte) length in column %s is %d" %
+                    (self.name, self.size))
+            return [bytevalues]
         if python_sys.version_info >= (3, 0, 0):
             bytevalues = [v.encode() for v in self.values]
         else:
@@ -329,9 +375,17 @@ class AbstractArrayColumn(AbstractColumn):
     Additional base logic for array columns
     """
 
+    _numpy = True
+
     def __init__(self):
         AbstractColumn.__init__(self)
 
+    def setsize(self, size):
+        if size is None:
+            self.values = None
+        else:
+            self.values = numpy.zeros((size, self.size), dtype=self._types[0])
+
     def settable(self, tbl):
         AbstractColumn.settable(self, tbl)
 
@@ -358,6 +412,15 @@ class AbstractArrayColumn(AbstractColumn):
         column-to-row conversion in HdfStorage.append() will fail.
         This is messy, but I can't think of a better way.
         """
+        if isinstance(self.values, numpy.ndarray):
+            if self.values.ndim != 2 or self.values.shape[1] != self.size:
+                raise omero.ValidationException(
+                    None, None, "Column %s requires arrays of length %d" %
+                    (self.name, self.size))
+            if self.size == 1:
+                return [self.values[:, 0]]
+            return [self.values]
+
         for v in self.values:
             if len(v) != self.size:
                 raise omero.ValidationException(
@@ -492,15 +555,17 @@ class MaskColumnI(AbstractColumn, omero.grid.MaskColumn):
             self.y = None
             self.w = None
             self.h = None
+            self.bytes = None
         else:
-            dts = self.dtypes()
-            self.imageId = numpy.zeroes(size, dtype=dts[0])
-            self.theZ = numpy.zeroes(size, dtype=dts[1])
-            self.theT = numpy.zeroes(size, dtype=dts[2])
-            self.x = numpy.zeroes(size, dtype=dts[3])
-            self.y = numpy.zeroes(size, dtype=dts[4])
-            self.w = numpy.zeroes(size, dtype=dts[5])
-            self.h = numpy.zeroes(size, dtype=dts[6])
+            dts = [t for n, t in self.dtypes()]
+            self.imageId = numpy.zeros(size, dtype=dts[0])
+            self.theZ = numpy.zeros(size, dtype=dts[1])
+            self.theT = numpy.zeros(size, dtype=dts[2])
+            self.x = numpy.zeros(size, dtype=dts[3])
+            self.y = numpy.zeros(size, dtype=dts[4])
+            self.w = numpy.zeros(size, dtype=dts[5])
+            self.h = numpy.zeros(size, dtype=dts[6])
+            self.bytes = [b""] * size
 
     def readCoordinates(self, tbl, rowNumbers):
         self.__sanitycheck()
@@ -516,13 +581,24 @@ class MaskColumnI(AbstractColumn, omero.grid.MaskColumn):
         # calls fromrows
         AbstractColumn.read(self, tbl, start, stop)
         masks = self._getmasks(tbl)
-        rowNumbers = list(range(start, stop))
-        self.getbytes(masks, rowNumbers)
+        if stop is None:
+            stop = masks.nrows
+        self.bytes = [m.tobytes() for m in masks.read(start, stop)]
 
     def getbytes(self, masks, rowNumbers):
+        """
+        Reads the masks of the given rows as bytes. Each run of
+        consecutive row numbers is read from the VLArray in one call.
+        """
+        rows = numpy.asarray(rowNumbers, dtype=numpy.int64)
         self.bytes = []
-        for idx in rowNumbers:
-            self.bytes.append(masks[idx].tolist())
+        if not len(rows):
+            return
+        breaks = numpy.flatnonzero(numpy.diff(rows) != 1) + 1
+        for run in numpy.split(rows, breaks):
+            start = int(run[0])
+            self.bytes.extend(
+                m.tobytes() for m in masks.read(start, start + len(run)))
 
     def fromrows(self, rows, field_only=False):
 
@@ -542,13 +618,14 @@ class MaskColumnI(AbstractColumn, omero.grid.MaskColumn):
     def append(self, tbl):
         self.__sanitycheck()
         masks = self._getmasks(tbl)
+        # VLArray rows can only be appended one at a time, but the
+        # bytes are wrapped without copying
         for x in self.bytes:
             if isinstance(x, list):
                 # This occurs primarily in testing.
-                masks.append(numpy.array(x, dtype=tables.UInt8Atom()))
+                masks.append(numpy.array(x, dtype=numpy.uint8))
             else:
-                masks.append(numpy.fromstring(x, count=len(x),
-                                              dtype=tables.UInt8Atom()))
+                masks.append(numpy.frombuffer(x, dtype=numpy.uint8))
 
     def _getmasks(self, tbl):
         n = tbl._v_name
@@ -44,6 +44,33 @@ class Conversion(object):
     def __call__(self, original):
         raise NotImplemented()
 
+    def linear(self):
+        """
+        Returns the (scale, offset) pair for which this conversion
+        equals scale * x + offset. The tree of Conversion instances
+        is only evaluated the first time.
+        """
+        try:
+            return self._compiled
+        except AttributeError:
+            self._compiled = self._linear()
+            return self._compiled
+
+    def _linear(self):
+        # Constants by default, the original value is ignored
+        return (0.0, self(None))
+
+    def convert(self, values):
+        """
+        Applies the precompiled scale and offset to a number or to
+        a whole numpy array at once.
+        """
+        scale, offset = self.linear()
+        rv = values * scale
+        if offset:
+            rv = rv + offset
+        return rv
+
     def join(self, sym):
         sb = sym.join([str(x) for x in self.conversions])
         return "(%s)" % sb
@@ -61,6 +88,14 @@ class Add(Conversion):
             rv += c(original)
         return rv
 
+    def _linear(self):
+        scale, offset = 0.0, 0.0
+        for c in self.conversions:
+            a, b = c.linear()
+            scale += a
+            offset += b
+        return (scale, offset)
+
     def __str__(self):
         return self.join(" + ")
 
@@ -96,6 +131,15 @@ class Mul(Conversion):
             rv *= c(original)
         return rv
 
+    def _linear(self):
+        scale, offset = 0.0, 1.0
+        for c in self.conversions:
+            a, b = c.linear()
+            if scale and a:
+                raise ValueError("Not a linear conversion: %s" % self)
+            scale, offset = scale * b + a * offset, offset * b
+        return (scale, offset)
+
     def __str__(self):
         return self.join(" * ")
 
@@ -138,6 +182,16 @@ class Rat(Conversion):
         d = self.unwrap(self.d, original)
         return old_div(float(n), d)
 
+    def _linear(self):
+        if isinstance(self.n, Conversion):
+            a, b = self.n.linear()
+        else:
+            a, b = 0.0, float(self.n)
+        if isinstance(self.d, Conversion) and self.d.linear()[0]:
+            raise ValueError("Not a linear conversion: %s" % self)
+        d = self.unwrap(self.d, None)
+        return (old_div(float(a), d), old_div(float(b), d))
+
     def __str__(self):
         return "(%s / %s)" % (self.n, self.d)
 
@@ -155,5 +209,75 @@ class Sym(Conversion):
     def __call__(self, original):
         return float(original)
 
+    def _linear(self):
+        return (1.0, 0.0)
+
     def __str__(self):
         return "x"
+
+
+class ConversionTable(object):
+    """
+    Replacement for the nested CONVERSIONS dictionaries of the unit
+    classes, supporting both table[source][target] and
+    table.get(source).get(target). The factories for each pair of
+    unit names are only called, and the resulting Conversion kept,
+    the first time that pair is looked up so that importing the
+    unit classes does not build thousands of unused conversions.
+    """
+
+    def __init__(self, units, factories):
+        self.units = units
+        self.factories = factories
+        self._rows = None
+
+    def _load(self):
+        rows = dict((str(u), ConversionRow()) for u in self.units)
+        for (source, target), factory in self.factories.items():
+            rows[source].factories[target] = factory
+        self._rows = rows
+        return rows
+
+    def get(self, source, default=None):
+        rows = self._rows
+        if rows is None:
+            rows = self._load()
+        return rows.get(str(source), default)
+
+    def __getitem__(self, source):
+        rv = self.get(source)
+        if rv is None:
+            raise KeyError(source)
+        return rv
+
+    def __contains__(self, source):
+        return self.get(source) is not None
+
+
+class ConversionRow(object):
+    """
+    Conversions from a single source unit in a ConversionTable
+    """
+
+    def __init__(self):
+        self.factories = dict()
+        self.conversions = dict()
+
+    def get(self, target, default=None):
+        name = str(target)
+        try:
+            return self.conversions[name]
+        except KeyError:
+            factory = self.factories.get(name)
+            if factory is None:
+                return default
+            return self.conversions.setdefault(name, factory())
+
+    def __getitem__(self, target):
+        rv = self.get(target)
+        if rv is None:
+            raise KeyError(target)
+        return rv
+
+    def __contains__(self, target):
+        return str(target) in self.factories
@@ -25,10 +25,12 @@ from builtins import range
 from past.builtins import basestring
 from past.utils import old_div
 from builtins import object
+import copy
 import os
 
+import threading
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
 
 try:
     from types import IntType, LongType, UnicodeType, ListType
@@ -60,6 +62,7 @@ from omero.cmd import Chgrp2, Delete2, DoAll, SkipHead, Chown2
 from omero.cmd.graphs import ChildOption
 from omero.api import Save
 from omero.gateway.utils import ServiceOptsDict, GatewayConfig, toBoolean
+from omero.gateway.utils import GatewayCache
 from omero.model.enums import PixelsTypeint8, PixelsTypeuint8, PixelsTypeint16
 from omero.model.enums import PixelsTypeuint16, PixelsTypeint32
 from omero.model.enums import PixelsTypeuint32, PixelsTypefloat
@@ -227,6 +230,16 @@ def add_plate_filter(clauses, params, opts):
         params.add('pid', rlong(opts['plate']))
 
 
+def chunk_ids(ids, size=1000):
+    """
+    Splits a sequence of ids into lists of at most size ids, keeping
+    the 'id in (:ids)' clauses of set-based queries to a sane length.
+    """
+    ids = list(ids)
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
 class OmeroRestrictionWrapper (object):
 
     def canDownload(self):
@@ -279,6 +292,8 @@ class BlitzObjectWrapper (object):
         self._cache = cache
         if self._cache is None:
             self._cache = {}
+        # Relations loaded in bulk by BlitzGateway.prefetch()
+        self._prefetched = {}
         self._conn = conn
         self._creationDate = None
         if conn is None:
@@ -541,6 +556,7 @@ class BlitzObjectWrapper (object):
             ctx.setOmeroGroup(self.getDetails().getGroup().getId())
         self._obj = self._conn.getUpdateService().saveAndReturnObject(
             self._obj, ctx)
+        self._conn.invalidateCache()
 
     def saveAs(self, details):
         """
@@ -722,6 +738,9 @@ class BlitzObjectWrapper (object):
         :rtype:     Long
         """
 
+        if "counts" in self._prefetched:
+            self._cached_countChildren = self._prefetched["counts"]
+            return self._cached_countChildren
         childw = self._getChildWrapper()
         klass = "%sLinks" % childw().OMERO_CLASS.lower()
         # self._cached_countChildren = len(
@@ -823,6 +842,11 @@ class BlitzObjectWrapper (object):
         """
         if self.PARENT_WRAPPER_CLASS is None:
             return ()
+        if "parents" in self._prefetched:
+            if withlinks:
+                return [(p, BlitzObjectWrapper(self._conn, x))
+                        for p, x in self._prefetched["parents"]]
+            return [p for p, x in self._prefetched["parents"]]
         parentw = self._getParentWrappers()
         param = omero.sys.Parameters()  # TODO: What can I use this for?
         parentnodes = []
@@ -1518,6 +1542,11 @@ class _BlitzGateway (object):
     """
     ICE_CONFIG - Defines the path to the Ice configuration
     """
+    _lookup_cache = None
+    """
+    :class:`omero.gateway.utils.GatewayCache` set by :meth:`enableCache`
+    """
+    _aio = None
 # def __init__ (self, username, passwd, server, port, client_obj=None,
 # group=None, clone=False):
 
@@ -1627,6 +1656,19 @@ class _BlitzGateway (object):
         """
         self.close()
 
+    @property
+    def aio(self):
+        """
+        asyncio facade of this connection, e.g.
+        image = await conn.aio.getObject("Image", 1)
+
+        :rtype:     :class:`omero.gateway.aio.AsyncBlitzGateway`
+        """
+        if self._aio is None:
+            from omero.gateway.aio import AsyncBlitzGateway
+            self._aio = AsyncBlitzGateway(self)
+        return self._aio
+
     def _register_service(self, service_string, stack):
         """
         Register the results of traceback.extract_stack() at the time
@@ -1970,6 +2012,8 @@ class _BlitzGateway (object):
         :param hard: If True, use killSession(), otherwise closeSession()
         """
         self._connected = False
+        if self._aio is not None:
+            self._aio.close()
         oldC = self.c
         for proxy in list(self._proxies.values()):
             proxy.close()
@@ -2307,6 +2351,63 @@ class _BlitzGateway (object):
     ########################
     # # Connection Stuff # #
 
+    def enableCache(self, maxsize=1000, ttl=300, cache=None):
+        """
+        Caches the results of lookups which rarely change: enumerations,
+        pixels types, experimenters and groups loaded by id with
+        :meth:`getObject`, the current group and the event context.
+        The cache is cleared by :meth:`deleteObjects`,
+        :meth:`chgrpObjects`, :meth:`BlitzObjectWrapper.save` and the other
+        updates made through this connection, otherwise entries expire
+        after ttl seconds.
+
+        :param maxsize: Maximum number of cached lookups
+        :param ttl:     Seconds after which a lookup is repeated
+        :param cache:   An existing :class:`omero.gateway.utils.GatewayCache`
+                        to use instead, e.g. to share it between the
+                        connections of a web application
+        :return:        The cache
+        :rtype:         :class:`omero.gateway.utils.GatewayCache`
+        """
+        if cache is None:
+            cache = GatewayCache(maxsize=maxsize, ttl=ttl)
+        self._lookup_cache = cache
+        return cache
+
+    def disableCache(self):
+        """
+        Stops caching lookups, see :meth:`enableCache`
+        """
+        self._lookup_cache = None
+
+    def invalidateCache(self):
+        """
+        Removes all the cached lookups, see :meth:`enableCache`
+        """
+        if self._lookup_cache is not None:
+            self._lookup_cache.invalidate()
+
+    def getCacheStats(self):
+        """
+        Returns the hits, misses and size of the cache or None if
+        caching is not enabled, see :meth:`enableCache`
+
+        :rtype:     Dict
+        """
+        if self._lookup_cache is None:
+            return None
+        return self._lookup_cache.getStats()
+
+    def _cached(self, key, loader):
+        """
+        Returns loader(), cached under key if caching is enabled. Each
+        caller gets its own copy of the cached object so that changes
+        made to it are not seen by other callers.
+        """
+        if self._lookup_cache is None:
+            return loader()
+        return copy.deepcopy(self._lookup_cache.get(key, loader))
+
     def getEventContext(self):
         """
         Returns omero_System_ice.EventContext.
@@ -2320,7 +2421,9 @@ class _BlitzGateway (object):
         :rtype:     :class:`omero.sys.EventContext`
         """
         if self._ctx is None:
-            self._ctx = self._proxies['admin'].getEventContext()
+            self._ctx = self._cached(
+                ("EventContext", self._sessionUuid),
+                self._proxies['admin'].getEventContext)
         return self._ctx
 
     def getUserId(self):
@@ -2377,7 +2480,10 @@ class _BlitzGateway (object):
         :return:    omero.model.ExperimenterGroupI
         """
         admin_service = self.getAdminService()
-        group = admin_service.getGroup(self.getEventContext().groupId)
+        gid = self.getEventContext().groupId
+        group = self._cached(
+            ("Group", self._sessionUuid, gid),
+            lambda: admin_service.getGroup(gid))
         return ExperimenterGroupWrapper(self, group)
 
     def getCurrentAdminPrivileges(self):
@@ -2424,6 +2530,7 @@ class _BlitzGateway (object):
             to_set.append(privilege)
 
         admin.setAdminPrivileges(exp, to_set)
+        self.invalidateCache()
 
     def isAdmin(self):
         """
@@ -2534,6 +2641,7 @@ class _BlitzGateway (object):
             return False
         self._lastGroupId = self._ctx.groupId
         self._ctx = None
+        self.invalidateCache()
         for s in self.c.getStatefulServices():
             s.close()
         self.c.sf.setSecurityContext(
@@ -2985,6 +3093,7 @@ class _BlitzGateway (object):
         group.ldap = rbool(ldap)
 
         gr_id = admin_serv.createGroup(group)
+        self.invalidateCache()
 
         if owner_Ids is not None:
             group_owners = [
@@ -3247,6 +3356,9 @@ class _BlitzGateway (object):
     ###########################
     # Specific Object Getters #
 
+    # Types which getObject() looks up by id through the cache, if enabled
+    CACHED_OBJECT_TYPES = ("experimenter", "experimentergroup")
+
     def getObject(self, obj_type, oid=None, params=None, attributes=None,
                   opts=None):
         """
@@ -3266,15 +3378,29 @@ class _BlitzGateway (object):
         :return:
         """
         oids = (oid is not None) and [oid] or None
+        key = None
+        if (self._lookup_cache is not None and oid is not None and
+                params is None and attributes is None and
+                obj_type.lower() in self.CACHED_OBJECT_TYPES):
+            key = ("Object", self._sessionUuid,
+                   self.SERVICE_OPTS.getOmeroGroup(), obj_type.lower(),
+                   unwrap(oid), repr(sorted((opts or {}).items())))
         query, params, wrapper = self.buildQuery(
             obj_type, oids, params, attributes, opts)
-        result = self.getQueryService().findByQuery(
-            query, params, self.SERVICE_OPTS)
+
+        def load():
+            return self.getQueryService().findByQuery(
+                query, params, self.SERVICE_OPTS)
+        if key is not None:
+            result = self._cached(key, load)
+        else:
+            result = load()
         if result is not None:
             return wrapper(self, result)
 
     def getObjects(self, obj_type, ids=None, params=None, attributes=None,
-                   respect_order=False, opts=None):
+                   respect_order=False, opts=None, load=None,
+                   page_size=None):
         """
         Retrieve Objects by type E.g. "Image"
         Returns generator of appropriate :class:`BlitzObjectWrapper` type.
@@ -3298,8 +3424,22 @@ class _BlitzGateway (object):
                             offset, limit and owner for all objects.
                             Additional opts handled by _getQueryString()
                             e.g. filter Dataset by 'project'
+        :param load:        List of relations to load for all the returned
+                            objects at once, see :meth:`prefetch`
+        :param page_size:   If set, objects are loaded lazily, ordered by id,
+                            page_size objects at a time rather than all in
+                            one query, and ids are queried in chunks of
+                            page_size. Cannot be combined with an offset or
+                            'order_by'. Use opts={'last_id': id} to resume
+                            after the object with that id.
         :return:            Generator of :class:`BlitzObjectWrapper` subclasses
         """
+        if page_size is not None:
+            for w in self._streamObjects(obj_type, ids, params, attributes,
+                                         respect_order, opts, load,
+                                         page_size):
+                yield w
+            return
         query, params, wrapper = self.buildQuery(
             obj_type, ids, params, attributes, opts)
         qs = self.getQueryService()
@@ -3310,9 +3450,220 @@ class _BlitzGateway (object):
                 idMap[r.id.val] = r
             ids = unwrap(ids)       # in case we had a list of rlongs
             result = [idMap.get(i) for i in ids if i in idMap]
+        if load:
+            for w in self._wrapPage(wrapper, result, load):
+                yield w
+            return
         for r in result:
             yield wrapper(self, r)
 
+    def _streamObjects(self, obj_type, ids, params, attributes,
+                       respect_order, opts, load, page_size):
+        """
+        getObjects() using keyset pagination: the ids of each page are
+        selected with 'obj.id > :last order by obj.id' so that neither the
+        client nor the server needs to hold more than page_size objects,
+        whatever the size of the whole result.
+
+        The objects of a page are then loaded by id. Limiting the query
+        which fetches them would not work for the types fetching
+        collections, e.g. Wells and their WellSamples, since the limit
+        would then be applied to the joined rows in memory.
+        """
+        opts = dict(opts or {})
+        if 'order_by' in opts:
+            raise ValueError("page_size cannot be used with order_by")
+        first_id = opts.get('last_id', -1)
+        fetch_opts = dict((k, v) for k, v in opts.items()
+                          if k not in ('limit', 'offset', 'last_id'))
+        qs = self.getQueryService()
+        limit = None
+        count = 0
+        if ids is None:
+            chunks = [None]
+        else:
+            chunks = chunk_ids(unwrap(ids), page_size)
+        for chunk in chunks:
+            opts['last_id'] = first_id
+            rows = []
+            while limit is None or limit < 0 or count < limit:
+                query, p, wrapper = self.buildQuery(
+                    obj_type, chunk, params, attributes, opts)
+                if limit is None:
+                    if p.theFilter is not None and p.theFilter.limit:
+                        if p.theFilter.offset and p.theFilter.offset.val:
+                            raise ValueError(
+                                "page_size cannot be used with an offset")
+                        limit = p.theFilter.limit.val
+                    else:
+                        limit = -1
+                size = page_size
+                if limit >= 0:
+                    size = min(size, limit - count)
+                p.page(0, size)
+                # As in buildCountQuery(), without loading anything
+                query = query.replace("select obj ", "select distinct obj.id ")
+                query = query.replace("fetch", "")
+                page = [x[0].val for x in qs.projection(
+                    query, p, self.SERVICE_OPTS)]
+                result = []
+                if page:
+                    query, p, wrapper = self.buildQuery(
+                        obj_type, page, None, None, fetch_opts)
+                    result = qs.findAllByQuery(query, p, self.SERVICE_OPTS)
+                    result.sort(key=lambda x: x.id.val)
+                count += len(page)
+                if respect_order and chunk is not None:
+                    rows.extend(result)
+                else:
+                    for w in self._wrapPage(wrapper, result, load):
+                        yield w
+                if len(page) < size or (
+                        chunk is not None and page[-1] == max(chunk)):
+                    break
+                opts['last_id'] = page[-1]
+            if rows:
+                idMap = dict((r.id.val, r) for r in rows)
+                rows = [idMap[i] for i in chunk if i in idMap]
+                for w in self._wrapPage(wrapper, rows, load):
+                    yield w
+            if 0 <= limit <= count:
+                break
+
+    def _wrapPage(self, wrapper, result, load):
+        wrappers = [wrapper(self, r) for r in result]
+        if load:
+            self.prefetch(wrappers, *load)
+        return wrappers
+
+    PREFETCH_RELATIONS = ("parents", "annotations", "counts", "owner")
+
+    def prefetch(self, wrappers, *relations):
+        """
+        Loads the given relations for a whole list of wrappers with a
+        few set-based queries, rather than the one query per object
+        issued by the accessors, which then use the loaded values:
+
+            - "parents": :meth:`BlitzObjectWrapper.listParents` and
+              :meth:`BlitzObjectWrapper.getParent`
+            - "annotations": :meth:`BlitzObjectWrapper.listAnnotations`
+              and the other methods using the annotation links
+            - "counts": :meth:`BlitzObjectWrapper.countChildren`
+            - "owner": :meth:`BlitzObjectWrapper.getOwner`
+
+        Loaded parents and counts are not refreshed if the hierarchy
+        later changes. Wrappers of classes which override the accessor
+        are skipped and keep querying on their own.
+
+        :param wrappers:    Iterable of :class:`BlitzObjectWrapper`
+        :param relations:   Names of the relations to load, see above
+        :return:            List of the wrappers
+        """
+        for relation in relations:
+            if relation not in self.PREFETCH_RELATIONS:
+                raise ValueError("Unknown relation: %s. Expected one of %s"
+                                 % (relation,
+                                    ", ".join(self.PREFETCH_RELATIONS)))
+        wrappers = list(wrappers)
+        loaded = [w for w in wrappers if w._obj is not None and
+                  w._obj.isLoaded() and w._obj.id is not None]
+        for relation in relations:
+            getattr(self, "_prefetch_%s" % relation)(loaded)
+        return wrappers
+
+    def _prefetchQuery(self, query, ids, ctx=None):
+        """
+        Runs query for chunks of ids, bound as :ids, returning all results
+        """
+        qs = self.getQueryService()
+        rv = []
+        for chunk in chunk_ids(ids):
+            params = omero.sys.ParametersI()
+            params.addIds(chunk)
+            rv.extend(qs.findAllByQuery(
+                query, params, ctx or self.SERVICE_OPTS))
+        return rv
+
+    def _prefetch_parents(self, wrappers):
+        byclass = defaultdict(list)
+        for w in wrappers:
+            if (w.PARENT_WRAPPER_CLASS is not None and
+                    type(w).listParents is BlitzObjectWrapper.listParents):
+                byclass[type(w)].append(w)
+        for klass, ws in byclass.items():
+            parents = defaultdict(list)
+            for pwc in ws[0]._getParentWrappers():
+                pwck = pwc()
+                query = "select c from %s as c" % pwck.LINK_CLASS
+                if (type(pwck).LINK_PARENT is
+                        BlitzObjectWrapper.LINK_PARENT):
+                    query += " join fetch c.parent"
+                query += " where c.%s.id in (:ids)" % pwck.LINK_CHILD
+                for x in self._prefetchQuery(query, [w._oid for w in ws]):
+                    child = getattr(x, pwck.LINK_CHILD)
+                    parents[child.id.val].append((pwc, pwck, x))
+            for w in ws:
+                w._prefetched["parents"] = [
+                    (pwc(self, pwck.LINK_PARENT(x), w._cache), x)
+                    for pwc, pwck, x in parents[w._oid]]
+
+    def _prefetch_annotations(self, wrappers):
+        bygroup = defaultdict(list)
+        for w in wrappers:
+            if (hasattr(w._obj, 'isAnnotationLinksLoaded') and
+                    not w._obj.isAnnotationLinksLoaded()):
+                key = (w.OMERO_CLASS, w._obj.details.group.id.val)
+                bygroup[key].append(w)
+        query = ("select l from %sAnnotationLink as l join "
+                 "fetch l.details.owner join "
+                 "fetch l.details.creationEvent "
+                 "join fetch l.child as a join fetch a.details.owner "
+                 "left outer join fetch a.file "
+                 "join fetch a.details.creationEvent "
+                 "where l.parent.id in (:ids)")
+        for (klass, gid), ws in bygroup.items():
+            # Same group context as BlitzObjectWrapper._loadAnnotationLinks
+            ctx = self.SERVICE_OPTS.copy()
+            ctx.setOmeroGroup(gid)
+            links = defaultdict(list)
+            for link in self._prefetchQuery(
+                    query % klass, [w._oid for w in ws], ctx):
+                links[link.parent.id.val].append(link)
+            for w in ws:
+                w._obj._annotationLinksLoaded = True
+                w._obj._annotationLinksSeq = links[w._oid]
+
+    def _prefetch_counts(self, wrappers):
+        byclass = defaultdict(list)
+        for w in wrappers:
+            if (w.CHILD_WRAPPER_CLASS is not None and
+                    type(w).countChildren is BlitzObjectWrapper.countChildren):
+                byclass[type(w)].append(w)
+        cs = self.getContainerService()
+        for klass, ws in byclass.items():
+            childw = ws[0]._getChildWrapper()
+            links = "%sLinks" % childw().OMERO_CLASS.lower()
+            counts = {}
+            for chunk in chunk_ids([w._oid for w in ws]):
+                counts.update(cs.getCollectionCount(
+                    ws[0].OMERO_CLASS, links, chunk, None, self.SERVICE_OPTS))
+            for w in ws:
+                w._prefetched["counts"] = counts.get(w._oid, 0)
+
+    def _prefetch_owner(self, wrappers):
+        owners = defaultdict(list)
+        for w in wrappers:
+            owner = w._obj.details.owner
+            if owner is not None and not owner.isLoaded():
+                owners[owner.id.val].append(w)
+        if not owners:
+            return
+        for e in self._prefetchQuery(
+                "select e from Experimenter e where e.id in (:ids)",
+                list(owners)):
+            for w in owners[e.id.val]:
+                w._obj.details.owner = e
+
     def buildQuery(self, obj_type, ids=None, params=None, attributes=None,
                    opts=None):
         """
@@ -3334,6 +3685,8 @@ class _BlitzGateway (object):
                             defining extra data to load.
                             offset, limit and owner for all objects.
                             Also 'order_by': 'obj.name' to order results.
+                            'last_id' restricts results to ids greater
+                            than last_id, ordered by id.
                             Additional opts handled by _getQueryString()
                             e.g. filter Dataset by 'project'
         :return:            (query, params, wrapper)
@@ -3354,6 +3707,7 @@ class _BlitzGateway (object):
         order_by = None
         offset = None
         limit = None
+        last_id = None
 
         # We get the query from the ObjectWrapper class:
         if wrapper.__name__ == "_wrap":
@@ -3374,6 +3728,8 @@ class _BlitzGateway (object):
                 owner = rlong(opts['owner'])
             if 'order_by' in opts:
                 order_by = opts['order_by']
+            if 'last_id' in opts:
+                last_id = opts['last_id']
         # Handle additional Parameters - need to retrieve owner filter
         if params is not None and params.theFilter is not None:
             if params.theFilter.ownerId is not None:
@@ -3396,6 +3752,11 @@ class _BlitzGateway (object):
             clauses.append("obj.id in (:ids)")
             baseParams.map["ids"] = rlist([rlong(a) for a in ids])
 
+        # keyset pagination, see getObjects(page_size=...)
+        if last_id is not None:
+            clauses.append("obj.id > :last")
+            baseParams.map["last"] = rlong(last_id)
+
         # support filtering by owner (not for some object types)
         if (owner is not None and
                 obj_type.lower() not in
@@ -3427,6 +3788,8 @@ class _BlitzGateway (object):
         # Order by... e.g. 'lower(obj.name)' or 'obj.column, obj.row' for wells
         if order_by is not None:
             query += " order by %s, obj.id" % order_by
+        elif last_id is not None:
+            query += " order by obj.id"
 
         return (query, baseParams, wrapper)
 
@@ -3825,8 +4188,11 @@ class _BlitzGateway (object):
                 else:
                     pType = pTypes[dType]
                 # omero::model::PixelsType
-                pixelsType = queryService.findByQuery(
-                    "from PixelsType as p where p.value='%s'" % pType, None)
+                pixelsType = self._cached(
+                    ("PixelsType", pType),
+                    lambda: queryService.findByQuery(
+                        "from PixelsType as p where p.value='%s'" % pType,
+                        None))
                 if pixelsType is None:
                     raise Exception(
                         "Cannot create an image in omero from numpy array "
@@ -4260,7 +4626,10 @@ class _BlitzGateway (object):
         """
 
         types = self.getTypesService()
-        for e in types.allEnumerations(str(klass)):
+        entries = self._cached(
+            ("EnumerationEntries", str(klass)),
+            lambda: types.allEnumerations(str(klass)))
+        for e in entries:
             yield EnumerationWrapper(self, e)
 
     def getEnumeration(self, klass, string):
@@ -4276,7 +4645,9 @@ class _BlitzGateway (object):
         """
 
         types = self.getTypesService()
-        obj = types.getEnumeration(str(klass), str(string))
+        obj = self._cached(
+            ("Enumeration", str(klass), str(string)),
+            lambda: types.getEnumeration(str(klass), str(string)))
         if obj is not None:
             return EnumerationWrapper(self, obj)
         else:
@@ -4295,7 +4666,9 @@ class _BlitzGateway (object):
         """
 
         query_serv = self.getQueryService()
-        obj = query_serv.find(klass, int(eid), self.SERVICE_OPTS)
+        obj = self._cached(
+            ("EnumerationById", str(klass), int(eid)),
+            lambda: query_serv.find(klass, int(eid), self.SERVICE_OPTS))
         if obj is not None:
             return EnumerationWrapper(self, obj)
         else:
@@ -4356,6 +4729,7 @@ class _BlitzGateway (object):
 
         types = self.getTypesService()
         types.deleteEnumeration(obj)
+        self.invalidateCache()
 
     def createEnumeration(self, obj):
         """
@@ -4367,6 +4741,7 @@ class _BlitzGateway (object):
 
         types = self.getTypesService()
         types.createEnumeration(obj)
+        self.invalidateCache()
 
     def resetEnumerations(self, klass):
         """
@@ -4378,6 +4753,7 @@ class _BlitzGateway (object):
 
         types = self.getTypesService()
         types.resetEnumerations(klass)
+        self.invalidateCache()
 
     def updateEnumerations(self, new_entries):
         """
@@ -4389,6 +4765,7 @@ class _BlitzGateway (object):
 
         types = self.getTypesService()
         types.updateEnumerations(new_entries)
+        self.invalidateCache()
 
     ###################
     # Delete          #
@@ -4506,11 +4883,13 @@ class _BlitzGateway (object):
         logger.debug('Delete2: \n%s' % str(delete))
 
         handle = self.c.sf.submit(delete, self.SERVICE_OPTS)
+        self.invalidateCache()
         if wait:
             try:
                 self._waitOnCmd(handle)
             finally:
                 handle.close()
+                self.invalidateCache()
 
         return handle
 
@@ -4536,6 +4915,7 @@ class _BlitzGateway (object):
             targetObjects={'ExperimenterGroup': [group_Id]},
             permissions=permissions)
         prx = self.c.sf.submit(chmod)
+        self.invalidateCache()
         return prx
 
     def chgrpObjects(self, graph_spec, obj_ids, group_id, container_id=None):
@@ -4614,6 +4994,7 @@ class _BlitzGateway (object):
         # NB: For Save to work, we need to be in target group
         ctx.setOmeroGroup(group_id)
         prx = self.c.sf.submit(da, ctx)
+        self.invalidateCache()
         return prx
 
     def chownObjects(self, graph_spec, obj_ids, owner_id, wait=False):
@@ -4651,11 +5032,13 @@ class _BlitzGateway (object):
                      (graph_spec, obj_ids, owner_id))
 
         handle = self.c.sf.submit(da, self.SERVICE_OPTS)
+        self.invalidateCache()
         if wait:
             try:
                 cb = self._waitOnCmd(handle)
             finally:
                 cb.close(True)
+                self.invalidateCache()
         return handle
 
     ###################
@@ -7414,6 +7797,9 @@ class _PixelsWrapper (BlitzObjectWrapper):
 
     OMERO_CLASS = 'Pixels'
 
+    # Upper bound on the pixel bytes read by one call in getHyperstack()
+    HYPERSTACK_MAX_BYTES = 64 * 1024 * 1024
+
     def _prepareRawPixelsStore(self):
         """
         Creates RawPixelsStore and sets the id etc
@@ -7471,19 +7857,23 @@ class _PixelsWrapper (BlitzObjectWrapper):
         for pi in result:
             yield PlaneInfoWrapper(self._conn, pi)
 
-    def getPlanes(self, zctList):
+    def getPlanes(self, zctList, out=None, prefetch=0):
         """
         Returns generator of numpy 2D planes from this set of pixels for a
         list of Z, C, T indexes.
 
         :param zctList:     A list of indexes: [(z,c,t), ]
+        :param out:         Optional numpy array to decode the planes into.
+                            See :meth:`getTiles`
+        :param prefetch:    Number of requests to keep in flight.
+                            See :meth:`getTiles`
         """
 
         zctTileList = []
         for zct in zctList:
             z, c, t = zct
             zctTileList.append((z, c, t, None))
-        return self.getTiles(zctTileList)
+        return self.getTiles(zctTileList, out=out, prefetch=prefetch)
 
     def getPlane(self, theZ=0, theC=0, theT=0):
         """
@@ -7495,57 +7885,175 @@ class _PixelsWrapper (BlitzObjectWrapper):
         planeList = list(self.getPlanes([(theZ, theC, theT)]))
         return planeList[0]
 
-    def getTiles(self, zctTileList):
+    def _getNumpyType(self):
+        """
+        Returns the native numpy dtype matching the type of these Pixels.
+        """
+        import numpy
+
+        pixelTypes = {PixelsTypeint8: numpy.int8,
+                      PixelsTypeuint8: numpy.uint8,
+                      PixelsTypeint16: numpy.int16,
+                      PixelsTypeuint16: numpy.uint16,
+                      PixelsTypeint32: numpy.int32,
+                      PixelsTypeuint32: numpy.uint32,
+                      PixelsTypefloat: numpy.float32,
+                      PixelsTypedouble: numpy.float64}
+        return numpy.dtype(pixelTypes[self.getPixelsType().value])
+
+    @staticmethod
+    def _decodePixels(rawPixels, numpyType, shape, out=None):
+        """
+        Decodes the big-endian bytes returned by the RawPixelsStore into a
+        numpy array of the native numpy type without unpacking the values
+        into Python objects.
+
+        :param rawPixels:   Bytes returned by getPlane(), getTile(),
+                            getStack() etc.
+        :param numpyType:   The native numpy dtype of the pixels
+        :param shape:       Shape of the decoded array, e.g. (sizeY, sizeX)
+        :param out:         Optional array of that shape to decode into.
+                            Returned if given.
+        :return:            numpy array
+        """
+        import numpy
+
+        if not isinstance(rawPixels, bytes):
+            rawPixels = rawPixels.encode("utf-8")
+        bigEndian = numpy.dtype(numpyType).newbyteorder(">")
+        count = 1
+        for size in shape:
+            count *= size
+        pixels = numpy.frombuffer(rawPixels, dtype=bigEndian, count=count)
+        pixels = pixels.reshape(shape)
+        if out is None:
+            # Single copy which also swaps to native byte order
+            return pixels.astype(numpyType)
+        numpy.copyto(out, pixels, casting="unsafe")
+        return out
+
+    @staticmethod
+    def _invokeAll(rawPixelsStore, calls, prefetch=0):
+        """
+        Returns generator of (result, key) for an iterable of
+        (methodName, args, key) calls on the RawPixelsStore, in the order
+        of the calls.
+
+        With a prefetch greater than 0, up to that many calls are kept in
+        flight using Ice asynchronous method invocation (begin_/end_), so
+        that the server reads the next pixels while the caller decodes the
+        current ones.
+
+        :param rawPixelsStore:  The RawPixelsStore to call
+        :param calls:           Iterable of (methodName, args, key)
+        :param prefetch:        Number of calls to keep in flight
+        """
+        if not prefetch or prefetch < 1:
+            for name, args, key in calls:
+                yield getattr(rawPixelsStore, name)(*args), key
+            return
+
+        # Look the methods up once rather than going through
+        # ProxyObjectWrapper.__getattr__ and a new SafeCallWrapper per call.
+        methods = {}
+        pending = deque()
+        calls = iter(calls)
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < prefetch:
+                try:
+                    name, args, key = next(calls)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if name not in methods:
+                    methods[name] = (
+                        getattr(rawPixelsStore, "begin_" + name),
+                        getattr(rawPixelsStore, "end_" + name))
+                begin, end = methods[name]
+                pending.append((end, begin(*args), key))
+            if not pending:
+                break
+            end, result, key = pending.popleft()
+            yield end(result), key
+
+    def _readRawTiles(self, rawPixelsStore, zctTileList, prefetch=0):
+        """
+        Returns generator of (rawPlane, height, width) for a list of
+        (Z, C, T, tile), in the order requested.
+
+        :param rawPixelsStore:  The RawPixelsStore to read from
+        :param zctTileList:     A list of indexes: [(z,c,t, region), ]
+        :param prefetch:        Number of requests to keep in flight.
+                                See :meth:`_invokeAll`
+        """
+        sizeX = self.sizeX
+        sizeY = self.sizeY
+
+        def calls():
+            for z, c, t, tile in zctTileList:
+                if tile is None:
+                    yield "getPlane", (z, c, t), (sizeY, sizeX)
+                else:
+                    x, y, width, height = tile
+                    yield ("getTile", (z, c, t, x, y, width, height),
+                           (height, width))
+
+        rv = self._invokeAll(rawPixelsStore, calls(), prefetch)
+        for rawPlane, (planeY, planeX) in rv:
+            yield rawPlane, planeY, planeX
+
+    def getTiles(self, zctTileList, out=None, prefetch=0):
         """
         Returns generator of numpy 2D planes from this set of pixels for a
         list of (Z, C, T, tile) where tile is (x, y, width, height) or None if
         you want the whole plane.
 
+        If ``out`` is given, each plane is decoded straight into the next
+        2D slot of that array and the yielded planes are views of it. The
+        array must hold ``len(zctTileList)`` planes of identical size, e.g.
+        a (Z, Y, X) array for a z-stack or a (T, C, Z, Y, X) array for a
+        list ordered by T, then C, then Z.
+
+        If ``prefetch`` is greater than 0, up to that many requests are kept
+        in flight while the planes are decoded, which hides the network
+        latency on slow links at the cost of holding up to ``prefetch``
+        raw planes in memory. Planes are still yielded in request order.
+
         :param zctrList:     A list of indexes: [(z,c,t, region), ]
+        :param out:          Optional numpy array to decode the tiles into
+        :param prefetch:     Number of requests to keep in flight
         """
 
-        import numpy
-        from struct import unpack
-
-        pixelTypes = {PixelsTypeint8: ['b', numpy.int8],
-                      PixelsTypeuint8: ['B', numpy.uint8],
-                      PixelsTypeint16: ['h', numpy.int16],
-                      PixelsTypeuint16: ['H', numpy.uint16],
-                      PixelsTypeint32: ['i', numpy.int32],
-                      PixelsTypeuint32: ['I', numpy.uint32],
-                      PixelsTypefloat: ['f', numpy.float32],
-                      PixelsTypedouble: ['d', numpy.float64]}
         rawPixelsStore = None
-        sizeX = self.sizeX
-        sizeY = self.sizeY
-        pixelType = self.getPixelsType().value
-        numpyType = pixelTypes[pixelType][1]
+        numpyType = self._getNumpyType()
+        outPlanes = None
+        if out is not None:
+            zctTileList = list(zctTileList)
+            if out.ndim < 2 or not out.flags.c_contiguous:
+                raise ValueError(
+                    "out must be a C-contiguous array of 2 or more "
+                    "dimensions")
+            outPlanes = out.reshape((-1,) + out.shape[-2:])
+            if outPlanes.shape[0] != len(zctTileList):
+                raise ValueError(
+                    "out holds %s planes but %s were requested"
+                    % (outPlanes.shape[0], len(zctTileList)))
         exc = None
         try:
             rawPixelsStore = self._prepareRawPixelsStore()
-            for zctTile in zctTileList:
-                z, c, t, tile = zctTile
-                if tile is None:
-                    rawPlane = rawPixelsStore.getPlane(z, c, t)
-                    planeY = sizeY
-                    planeX = sizeX
-                else:
-                    x, y, width, height = tile
-                    rawPlane = rawPixelsStore.getTile(
-                        z, c, t, x, y, width, height)
-                    planeY = height
-                    planeX = width
-                # +str(sizeX*sizeY)+pythonTypes[pixelType]
-                convertType = '>%d%s' % (
-                    (planeY*planeX), pixelTypes[pixelType][0])
-                if isinstance(rawPlane, bytes):
-                    convertedPlane = unpack(convertType, rawPlane)
-                else:
-                    encoded = rawPlane.encode("utf-8")
-                    convertedPlane = unpack(convertType, encoded)
-                remappedPlane = numpy.array(convertedPlane, numpyType)
-                remappedPlane.resize(planeY, planeX)
-                yield remappedPlane
+            rawTiles = self._readRawTiles(
+                rawPixelsStore, zctTileList, prefetch)
+            for idx, (rawPlane, planeY, planeX) in enumerate(rawTiles):
+                outPlane = None
+                if outPlanes is not None:
+                    outPlane = outPlanes[idx]
+                    if outPlane.shape != (planeY, planeX):
+                        raise ValueError(
+                            "Plane of shape %s does not fit out plane of "
+                            "shape %s" % ((planeY, planeX), outPlane.shape))
+                yield self._decodePixels(
+                    rawPlane, numpyType, (planeY, planeX), out=outPlane)
         except Exception as e:
             logger.error(
                 "Failed to getPlane() or getTile() from rawPixelsStore",
@@ -7571,6 +8079,268 @@ class _PixelsWrapper (BlitzObjectWrapper):
         tileList = list(self.getTiles([(theZ, theC, theT, tile)]))
         return tileList[0]
 
+    def getTileSize(self):
+        """
+        Returns the (width, height) of the tiles the server reads the
+        pixels by, which are the most efficient to request with
+        :meth:`getTiles`.
+        """
+        rawPixelsStore = self._prepareRawPixelsStore()
+        try:
+            return tuple(rawPixelsStore.getTileSize())
+        finally:
+            rawPixelsStore.close()
+
+    def _hyperstackCalls(self, rawPixelsStore, zRange, cRange, tRange,
+                         region, maxBytes):
+        """
+        Returns generator of (methodName, args, (index, shape)) for the
+        cheapest RawPixelsStore calls that read the given block of pixels,
+        where index is the position of the result in the (T, C, Z, Y, X)
+        output array and shape the shape of the result.
+        See :meth:`getHyperstack`
+        """
+        z0, z1 = zRange
+        c0, c1 = cRange
+        t0, t1 = tRange
+        x, y, width, height = region
+        sizeZ = z1 - z0
+        sizeC = c1 - c0
+        fullPlane = region == (0, 0, self.sizeX, self.sizeY)
+        planeBytes = width * height * self._getNumpyType().itemsize
+        zct = [(z, c, t) for t in range(t0, t1)
+               for c in range(c0, c1) for z in range(z0, z1)]
+
+        if rawPixelsStore.requiresPixelsPyramid():
+            tileWidth, tileHeight = rawPixelsStore.getTileSize()
+            for z, c, t in zct:
+                for ty in range(y, y + height, tileHeight):
+                    th = min(tileHeight, y + height - ty)
+                    for tx in range(x, x + width, tileWidth):
+                        tw = min(tileWidth, x + width - tx)
+                        index = (t - t0, c - c0, z - z0,
+                                 slice(ty - y, ty - y + th),
+                                 slice(tx - x, tx - x + tw))
+                        yield ("getTile", (z, c, t, tx, ty, tw, th),
+                               (index, (th, tw)))
+        elif (fullPlane and sizeZ == self.sizeZ and sizeC == self.sizeC and
+                sizeC * sizeZ * planeBytes <= maxBytes):
+            for t in range(t0, t1):
+                yield ("getTimepoint", (t,),
+                       ((t - t0,), (sizeC, sizeZ, height, width)))
+        elif (fullPlane and sizeZ == self.sizeZ and
+                sizeZ * planeBytes <= maxBytes):
+            for t in range(t0, t1):
+                for c in range(c0, c1):
+                    yield ("getStack", (c, t),
+                           ((t - t0, c - c0), (sizeZ, height, width)))
+        elif sizeC * sizeZ * planeBytes <= maxBytes:
+            for t in range(t0, t1):
+                yield ("getHypercube",
+                       ([x, y, z0, c0, t], [width, height, sizeZ, sizeC, 1],
+                        [1, 1, 1, 1, 1]),
+                       ((t - t0,), (sizeC, sizeZ, height, width)))
+        elif sizeZ * planeBytes <= maxBytes and sizeZ > 1:
+            for t in range(t0, t1):
+                for c in range(c0, c1):
+                    yield ("getHypercube",
+                           ([x, y, z0, c, t], [width, height, sizeZ, 1, 1],
+                            [1, 1, 1, 1, 1]),
+                           ((t - t0, c - c0), (sizeZ, height, width)))
+        else:
+            for z, c, t in zct:
+                index = (t - t0, c - c0, z - z0)
+                if fullPlane:
+                    yield "getPlane", (z, c, t), (index, (height, width))
+                else:
+                    yield ("getTile", (z, c, t, x, y, width, height),
+                           (index, (height, width)))
+
+    def getHyperstack(self, z=None, c=None, t=None, tile=None, out=None,
+                      prefetch=0, maxBytes=None):
+        """
+        Reads a block of these pixels into a single 5D numpy array of
+        shape (T, C, Z, Y, X).
+
+        The block is read with the fewest server calls possible: whole
+        timepoints (getTimepoint), Z-stacks (getStack) or sub-regions
+        (getHypercube), falling back to planes, or to tiles for images
+        which require a pyramid. No single call reads more than
+        ``maxBytes``, which bounds the size of the messages on top of
+        the output array.
+
+        :param z:           (start, stop) range of Z indexes or None for all
+        :param c:           (start, stop) range of C indexes or None for all
+        :param t:           (start, stop) range of T indexes or None for all
+        :param tile:        (x, y, width, height) region of each plane or
+                            None for the whole plane
+        :param out:         Optional preallocated numpy array of shape
+                            (T, C, Z, Y, X) to read into
+        :param prefetch:    Number of requests to keep in flight.
+                            See :meth:`getTiles`
+        :param maxBytes:    Maximum number of bytes read by a single call.
+                            Defaults to :attr:`HYPERSTACK_MAX_BYTES`
+        :return:            numpy array of shape (T, C, Z, Y, X)
+        """
+        import numpy
+
+        def toRange(rng, size, name):
+            if rng is None:
+                return 0, size
+            start, stop = rng
+            if not 0 <= start < stop <= size:
+                raise ValueError(
+                    "Invalid %s range %s for size %s" % (name, rng, size))
+            return start, stop
+
+        zRange = toRange(z, self.sizeZ, "Z")
+        cRange = toRange(c, self.sizeC, "C")
+        tRange = toRange(t, self.sizeT, "T")
+        if tile is None:
+            region = (0, 0, self.sizeX, self.sizeY)
+        else:
+            region = tuple(tile)
+            x, y, width, height = region
+            if (x < 0 or y < 0 or width < 1 or height < 1 or
+                    x + width > self.sizeX or y + height > self.sizeY):
+                raise ValueError("Invalid tile %s" % (region,))
+        if maxBytes is None:
+            maxBytes = self.HYPERSTACK_MAX_BYTES
+
+        numpyType = self._getNumpyType()
+        shape = (tRange[1] - tRange[0], cRange[1] - cRange[0],
+                 zRange[1] - zRange[0], region[3], region[2])
+        if out is None:
+            out = numpy.empty(shape, dtype=numpyType)
+        elif out.shape != shape:
+            raise ValueError(
+                "out has shape %s but %s is required" % (out.shape, shape))
+
+        rawPixelsStore = self._prepareRawPixelsStore()
+        try:
+            calls = self._hyperstackCalls(
+                rawPixelsStore, zRange, cRange, tRange, region, maxBytes)
+            rv = self._invokeAll(rawPixelsStore, calls, prefetch)
+            for rawPixels, (index, rawShape) in rv:
+                self._decodePixels(
+                    rawPixels, numpyType, rawShape, out=out[index])
+        finally:
+            rawPixelsStore.close()
+        return out
+
+    def getRegion(self, theZ=0, theC=0, theT=0, tile=None, level=0,
+                  workers=4, connections=1, out=None):
+        """
+        Reads a region of a plane, e.g. of a large pyramidal image, by
+        fetching its tiles in parallel and reassembling them into a single
+        2D numpy array.
+
+        The tiles are aligned to the tile grid of the server and are read
+        by a pool of ``workers`` threads, each with its own RawPixelsStore.
+        With ``connections`` greater than 1, the workers are spread over
+        that many connections joined to the current session, see
+        :meth:`BlitzGateway.clone`.
+
+        :param theZ:        Z index
+        :param theC:        Channel index
+        :param theT:        Time index
+        :param tile:        (x, y, width, height) region at the resolution
+                            level or None for the whole plane
+        :param level:       Resolution level, 0 being the full resolution
+                            as in :meth:`ImageWrapper.getZoomLevelScaling`
+        :param workers:     Number of tiles fetched concurrently
+        :param connections: Number of connections to spread the workers over
+        :param out:         Optional preallocated 2D numpy array to read into
+        :return:            2D numpy array
+        """
+        import numpy
+        from concurrent.futures import ThreadPoolExecutor
+
+        rawPixelsStore = self._prepareRawPixelsStore()
+        try:
+            levels = rawPixelsStore.getResolutionLevels()
+            if not 0 <= level < levels:
+                raise ValueError(
+                    "Invalid level %s for %s resolution levels"
+                    % (level, levels))
+            if levels > 1:
+                description = rawPixelsStore.getResolutionDescriptions()[level]
+                sizeX, sizeY = description.sizeX, description.sizeY
+                rawPixelsStore.setResolutionLevel(levels - 1 - level)
+            else:
+                sizeX, sizeY = self.sizeX, self.sizeY
+            tileWidth, tileHeight = rawPixelsStore.getTileSize()
+        finally:
+            rawPixelsStore.close()
+
+        if tile is None:
+            x, y, width, height = 0, 0, sizeX, sizeY
+        else:
+            x, y, width, height = tile
+            if (x < 0 or y < 0 or width < 1 or height < 1 or
+                    x + width > sizeX or y + height > sizeY):
+                raise ValueError("Invalid tile %s" % (tuple(tile),))
+        numpyType = self._getNumpyType()
+        if out is None:
+            out = numpy.empty((height, width), dtype=numpyType)
+        elif out.shape != (height, width):
+            raise ValueError(
+                "out has shape %s but %s is required"
+                % (out.shape, (height, width)))
+
+        conns = [self._conn]
+        stores = []
+        lock = threading.Lock()
+        local = threading.local()
+        pixelsId = self._obj.id.val
+
+        def getTile(tx, ty, tw, th):
+            store = getattr(local, "store", None)
+            if store is None:
+                with lock:
+                    conn = conns[len(stores) % len(conns)]
+                    store = conn.createRawPixelsStore().clone()
+                    stores.append(store)
+                store.setPixelsId(pixelsId, True, conn.SERVICE_OPTS)
+                if levels > 1:
+                    store.setResolutionLevel(levels - 1 - level)
+                local.store = store
+            rawTile = store.getTile(theZ, theC, theT, tx, ty, tw, th)
+            self._decodePixels(rawTile, numpyType, (th, tw), out=out[
+                ty - y:ty - y + th, tx - x:tx - x + tw])
+
+        try:
+            for i in range(1, connections):
+                conn = self._conn.clone()
+                conns.append(conn)
+                if not conn.connect(sUuid=self._conn._sessionUuid):
+                    raise Exception("Connect failed")
+                # A clone starts with empty options, e.g. no omero.group
+                conn.SERVICE_OPTS = self._conn.SERVICE_OPTS.copy()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = []
+                for gy in range(y - y % tileHeight, y + height, tileHeight):
+                    ty = max(gy, y)
+                    th = min(gy + tileHeight, y + height) - ty
+                    for gx in range(x - x % tileWidth, x + width, tileWidth):
+                        tx = max(gx, x)
+                        tw = min(gx + tileWidth, x + width) - tx
+                        futures.append(
+                            executor.submit(getTile, tx, ty, tw, th))
+                for future in futures:
+                    future.result()
+        finally:
+            for store in stores:
+                try:
+                    store.close()
+                except Exception:
+                    logger.error("Failed to close rawPixelsStore",
+                                 exc_info=True)
+            for conn in conns[1:]:
+                # Leave the shared session open
+                conn.close(hard=False)
+        return out
+
 PixelsWrapper = _PixelsWrapper
 
 
@@ -8676,6 +9446,25 @@ class _ImageWrapper (BlitzObjectWrapper, OmeroRestrictionWrapper):
         """
         return PixelsWrapper(self._conn, self._obj.getPrimaryPixels())
 
+    @assert_pixels
+    def getHyperstack(self, z=None, c=None, t=None, tile=None, out=None,
+                      prefetch=0, maxBytes=None):
+        """
+        Reads a block of the primary pixels into a single 5D numpy array
+        of shape (T, C, Z, Y, X). See :meth:`PixelsWrapper.getHyperstack`
+
+        :param z:           (start, stop) range of Z indexes or None for all
+        :param c:           (start, stop) range of C indexes or None for all
+        :param t:           (start, stop) range of T indexes or None for all
+        :param tile:        (x, y, width, height) region of each plane or
+                            None for the whole plane
+        :param out:         Optional preallocated numpy array to read into
+        :return:            numpy array of shape (T, C, Z, Y, X)
+        """
+        return self.getPrimaryPixels().getHyperstack(
+            z=z, c=c, t=t, tile=tile, out=out, prefetch=prefetch,
+            maxBytes=maxBytes)
+
     @assert_pixels
     def getThumbVersion(self):
         """
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2026 University of Dundee & Open Microscopy Environment.
+# All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+asyncio facade of :class:`omero.gateway.BlitzGateway`, available as
+``conn.aio``::
+
+    image = await conn.aio.getObject("Image", 1)
+    qs = conn.aio.getQueryService()
+    rv = await qs.findAllByQuery(query, params, _ctx=conn.SERVICE_OPTS)
+    jpeg = await conn.aio.run(image.renderJpeg, 0, 0)
+
+Service calls are mapped onto the Ice asynchronous method invocations
+(begin_/end_) so that they do not block a thread while in flight, and
+many calls can be awaited concurrently from one event loop. As for the
+begin_ methods, the call context must be passed as the _ctx keyword.
+Other gateway methods can be run in a small thread pool with
+:meth:`AsyncBlitzGateway.run`.
+"""
+
+from builtins import object
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import omero
+from omero.rtypes import rint, unwrap
+
+logger = logging.getLogger(__name__)
+
+
+def _set_result(future, value):
+    if not future.done():
+        future.set_result(value)
+
+
+def _set_exception(future, exc):
+    if not future.done():
+        future.set_exception(exc)
+
+
+def ami(begin, *args, **kwargs):
+    """
+    Calls an Ice begin_ method and returns an asyncio future of its
+    result, which must be awaited from the running event loop. Methods
+    with several return values resolve to a tuple.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def response(*rv):
+        value = rv[0] if len(rv) == 1 else (rv or None)
+        loop.call_soon_threadsafe(_set_result, future, value)
+
+    def exception(exc):
+        loop.call_soon_threadsafe(_set_exception, future, exc)
+
+    begin(*args, _response=response, _ex=exception, **kwargs)
+    return future
+
+
+class AsyncServiceWrapper(object):
+    """
+    Async counterpart of :class:`omero.gateway.ProxyObjectWrapper` whose
+    methods are coroutines, e.g. await qs.findByQuery(query, params)
+    """
+
+    def __init__(self, aio, proxyObjectWrapper):
+        self._aio = aio
+        self._wrapper = proxyObjectWrapper
+        self._creating = None
+
+    async def _getObj(self):
+        obj = self._wrapper._obj
+        if not obj:
+            # Creating the service is a blocking call, shared by the calls
+            # waiting for it
+            if self._creating is None or self._creating.done():
+                self._creating = asyncio.ensure_future(
+                    self._aio.run(self._wrapper._getObj))
+            obj = await asyncio.shield(self._creating)
+        return obj
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+
+        async def call(*args, **kwargs):
+            obj = await self._getObj()
+            begin = getattr(obj, "begin_" + attr, None)
+            if begin is None:
+                raise AttributeError(
+                    "%s has no asynchronous method %s" % (obj, attr))
+            return await ami(begin, *args, **kwargs)
+        call.__name__ = attr
+        return call
+
+    async def close(self):
+        """
+        Closes the service, see ProxyObjectWrapper.close()
+        """
+        await self._aio.run(self._wrapper.close)
+
+
+class AsyncBlitzGateway(object):
+    """
+    asyncio facade of a :class:`omero.gateway.BlitzGateway`.
+
+    The service getters, e.g. getQueryService() or createRawPixelsStore(),
+    return an :class:`AsyncServiceWrapper`. getObject(), getObjects(),
+    getThumbnailSet() and getTiles() use asynchronous Ice calls. Any
+    other blocking call can be awaited with :meth:`run`.
+    """
+
+    def __init__(self, conn, workers=4):
+        """
+        :param conn:        The :class:`omero.gateway.BlitzGateway`
+        :param workers:     Number of threads used by :meth:`run`
+        """
+        self._conn = conn
+        self.workers = workers
+        self._executor = None
+
+    def __getattr__(self, attr):
+        if (attr.startswith(("get", "create")) and
+                attr.endswith(("Service", "Store", "Engine"))):
+            method = getattr(self._conn, attr)
+
+            def service(*args, **kwargs):
+                return AsyncServiceWrapper(self, method(*args, **kwargs))
+            return service
+        raise AttributeError(
+            "%s has no asynchronous version, use run(conn.%s, ...)"
+            % (attr, attr))
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a blocking call, e.g. image.renderJpeg, in the thread pool
+        of this facade and returns its result.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="AsyncBlitzGateway")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(func, *args, **kwargs))
+
+    def close(self):
+        """
+        Shuts down the thread pool used by :meth:`run`
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def getObject(self, obj_type, oid=None, params=None,
+                        attributes=None, opts=None):
+        """
+        See :meth:`omero.gateway.BlitzGateway.getObject`
+        """
+        conn = self._conn
+        oids = (oid is not None) and [oid] or None
+        query, params, wrapper = conn.buildQuery(
+            obj_type, oids, params, attributes, opts)
+        result = await self.getQueryService().findByQuery(
+            query, params, _ctx=conn.SERVICE_OPTS)
+        if result is not None:
+            return wrapper(conn, result)
+
+    async def getObjects(self, obj_type, ids=None, params=None,
+                         attributes=None, respect_order=False, opts=None):
+        """
+        See :meth:`omero.gateway.BlitzGateway.getObjects`, returning a list
+        """
+        conn = self._conn
+        query, params, wrapper = conn.buildQuery(
+            obj_type, ids, params, attributes, opts)
+        result = await self.getQueryService().findAllByQuery(
+            query, params, _ctx=conn.SERVICE_OPTS)
+        if respect_order and ids is not None:
+            idMap = dict((r.id.val, r) for r in result)
+            result = [idMap[i] for i in unwrap(ids) if i in idMap]
+        return [wrapper(conn, r) for r in result]
+
+    async def getThumbnailSet(self, image_ids, max_size=64):
+        """
+        See :meth:`omero.gateway.BlitzGateway.getThumbnailSet`
+        """
+        conn = self._conn
+        ctx = conn.SERVICE_OPTS.copy()
+        if ctx.getOmeroGroup() is None:
+            ctx.setOmeroGroup(-1)
+        p = omero.sys.ParametersI().addIds(image_ids)
+        sql = ("select new map(i.id as im_id, p.id as pix_id) "
+               "from Pixels as p join p.image as i where i.id in (:ids)")
+        rv = dict()
+        tb = None
+        try:
+            img_pixel_ids = await self.getQueryService().projection(
+                sql, p, _ctx=ctx)
+            pixels = dict()
+            for e in img_pixel_ids:
+                e = unwrap(e)
+                pixels[e[0]['pix_id']] = e[0]['im_id']
+            tb = self.createThumbnailStore()
+            thumbs = await tb.getThumbnailByLongestSideSet(
+                rint(max_size), list(pixels), _ctx=ctx)
+            for pix, thumb in thumbs.items():
+                rv[pixels[pix]] = thumb
+        except Exception:
+            logger.error("getThumbnailSet failed", exc_info=True)
+        finally:
+            if tb is not None:
+                await tb.close()
+        return rv
+
+    async def getTiles(self, pixels, zctTileList, concurrency=8):
+        """
+        Async version of :meth:`omero.gateway.PixelsWrapper.getTiles`,
+        returning the list of numpy 2D planes for a list of
+        (Z, C, T, tile) of a :class:`omero.gateway.PixelsWrapper`.
+        Up to concurrency reads are in flight at once. Like getTiles, this
+        uses the RawPixelsStore of the connection so calls must not overlap
+        on the same connection.
+        """
+        conn = self._conn
+        numpyType = pixels._getNumpyType()
+        semaphore = asyncio.Semaphore(concurrency)
+        store = self.createRawPixelsStore()
+
+        async def read(z, c, t, tile):
+            if tile is None:
+                shape = (pixels.sizeY, pixels.sizeX)
+                call = store.getPlane(z, c, t)
+            else:
+                x, y, width, height = tile
+                shape = (height, width)
+                call = store.getTile(z, c, t, x, y, width, height)
+            async with semaphore:
+                raw = await call
+            return pixels._decodePixels(raw, numpyType, shape)
+        try:
+            await store.setPixelsId(
+                pixels.getId(), True, _ctx=conn.SERVICE_OPTS)
+            return await asyncio.gather(
+                *[read(*x) for x in zctTileList])
+        finally:
+            await store.close()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2026 University of Dundee & Open Microscopy Environment.
+# All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Pool of :class:`omero.gateway.BlitzGateway` connections which can be
+shared by the threads of a server, e.g. a WSGI application::
+
+    pool = BlitzGatewayPool(host="localhost", maxsize=20)
+    with pool.connect(session_uuid, group=3) as conn:
+        image = conn.getObject("Image", 1)
+    pool.close()
+
+A BlitzGateway is not thread-safe, so each connection is only handed
+out to one thread at a time. Idle connections are kept per (session,
+group) so that later requests avoid creating a new Ice communicator and
+joining the session again.
+"""
+
+from builtins import object
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import Ice
+import omero
+
+logger = logging.getLogger(__name__)
+
+
+class BlitzGatewayPool(object):
+
+    """
+    Thread-safe pool of connections joined to existing sessions.
+
+    At most maxsize connections, and so Ice communicators, are open at
+    once, whether idle or checked out. When the pool is full, idle
+    connections of other sessions are closed to make room, otherwise
+    :meth:`checkout` waits for a connection to be checked in.
+
+    Every check_interval seconds a background thread closes the
+    connections which were idle for more than idle_timeout seconds and
+    calls keepAlive() on the others, dropping those which fail. A
+    check_interval of 0 disables the thread, see :meth:`check`.
+
+    Closing a pooled connection never closes the session it joined.
+    """
+
+    def __init__(self, host=None, port=None, maxsize=10, idle_timeout=600,
+                 check_interval=60, timeout=30, gateway_class=None,
+                 **kwargs):
+        """
+        :param host:            Server to connect to
+        :param port:            Port of the server
+        :param maxsize:         Maximum number of open connections
+        :param idle_timeout:    Seconds after which an idle connection is
+                                closed
+        :param check_interval:  Seconds between health checks of the idle
+                                connections
+        :param timeout:         Default seconds to wait in :meth:`checkout`
+                                when the pool is full
+        :param gateway_class:   Class of the connections, by default
+                                :class:`omero.gateway.BlitzGateway`
+        :param kwargs:          Other arguments passed to gateway_class,
+                                e.g. secure or useragent
+        """
+        if gateway_class is None:
+            from omero.gateway import BlitzGateway
+            gateway_class = BlitzGateway
+        self.host = host
+        self.port = port
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.check_interval = check_interval
+        self.timeout = timeout
+        self.gateway_class = gateway_class
+        self.kwargs = kwargs
+        self._cond = threading.Condition()
+        # (session, group) -> list of (connection, time of checkin)
+        self._idle = {}
+        self._total = 0
+        self._closed = False
+        self._stats = {"created": 0, "reused": 0, "closed": 0, "waits": 0}
+        self._stop_event = threading.Event()
+        self._thread = None
+        if check_interval > 0:
+            self._thread = threading.Thread(
+                target=self._run, name="BlitzGatewayPool")
+            self._thread.daemon = True
+            self._thread.start()
+
+    @contextmanager
+    def connect(self, session, group=None, timeout=None):
+        """
+        Context manager checking out a connection for session and group
+        and checking it in again afterwards. Connections which raised an
+        Ice.LocalException are closed rather than reused.
+        """
+        conn = self.checkout(session, group, timeout)
+        try:
+            yield conn
+        except Ice.LocalException:
+            self.checkin(conn, discard=True)
+            raise
+        except BaseException:
+            self.checkin(conn)
+            raise
+        else:
+            self.checkin(conn)
+
+    def checkout(self, session, group=None, timeout=None):
+        """
+        Returns a connection joined to session, using group for its
+        calls (see :meth:`omero.gateway.utils.ServiceOptsDict.setOmeroGroup`),
+        which must be returned with :meth:`checkin`. Raises
+        :class:`omero.ClientError` if the pool is full for longer than
+        timeout seconds or the session cannot be joined.
+        """
+        key = (session, group)
+        if timeout is None:
+            timeout = self.timeout
+        deadline = time.time() + timeout
+        evicted = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise omero.ClientError("Connection pool closed")
+                idle = self._idle.get(key)
+                if idle:
+                    conn = idle.pop()[0]
+                    if not idle:
+                        del self._idle[key]
+                    self._stats["reused"] += 1
+                    return conn
+                if self._total < self.maxsize:
+                    break
+                evicted = self._popOldest()
+                if evicted is not None:
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise omero.ClientError(
+                        "No connection available after %s seconds: %s in use"
+                        % (timeout, self._total))
+                self._stats["waits"] += 1
+                self._cond.wait(remaining)
+            if evicted is None:
+                self._total += 1
+        # Connecting may be slow so is done without holding the lock. The
+        # slot of an evicted connection is reused for the new one.
+        if evicted is not None:
+            self._close(evicted)
+        try:
+            return self._create(session, group)
+        except BaseException:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def checkin(self, conn, discard=False):
+        """
+        Returns a connection from :meth:`checkout` to the pool or closes
+        it if discard is True or the pool has been closed.
+        """
+        key = conn._pool_key
+        if not discard and not self._closed and conn.isConnected():
+            # Drop any per-call options set by the last user
+            conn.SERVICE_OPTS = conn.createServiceOptsDict()
+            if key[1] is not None:
+                conn.SERVICE_OPTS.setOmeroGroup(key[1])
+            with self._cond:
+                if not self._closed:
+                    self._idle.setdefault(key, []).append(
+                        (conn, time.time()))
+                    self._cond.notify()
+                    return
+        self._close(conn)
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
+
+    def check(self):
+        """
+        Closes the connections idle for more than idle_timeout seconds
+        and those whose keepAlive() fails. Called periodically by the
+        background thread.
+        """
+        now = time.time()
+        with self._cond:
+            idle = [(key, conn, since)
+                    for key, conns in self._idle.items()
+                    for conn, since in conns]
+            self._idle = {}
+        alive = []
+        for key, conn, since in idle:
+            if now - since < self.idle_timeout and self._keepAlive(conn):
+                alive.append((key, conn, since))
+            else:
+                self._close(conn)
+                with self._cond:
+                    self._total -= 1
+                    self._cond.notify()
+        with self._cond:
+            for key, conn, since in alive:
+                self._idle.setdefault(key, []).append((conn, since))
+            for conns in self._idle.values():
+                conns.sort(key=lambda x: x[1])
+            self._cond.notify_all()
+
+    def close(self):
+        """
+        Stops the background thread and closes the idle connections.
+        Connections still checked out are closed when checked in.
+        """
+        self._stop_event.set()
+        with self._cond:
+            self._closed = True
+            idle = [conn for conns in self._idle.values()
+                    for conn, since in conns]
+            self._idle = {}
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    def getStats(self):
+        """
+        Returns a dict with the numbers of open and idle connections and
+        how many connections were created, reused and closed so far.
+        """
+        with self._cond:
+            rv = dict(self._stats)
+            rv["open"] = self._total
+            rv["idle"] = sum(len(x) for x in self._idle.values())
+            rv["maxsize"] = self.maxsize
+            return rv
+
+    def _create(self, session, group):
+        conn = self.gateway_class(host=self.host, port=self.port,
+                                  **self.kwargs)
+        try:
+            connected = conn.connect(sUuid=session)
+        except BaseException:
+            self._close(conn)
+            raise
+        if not connected:
+            self._close(conn)
+            raise omero.ClientError(
+                "Cannot join session: %s" % conn.getLastError())
+        if group is not None:
+            conn.SERVICE_OPTS.setOmeroGroup(group)
+        conn._pool_key = (session, group)
+        with self._cond:
+            self._stats["created"] += 1
+        return conn
+
+    def _popOldest(self):
+        """
+        Removes and returns the least recently used idle connection or
+        None. Must be called holding the lock.
+        """
+        oldest = None
+        for key, conns in self._idle.items():
+            if oldest is None or conns[0][1] < oldest[1]:
+                oldest = (key, conns[0][1])
+        if oldest is None:
+            return None
+        conns = self._idle[oldest[0]]
+        conn = conns.pop(0)[0]
+        if not conns:
+            del self._idle[oldest[0]]
+        return conn
+
+    def _keepAlive(self, conn):
+        try:
+            return conn.keepAlive()
+        except Exception:
+            logger.debug("keepAlive failed", exc_info=True)
+            return False
+
+    def _close(self, conn):
+        try:
+            # Not hard: the session is still used by others
+            conn.close(hard=False)
+        except Exception:
+            logger.debug("Error closing pooled connection", exc_info=True)
+        with self._cond:
+            self._stats["closed"] += 1
+
+    def _run(self):
+        while not self._stop_event.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception:
+                logger.error("Connection pool check failed", exc_info=True)
@@ -29,6 +29,9 @@ from past.builtins import basestring
 from builtins import object
 import logging
 import json
+import threading
+import time
+from collections import OrderedDict
 
 try:
     long
@@ -182,6 +185,68 @@ class ServiceOptsDict(dict):
         return False
 
 
+class GatewayCache(object):
+
+    """
+    Thread-safe cache for the lookups of :class:`omero.gateway.BlitzGateway`
+    which rarely change, like enumerations, experimenters and groups.
+    Entries expire after ttl seconds and the least recently used entries
+    are dropped once maxsize is reached. A single instance may be shared
+    by several connections.
+    """
+
+    def __init__(self, maxsize=1000, ttl=300):
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._generation = 0
+
+    def get(self, key, loader):
+        """
+        Returns the value for key, calling loader() to load it if it
+        is missing or has expired. loader() is called without holding
+        the lock so that slow lookups do not block each other.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            if generation != self._generation:
+                # Invalidated while loading, the value may be stale
+                return value
+            self._entries[key] = (value, time.time() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self):
+        """
+        Removes all entries, keeping the hit and miss counts
+        """
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def getStats(self):
+        """
+        Returns a dict of the hits, misses and current size of the cache
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "size": len(self._entries), "maxsize": self.maxsize,
+                    "ttl": self.ttl}
+
+
 def toBoolean(val):
     """
     Get the boolean value of the provided input.
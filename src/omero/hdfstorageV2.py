@@ -15,12 +15,14 @@ from builtins import range
 from builtins import object
 from future.utils import native, bytes_to_native_str, isbytes
 from past.builtins import basestring
+import copy
 import time
 import numpy
 import logging
 import threading
 import traceback
 
+from collections import OrderedDict
 from os import W_OK
 
 import omero  # Do we need both??
@@ -30,7 +32,8 @@ import omero.callbacks
 # For ease of use
 from omero.columns import columns2definition
 from omero.rtypes import rfloat, rlong, rstring, unwrap
-from omero.util.decorators import locked
+from omero.util.concurrency import ReadWriteLock
+from omero.util.decorators import locked, read_locked
 from omero_ext.path import path
 import portalocker
 from functools import wraps
@@ -67,7 +70,7 @@ def stamped(func, update=False):
     last modification time will be updated after the method call if it
     is successful.
 
-    Note: stamped implies locked
+    Note: stamped implies read_locked
 
     """
     def check_and_update_stamp(*args, **kwargs):
@@ -83,19 +86,33 @@ def stamped(func, update=False):
             if update:
                 self._stamp = time.time()
     check_and_update_stamp = wraps(func)(check_and_update_stamp)
-    return locked(check_and_update_stamp)
+    return read_locked(check_and_update_stamp)
+
+
+def hdf5locked(func):
+    """
+    Decorator which holds the lock serialising calls into libhdf5 (see
+    HdfList) for the duration of the method call. Must be applied after
+    locked, read_locked or stamped.
+    """
+    def with_hdf5lock(*args, **kwargs):
+        self = args[0]
+        with self._hdf5lock:
+            return func(*args, **kwargs)
+    return wraps(func)(with_hdf5lock)
 
 
 def modifies(func):
     """
-    Decorator which always calls flush() on the first argument after the
-    method call
+    Decorator which always calls invalidate() and flush() on the first
+    argument after the method call
     """
     def flush_after(*args, **kwargs):
         self = args[0]
         try:
             return func(*args, **kwargs)
         finally:
+            self.invalidate()
             self.flush()
     return wraps(func)(flush_after)
 
@@ -111,13 +128,29 @@ class HdfList(object):
     This also holds a global lock for all HDF5 calls since libhdf5 is usually
     compiled without --enable-threadsafe, see
     https://trac.openmicroscopy.org/ome/ticket/10464
+    If threadsafe is set, each file gets its own HDF5 lock instead so that
+    different files can be accessed concurrently.
+
+    Independently of the HDF5 lock, each HdfStorage has a ReadWriteLock
+    which lets any number of readers of a file run at once while writers
+    are exclusive. It must be taken before the lock of this list, which
+    in turn is taken before the HDF5 lock of a file.
+
+    Up to pool_size storages which were opened read-only and are no
+    longer used by any table are kept open so that they can be handed
+    out again without re-opening the file, as long as the modification
+    time of the file has not changed in the meantime. Writable storages
+    are always closed, releasing their exclusive lock on the file.
     """
 
-    def __init__(self):
+    def __init__(self, threadsafe=False, pool_size=0):
         self.logger = logging.getLogger("omero.tables.HdfList")
         self._lock = threading.RLock()
+        self.threadsafe = threadsafe
+        self.pool_size = pool_size
         self.__filenos = {}
         self.__paths = {}
+        self.__idle = OrderedDict()
 
     @locked
     def addOrThrow(self, hdfpath, hdfstorage, read_only=False):
@@ -160,23 +193,143 @@ class HdfList(object):
     @locked
     def getOrCreate(self, hdfpath, table, read_only=False):
         storage = None
+        if hdfpath in self.__idle:
+            storage, mtime = self.__idle.pop(hdfpath)
+            if path(hdfpath).mtime != mtime:
+                self.logger.info("Modified on disk: %s", hdfpath)
+                storage.cleanup()
+            elif not read_only:
+                storage.cleanup()
         try:
             storage = self.__paths[hdfpath]
         except KeyError:
             # Adds itself to the global list
-            storage = HdfStorage(hdfpath, self._lock, read_only=read_only)
+            if self.threadsafe:
+                hdf5lock = threading.RLock()
+            else:
+                hdf5lock = self._lock
+            storage = HdfStorage(hdfpath, hdf5lock, read_only=read_only)
         storage.incr(table)
         return storage
 
+    @locked
+    def park(self, hdfpath, hdfstorage):
+        """
+        Called by HdfStorage.decr() when the last table has been detached.
+        Returns True if the storage was kept open, otherwise the caller
+        must clean it up.
+        """
+        if self.pool_size <= 0 or not hdfstorage.read_only():
+            return False
+        if self.__paths.get(hdfpath) is not hdfstorage:
+            return False
+        self.__idle[hdfpath] = (hdfstorage, path(hdfpath).mtime)
+        while len(self.__idle) > self.pool_size:
+            # Idle storages have no tables so no other thread can
+            # be holding their lock.
+            idle, mtime = self.__idle.popitem(last=False)[1]
+            idle.cleanup()
+        return True
+
+    @locked
+    def drain(self):
+        """
+        Closes all idle storages
+        """
+        while self.__idle:
+            idle, mtime = self.__idle.popitem(last=False)[1]
+            idle.cleanup()
+
     @locked
     def remove(self, hdfpath, hdffile):
         del self.__filenos[hdffile.fileno()]
         del self.__paths[hdfpath]
+        self.__idle.pop(hdfpath, None)
 
 # Global object for maintaining files
 HDFLIST = HdfList()
 
 
+class QueryCache(object):
+
+    """
+    LRU cache of getWhereList results shared by all files. Results are
+    kept as numpy arrays and the cache is bounded by their approximate
+    size in bytes, a maxbytes of 0 disables it. Entries of a file are
+    dropped whenever the file is modified, see modifies.
+    """
+
+    # Rough size of a key and its bookkeeping
+    OVERHEAD = 256
+
+    def __init__(self, maxbytes=32 * 1024 * 1024):
+        self._lock = threading.RLock()
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+
+    @staticmethod
+    def key(hdfpath, condition, variables, start, stop, step, stamp):
+        """
+        Returns a hashable key for the query or None if the variables
+        cannot be hashed, in which case the query is not cached.
+        """
+        if variables:
+            try:
+                variables = tuple(sorted(variables.items()))
+                hash(variables)
+            except TypeError:
+                return None
+        else:
+            variables = None
+        return (str(hdfpath), condition, variables, start, stop, step, stamp)
+
+    def __sizeof(self, rows):
+        return rows.nbytes + self.OVERHEAD
+
+    @locked
+    def get(self, key):
+        if key is None or not self.maxbytes:
+            return None
+        try:
+            rows = self.__entries.pop(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.__entries[key] = rows
+        self.hits += 1
+        return rows
+
+    @locked
+    def put(self, key, rows):
+        if key is None or self.__sizeof(rows) > self.maxbytes:
+            return
+        old = self.__entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= self.__sizeof(old)
+        self.__entries[key] = rows
+        self.nbytes += self.__sizeof(rows)
+        while self.nbytes > self.maxbytes:
+            k, v = self.__entries.popitem(last=False)
+            self.nbytes -= self.__sizeof(v)
+
+    @locked
+    def invalidate(self, hdfpath):
+        hdfpath = str(hdfpath)
+        for key in [k for k in self.__entries if k[0] == hdfpath]:
+            self.nbytes -= self.__sizeof(self.__entries.pop(key))
+
+    @locked
+    def clear(self):
+        self.__entries.clear()
+        self.nbytes = 0
+
+# Global cache for getWhereList results
+QUERYCACHE = QueryCache()
+
+
 class HdfStorage(object):
 
     """
@@ -203,8 +356,11 @@ class HdfStorage(object):
         self.__hdf_file = HDFLIST.addOrThrow(file_path, self, read_only)
         self.__tables = []
 
-        self._lock = hdf5lock
+        self._lock = ReadWriteLock()
+        self._hdf5lock = hdf5lock
+        self._read_only = read_only
         self._stamp = time.time()
+        self.__prototypes = None
 
         # These are what we'd like to have
         self.__mea = None
@@ -228,6 +384,12 @@ class HdfStorage(object):
     def size(self):
         return self.__hdf_path.size
 
+    def invalidate(self):
+        """
+        Drops the cached getWhereList results of this file
+        """
+        QUERYCACHE.invalidate(self.__hdf_path)
+
     def openfile(self, mode, policy='default'):
         tables.file._FILE_OPEN_POLICY = policy
         try:
@@ -270,6 +432,12 @@ class HdfStorage(object):
     def modified(self):
         return self._modified
 
+    def read_only(self):
+        """
+        True if the file was opened without taking its exclusive lock
+        """
+        return self._read_only
+
     def __initcheck(self):
         if not self.__initialized:
             raise omero.ApiUsageException(None, None, "Not yet initialized")
@@ -333,6 +501,7 @@ class HdfStorage(object):
     #
 
     @locked
+    @hdf5locked
     def flush(self):
         """
         Flush writes to the underlying table, mark this object as modified
@@ -343,6 +512,7 @@ class HdfStorage(object):
         self.logger.debug("Modified flag set")
 
     @locked
+    @hdf5locked
     @modifies
     def initialize(self, cols, metadata=None):
         """
@@ -385,10 +555,14 @@ class HdfStorage(object):
         self.add_meta_map(md, replace=True, init=True)
 
         self.__hdf_file.flush()
+        self.__prototypes = None
         self.__initialized = True
 
-    @locked
     def incr(self, table):
+        """
+        Attaches a table to this storage. Called by HdfList.getOrCreate
+        which holds the HdfList lock, as does decr().
+        """
         sz = len(self.__tables)
         self.logger.info("Size: %s - Attaching %s to %s" %
                          (sz, table, self.__hdf_path))
@@ -400,56 +574,79 @@ class HdfStorage(object):
 
     @locked
     def decr(self, table):
-        sz = len(self.__tables)
-        self.logger.info(
-            "Size: %s - Detaching %s from %s", sz, table, self.__hdf_path)
-        if not (table in self.__tables):
-            self.logger.warn("Unknown table")
-            raise omero.ApiUsageException(None, None, "Unknown table")
-        self.__tables.remove(table)
-        if sz <= 1:
-            self.cleanup()
-        return sz - 1
-
-    @locked
+        with HDFLIST._lock:
+            sz = len(self.__tables)
+            self.logger.info(
+                "Size: %s - Detaching %s from %s", sz, table, self.__hdf_path)
+            if not (table in self.__tables):
+                self.logger.warn("Unknown table")
+                raise omero.ApiUsageException(None, None, "Unknown table")
+            self.__tables.remove(table)
+            if sz <= 1 and not HDFLIST.park(self.__hdf_path, self):
+                self.cleanup()
+            return sz - 1
+
+    @read_locked
     def uptodate(self, stamp):
         return self._stamp <= stamp
 
-    @locked
+    @read_locked
+    @hdf5locked
     def rows(self):
         self.__initcheck()
         return self.__mea.nrows
 
-    @locked
-    def cols(self, size, current):
+    @read_locked
+    @hdf5locked
+    def cols(self, size, current, colNumbers=None):
+        """
+        Returns new column instances for the given column numbers, or for
+        all columns if colNumbers is None. Each column is built through its
+        object factory only once per storage and then copied.
+        """
         self.__initcheck()
-        ic = current.adapter.getCommunicator()
-        types = self.__types
-        names = self.__mea.colnames
-        descs = self.__descriptions
+        if colNumbers is None:
+            colNumbers = range(self.__width())
         cols = []
-        for i in range(len(types)):
-            t = types[i]
-            if isbytes(t):
-                t = bytes_to_native_str(t)
-            n = names[i]
-            d = descs[i]
-            if isbytes(d):
-                d = bytes_to_native_str(d)
-            try:
-                col = ic.findObjectFactory(t).create(t)
-                col.name = n
-                col.description = d
-                col.setsize(size)
-                col.settable(self.__mea)
-                cols.append(col)
-            except:
-                msg = traceback.format_exc()
-                raise omero.ValidationException(
-                    None, msg, "BAD COLUMN TYPE: %s for %s" % (t, n))
+        for i in colNumbers:
+            col = copy.copy(self.__prototype(i, current))
+            col.setsize(size)
+            cols.append(col)
         return cols
 
-    @locked
+    def __prototype(self, i, current):
+        """
+        Returns the cached prototype of the i-th column, creating it
+        through the object factory if necessary.
+        """
+        if self.__prototypes is None:
+            self.__prototypes = [None] * self.__width()
+        col = self.__prototypes[i]
+        if col is not None:
+            return col
+        ic = current.adapter.getCommunicator()
+        t = self.__types[i]
+        if isbytes(t):
+            t = bytes_to_native_str(t)
+        n = self.__mea.colnames[i]
+        d = self.__descriptions[i]
+        if isbytes(d):
+            d = bytes_to_native_str(d)
+        try:
+            col = ic.findObjectFactory(t).create(t)
+            col.name = n
+            col.description = d
+            col.setsize(None)
+            col.settable(self.__mea)
+        except:
+            msg = traceback.format_exc()
+            raise omero.ValidationException(
+                None, msg, "BAD COLUMN TYPE: %s for %s" % (t, n))
+        self.__prototypes[i] = col
+        return col
+
+    @read_locked
+    @hdf5locked
     def get_meta_map(self):
         self.__initcheck()
         metadata = {}
@@ -471,6 +668,7 @@ class HdfStorage(object):
         return metadata
 
     @locked
+    @hdf5locked
     @modifies
     def add_meta_map(self, m, replace=False, init=False):
         if not init:
@@ -507,6 +705,7 @@ class HdfStorage(object):
             attr[k] = unwrap(v)
 
     @locked
+    @hdf5locked
     @modifies
     def append(self, cols):
         self.__initcheck()
@@ -525,8 +724,16 @@ class HdfStorage(object):
             dtypes.extend(col.dtypes())
             col.append(self.__mea)  # Potential corruption !!!
 
-        # Convert column-wise data to row-wise records
-        records = numpy.array(list(zip(*arrays)), dtype=dtypes)
+        # Convert column-wise data to row-wise records by allocating the
+        # records once and filling each field from its column
+        records = numpy.empty(sz or 0, dtype=dtypes)
+        for name, array in zip(records.dtype.names, arrays):
+            field = records[name]
+            values = numpy.asarray(array)
+            if values.shape != field.shape:
+                # e.g. arrays of size 1 passed as scalars
+                values = values.reshape(field.shape)
+            field[...] = values
 
         self.__mea.append(records)
 
@@ -534,69 +741,121 @@ class HdfStorage(object):
     # Stamped methods
     #
 
+    @locked
     @stamped
+    @hdf5locked
     @modifies
     def update(self, stamp, data):
+        """
+        Writes the values of each column in data to data.rowNumbers.
+        The row numbers are sorted and grouped into runs of contiguous
+        rows so that each run is written with a single modify_column()
+        per column. If a row number is repeated, its last value is kept.
+        Returns the number of rows updated.
+        """
         self.__initcheck()
-        if data:
-            for i, rn in enumerate(data.rowNumbers):
-                for col in data.columns:
-                    getattr(self.__mea.cols, col.name)[rn] = col.values[i]
+        if not data or data.rowNumbers is None or len(data.rowNumbers) == 0:
+            return 0
+        rowNumbers = numpy.asarray(data.rowNumbers, dtype=numpy.int64)
+        for col in data.columns:
+            if len(col.values) != len(rowNumbers):
+                raise omero.ValidationException(
+                    None, None, "Column %s has %s values for %s rows" % (
+                        col.name, len(col.values), len(rowNumbers)))
+
+        order = numpy.argsort(rowNumbers, kind="stable")
+        rows = rowNumbers[order]
+        last = numpy.ones(len(rows), dtype=bool)
+        last[:-1] = rows[1:] != rows[:-1]
+        rows = rows[last]
+        order = order[last]
+        breaks = numpy.flatnonzero(numpy.diff(rows) != 1) + 1
+        starts = numpy.concatenate(([0], breaks))
+        stops = numpy.concatenate((breaks, [len(rows)]))
+
+        for col in data.columns:
+            values = numpy.asarray(col.values)
+            if values.dtype.kind == "U":
+                values = numpy.char.encode(values, "utf-8")
+            values = values[order]
+            for start, stop in zip(starts, stops):
+                self.__mea.modify_column(
+                    start=int(rows[start]), stop=int(rows[stop - 1]) + 1,
+                    column=values[start:stop], colname=col.name)
+        return len(rows)
 
     @stamped
+    @hdf5locked
     def getWhereList(self, stamp, condition, variables, unused,
                      start, stop, step):
         self.__initcheck()
+        cachekey = QUERYCACHE.key(self.__hdf_path, condition, variables,
+                                  start, stop, step, self._stamp)
+        rows = QUERYCACHE.get(cachekey)
+        if rows is not None:
+            return rows.tolist()
         try:
             condvars = variables
             if variables:
                 for key, value in condvars.items():
                     if isinstance(value, str):
                         condvars[key] = getattr(self.__mea.cols, value)
-            return self.__mea.get_where_list(condition, condvars, None,
-                                             start, stop, step).tolist()
+            rows = self.__mea.get_where_list(condition, condvars, None,
+                                             start, stop, step)
         except (NameError, SyntaxError, TypeError, ValueError) as err:
             aue = omero.ApiUsageException()
             aue.message = "Bad condition: %s, %s" % (condition, variables)
             aue.serverStackTrace = "".join(traceback.format_exc())
             aue.serverExceptionClass = str(err.__class__.__name__)
             raise aue
+        QUERYCACHE.put(cachekey, rows)
+        return rows.tolist()
 
     def _as_data(self, cols, rowNumbers):
         """
         Constructs a omero.grid.Data object for returning to the client.
         """
         data = omero.grid.Data()
-        data.columns = cols
+        data.columns = [col.marshal() for col in cols]
         data.rowNumbers = rowNumbers
         # Convert to millis since epoch
         data.lastModification = int(self._stamp * 1000)
         return data
 
     @stamped
-    def readCoordinates(self, stamp, rowNumbers, current):
+    def readCoordinates(self, stamp, rowNumbers, current, colNumbers=None):
         self.__initcheck()
-        self.__sizecheck(None, rowNumbers)
-        cols = self.cols(None, current)
-        for col in cols:
-            col.readCoordinates(self.__mea, rowNumbers)
+        with self._hdf5lock:
+            self.__sizecheck(colNumbers, rowNumbers)
+            cols = self.cols(None, current, colNumbers)
+            for col in cols:
+                col.readCoordinates(self.__mea, rowNumbers)
+        # Converting the values does not need the HDF5 lock
         return self._as_data(cols, rowNumbers)
 
     @stamped
-    def read(self, stamp, colNumbers, start, stop, current):
+    def read(self, stamp, colNumbers, start, stop, current,
+             row_numbers=True):
+        """
+        Reads the rows [start, stop). If row_numbers is False, the row
+        numbers of the returned Data are left empty since they are
+        implied by the range.
+        """
         self.__initcheck()
-        self.__sizecheck(colNumbers, None)
-        all_cols = self.cols(None, current)
-        cols = [all_cols[i] for i in colNumbers]
-
-        for col in cols:
-            col.read(self.__mea, start, stop)
-        if start is not None and stop is not None:
-            rowNumbers = list(range(start, stop))
-        elif start is not None and stop is None:
-            rowNumbers =  list(range(start, self.__length()))
-        elif start is None and stop is None:
-            rowNumbers = list(range(self.__length()))
+        with self._hdf5lock:
+            self.__sizecheck(colNumbers, None)
+            cols = self.cols(None, current, colNumbers)
+
+            for col in cols:
+                col.read(self.__mea, start, stop)
+            if not row_numbers:
+                rowNumbers = []
+            elif start is not None and stop is not None:
+                rowNumbers = list(range(start, stop))
+            elif start is not None and stop is None:
+                rowNumbers =  list(range(start, self.__length()))
+            elif start is None and stop is None:
+                rowNumbers = list(range(self.__length()))
 
         return self._as_data(cols, rowNumbers)
 
@@ -604,19 +863,17 @@ class HdfStorage(object):
     def slice(self, stamp, colNumbers, rowNumbers, current):
         self.__initcheck()
 
-        if colNumbers is None or len(colNumbers) == 0:
-            colNumbers = list(range(self.__width()))
-        if rowNumbers is None or len(rowNumbers) == 0:
-            rowNumbers = list(range(self.__length()))
+        with self._hdf5lock:
+            if colNumbers is None or len(colNumbers) == 0:
+                colNumbers = list(range(self.__width()))
+            if rowNumbers is None or len(rowNumbers) == 0:
+                rowNumbers = list(range(self.__length()))
 
-        self.__sizecheck(colNumbers, rowNumbers)
-        cols = self.cols(None, current)
-        rv = []
-        for i in colNumbers:
-            col = cols[i]
-            col.readCoordinates(self.__mea, rowNumbers)
-            rv.append(col)
-        return self._as_data(rv, rowNumbers)
+            self.__sizecheck(colNumbers, rowNumbers)
+            cols = self.cols(None, current, colNumbers)
+            for col in cols:
+                col.readCoordinates(self.__mea, rowNumbers)
+        return self._as_data(cols, rowNumbers)
 
     #
     # Lifecycle methods
@@ -626,6 +883,7 @@ class HdfStorage(object):
         return True
 
     @locked
+    @hdf5locked
     def cleanup(self):
         self.logger.info("Cleaning storage: %s", self.__hdf_path)
         if self.__mea:
@@ -634,6 +892,7 @@ class HdfStorage(object):
             self.__ome = None
         if self.__hdf_file:
             HDFLIST.remove(self.__hdf_path, self.__hdf_file)
+        self.invalidate()
         hdffile = self.__hdf_file
         self.__hdf_file = None
         hdffile.close()  # Resources freed
@@ -63,6 +63,51 @@ def readlink(file=sys.argv[0]):
     return file
 
 
+def forward(socket_path, args):
+    """
+    Sends the command to a CLI server started with "omero shell --server"
+    and prints its output. Returns the exit code of the command or None if
+    it should be run locally. Only the standard library is used here so
+    that forwarded invocations do not pay for importing omero.
+    """
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX") or not args or args[0] == "shell":
+        return None
+    if [a for a in args if a.split("=")[0] == "--path"]:
+        return None  # Plugins of this invocation only
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            conn.connect(socket_path)
+        except (IOError, OSError):
+            return None  # No server, run locally
+        env = dict((k, v) for k, v in os.environ.items()
+                   if k.startswith("OMERO"))
+        request = {"argv": args, "cwd": os.getcwd(), "env": env}
+        conn.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        chunks = []
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        conn.close()
+
+    try:
+        reply = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        print("CLI server at %s closed the connection" % socket_path,
+              file=sys.stderr)
+        return 1
+    sys.stdout.write(reply["out"])
+    sys.stderr.write(reply["err"])
+    return reply["rc"]
+
+
 def main():
     not_root()
 
@@ -86,6 +131,16 @@ def main():
     if len(sys.argv) == 2 and sys.argv[1] == "":
         sys.exit(0)
 
+    #
+    # Warm mode. If a server was started with "omero shell --server",
+    # hand the command over to it.
+    #
+    socket_path = os.environ.get("OMERO_CLI_SOCKET")
+    if socket_path and "-" not in os.path.basename(sys.argv[0]):
+        rv = forward(socket_path, sys.argv[1:])
+        if rv is not None:
+            sys.exit(rv)
+
     #
     # Primary activity: import omero.cli and launch
     # catching any Ctrl-Cs from the user
@@ -437,6 +437,17 @@ location.
                 help="omero.data.dir directory value e.g. /OMERO")
             x.add_login_arguments()
 
+        cleanse.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Number of files to check against the database at once")
+        cleanse.add_argument(
+            "--workers", type=int, default=1,
+            help="Number of threads listing directories in parallel")
+        cleanse.add_argument(
+            "--checkpoint",
+            help="File recording progress. An interrupted run continues "
+            "where it stopped if the same file is passed again")
+
         removepyramids.add_argument(
             "--dry-run", action="store_true",
             help="Print out which files would be deleted")
@@ -1964,7 +1975,8 @@ present, the user will enter a console""")
         self.check_access()
         from omero.util.cleanse import cleanse
         cleanse(data_dir=args.data_dir, client=self.ctx.conn(args),
-                dry_run=args.dry_run)
+                dry_run=args.dry_run, batch_size=args.batch_size,
+                workers=args.workers, checkpoint=args.checkpoint)
 
     @admin_only(full_admin=False)
     def log(self, args):
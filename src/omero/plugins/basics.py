@@ -21,6 +21,7 @@ from __future__ import print_function
 
 from past.builtins import cmp
 from glob import glob
+import os
 import sys
 
 from collections import defaultdict
@@ -127,6 +128,15 @@ class ShellControl(BaseControl):
         parser.add_argument(
             "--login", action="store_true",
             help="Logins in and sets the 'client' variable")
+        parser.add_argument(
+            "--server", action="store_true",
+            help="Instead of starting IPython, run the commands of other "
+            "omero invocations with OMERO_CLI_SOCKET set, keeping plugins "
+            "and sessions loaded")
+        parser.add_argument(
+            "--socket",
+            help="Unix socket for --server (default: OMERO_CLI_SOCKET or "
+            "cli.sock in the OMERO user directory)")
         parser.add_argument("arg", nargs="*", help="Arguments for IPython.")
         parser.set_defaults(func=self.__call__)
 
@@ -134,6 +144,9 @@ class ShellControl(BaseControl):
         """
         Copied from IPython embed-short example
         """
+        if args.server:
+            return self.server(args)
+
         import logging
         logging.basicConfig()
         from omero.util.upgrade_check import UpgradeCheck
@@ -157,6 +170,17 @@ class ShellControl(BaseControl):
             ipshell = IPShellEmbed(args.arg)
             ipshell(local_ns=ns)
 
+    def server(self, args):
+        import socket
+        from omero.cli import CLIServer, CLI_SOCKET
+        from omero.util import get_omero_userdir
+        if not hasattr(socket, "AF_UNIX"):
+            self.ctx.die(1, "Unix sockets are not supported")
+        socket_path = args.socket or os.environ.get(CLI_SOCKET)
+        if not socket_path:
+            socket_path = get_omero_userdir() / "cli.sock"
+        CLIServer(self.ctx, socket_path).serve()
+
 HELP_USAGE = """usage: %(program_name)s <command> [options] args
 See 'help <command>' or '<command> -h' for more information on syntax
 Type 'quit' to exit
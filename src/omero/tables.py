@@ -15,6 +15,7 @@ from future.utils import native_str
 from past.utils import old_div
 import Ice
 import time
+import threading
 import traceback
 
 import omero  # Do we need both??
@@ -27,6 +28,7 @@ from omero import LockTimeout
 from omero.rtypes import rstring
 from omero.rtypes import unwrap
 from omero.util.decorators import remoted, perf
+from omero.util.table_utils import ROW_NUMBERS
 
 
 sys = __import__("sys")  # Python sys
@@ -46,6 +48,77 @@ def slen(rv):
     return len(rv)
 
 
+class TimedCache(object):
+
+    """
+    Small thread-safe cache whose entries expire after ttl seconds.
+    A ttl of 0 disables the cache.
+    """
+
+    def __init__(self, ttl=10, maxsize=10000):
+        self._lock = threading.RLock()
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.__entries = {}
+
+    def get(self, key, loader):
+        """
+        Returns the value for key, calling loader() to create it if it
+        is missing or has expired. loader() is called without holding
+        the lock so that slow lookups do not block each other.
+        """
+        if self.ttl <= 0:
+            return loader()
+        with self._lock:
+            try:
+                value, expires = self.__entries[key]
+                if expires > time.time():
+                    return value
+            except KeyError:
+                pass
+        value = loader()
+        with self._lock:
+            now = time.time()
+            if len(self.__entries) >= self.maxsize:
+                self.__entries = dict(
+                    (k, v) for k, v in self.__entries.items() if v[1] > now)
+                if len(self.__entries) >= self.maxsize:
+                    self.__entries.clear()
+            self.__entries[key] = (value, now + self.ttl)
+        return value
+
+
+class SweepCache(object):
+
+    """
+    Cache whose entries only last for one sweep of a Resources instance,
+    so that the resources checked in the same sweep share lookups.
+    Nothing is stored if the loader raises.
+    """
+
+    def __init__(self, resources):
+        self._lock = threading.RLock()
+        self.resources = resources
+        self.__sweep = None
+        self.__entries = {}
+
+    def get(self, key, loader):
+        sweep = self.resources.getMetrics()["sweeps"]
+        with self._lock:
+            if sweep != self.__sweep:
+                self.__entries.clear()
+                self.__sweep = sweep
+            try:
+                return self.__entries[key]
+            except KeyError:
+                pass
+        value = loader()
+        with self._lock:
+            if sweep == self.__sweep:
+                self.__entries[key] = value
+        return value
+
+
 class TableI(omero.grid.Table, omero.util.SimpleServant):
 
     """
@@ -53,7 +126,8 @@ class TableI(omero.grid.Table, omero.util.SimpleServant):
     """
 
     def __init__(self, ctx, file_obj, file_path, factory, storage_factory, read_only=False, uuid="unknown",
-                 call_context=None, adapter=None):
+                 call_context=None, adapter=None, can_write=None,
+                 session_cache=None):
         self.id = Ice.Identity()
         self.id.name = uuid
         self.uuid = uuid
@@ -62,8 +136,15 @@ class TableI(omero.grid.Table, omero.util.SimpleServant):
         self.storage = storage_factory.getOrCreate(file_path, self, read_only)
         self.call_context = call_context
         self.adapter = adapter
-        self.can_write = factory.getAdminService().canUpdate(
-            file_obj, call_context)
+        if can_write is None:
+            can_write = factory.getAdminService().canUpdate(
+                file_obj, call_context)
+        self.can_write = can_write
+        # Shared between tables so that each client session is only
+        # looked up once per sweep of the Resources thread, see SweepCache
+        if session_cache is None:
+            session_cache = TimedCache(0)
+        self.session_cache = session_cache
         omero.util.SimpleServant.__init__(self, ctx)
 
         self.stamp = time.time()
@@ -99,21 +180,31 @@ class TableI(omero.grid.Table, omero.util.SimpleServant):
 
         idname = 'UNKNOWN'
         try:
-            # Quietly loading the session will mean that the last access
-            # time will not be incremented so that dangling files can be
-            # cleaned up. Note: this is different that the strategy of a
-            # script which *wants* to keep its session alive.
             idname = self.factory.ice_getIdentity().name
-            clientSession = self.ctx.getSession().getSessionService() \
-                .getSession(idname, {"quietly": "true"})
-            if clientSession.getClosed():
-                self.logger.debug("Client session closed: %s" % idname)
-                return False
-            return True
         except Exception:
             self.logger.debug("Client session not found: %s" % idname)
             return False
 
+        try:
+            alive = self.session_cache.get(
+                idname, lambda: self._session_alive(idname))
+        except Exception:
+            # Not cached so that the other tables of the session retry
+            self.logger.debug("Client session not found: %s" % idname)
+            return False
+        if not alive:
+            self.logger.debug("Client session closed: %s" % idname)
+        return alive
+
+    def _session_alive(self, idname):
+        # Quietly loading the session will mean that the last access
+        # time will not be incremented so that dangling files can be
+        # cleaned up. Note: this is different that the strategy of a
+        # script which *wants* to keep its session alive.
+        clientSession = self.ctx.getSession().getSessionService() \
+            .getSession(idname, {"quietly": "true"})
+        return not clientSession.getClosed()
+
     def cleanup(self):
         """
         Decrements the counter on the held storage to allow it to
@@ -249,9 +340,14 @@ class TableI(omero.grid.Table, omero.util.SimpleServant):
         self.logger.info("%s.read(%s, %s, %s)", self, colNumbers, start, stop)
         if start == 0 and stop == 0:
             stop = None
+        # Chunked readers (see omero.util.table_utils.read_chunks) know
+        # which rows they asked for and can skip the row numbers
+        row_numbers = "false" != (current and current.ctx or {}).get(
+            ROW_NUMBERS, "true").lower()
         try:
             return self.storage.read(self.stamp, colNumbers,
-                                     start, stop, current)
+                                     start, stop, current,
+                                     row_numbers=row_numbers)
         except tables.HDF5ExtError as err:
             aue = omero.ApiUsageException()
             aue.message = "Error reading coordinates. Most likely out of range"
@@ -297,9 +393,9 @@ class TableI(omero.grid.Table, omero.util.SimpleServant):
     def update(self, data, current=None):
         self.assert_write()
         if data:
-            self.storage.update(self.stamp, data)
+            rv = self.storage.update(self.stamp, data)
             self.logger.info(
-                "Updated %s row(s) of data to %s", slen(data.rowNumbers), self)
+                "Updated %s row(s) of data to %s", rv, self)
 
     @remoted
     @perf
@@ -395,11 +491,35 @@ class TablesI(omero.grid.Tables, omero.util.Servant):
 
         self.__stores = []
 
+        props = self.communicator.getProperties()
         if storage_factory is None:
-            from omero.hdfstorageV2 import HDFLIST
+            from omero.hdfstorageV2 import HDFLIST, QUERYCACHE
             self._storage_factory = HDFLIST
+            # Only if libhdf5 was built with --enable-threadsafe. The default
+            # keeps a single HDF5 lock, that of HDFLIST, for all files.
+            # Readers of a file still share its read lock either way.
+            HDFLIST.threadsafe = "true" == props.getPropertyWithDefault(
+                "omero.tables.hdf5.threadsafe", "false").lower()
+            # Bytes of getWhereList results to keep, 0 disables the cache
+            QUERYCACHE.maxbytes = props.getPropertyAsIntWithDefault(
+                "omero.tables.query_cache.size", QUERYCACHE.maxbytes)
+            # Read-only files to keep open after their last table closed
+            HDFLIST.pool_size = props.getPropertyAsIntWithDefault(
+                "omero.tables.pool.size", 16)
         else:
             self._storage_factory = storage_factory
+
+        # Seconds to remember file paths and permissions, 0 disables this
+        ttl = props.getPropertyAsIntWithDefault("omero.tables.cache.ttl", 10)
+        self._paths = TimedCache(ttl)
+        self._can_update = TimedCache(ttl)
+        self._sessions = SweepCache(self.resources)
+
+        # Spread the periodic table checks over the sleep interval
+        self.resources.buckets = props.getPropertyAsIntWithDefault(
+            "omero.tables.check.buckets", 6)
+        self.resources.workers = props.getPropertyAsIntWithDefault(
+            "omero.tables.check.workers", 4)
         self.logger.info("Using storage factory: %s.%s",
                          str(self._storage_factory.__module__),
                          self._storage_factory.__class__.__name__)
@@ -506,6 +626,17 @@ class TablesI(omero.grid.Tables, omero.util.Servant):
         self.repo_mgr = self._internal_repo_cast(self.repo_mgr)
         self.repo_svc = self.repo_mgr.getProxy()
 
+    def cleanup(self):
+        """
+        Also closes any files which were kept open for re-use
+        """
+        try:
+            omero.util.Servant.cleanup(self)
+        finally:
+            from omero.hdfstorageV2 import HDFLIST
+            if getattr(self, "_storage_factory", None) is HDFLIST:
+                HDFLIST.drain()
+
     @remoted
     def getRepository(self, current=None):
         """
@@ -526,18 +657,33 @@ class TablesI(omero.grid.Tables, omero.util.Servant):
             file_id = file_obj.id.val
         self.logger.info("getTable: %s %s", file_id, current.ctx)
 
-        file_path = self.repo_mgr.getFilePath(file_obj)
+        if file_id is None:
+            file_path = self.repo_mgr.getFilePath(file_obj)
+        else:
+            file_path = self._paths.get(
+                file_id, lambda: self.repo_mgr.getFilePath(file_obj))
         p = path(file_path).dirname()
         if not p.exists():
             p.makedirs()
 
+        # Permissions depend on the session and its context
+        can_write = None
+        if file_id is not None:
+            key = (factory.ice_getIdentity().name, file_id,
+                   tuple(sorted((current.ctx or {}).items())))
+            can_write = self._can_update.get(
+                key, lambda: factory.getAdminService().canUpdate(
+                    file_obj, current.ctx))
+
         table = TableI(self.ctx, file_obj,file_path,
                        factory,
                        self._storage_factory,
                        read_only=self.read_only,
                        uuid=Ice.generateUUID(),
                        call_context=current.ctx,
-                       adapter=current.adapter)
+                       adapter=current.adapter,
+                       can_write=can_write,
+                       session_cache=self._sessions)
         self.resources.add(table)
         prx = current.adapter.add(table, table.id)
         return self._table_cast(prx)
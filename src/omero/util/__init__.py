@@ -24,6 +24,7 @@ import logging
 import platform
 import Glacier2
 import threading
+import time
 import logging.handlers
 import omero.util.concurrency
 import uuid
@@ -622,7 +623,7 @@ class Resources(object):
     stop_event.set() to stop the internal thread.
     """
 
-    def __init__(self, sleeptime=60, stop_event=None):
+    def __init__(self, sleeptime=60, stop_event=None, buckets=1, workers=1):
         """
         Add resources via add(object). They should have a no-arg cleanup()
         and a check() method.
@@ -630,6 +631,12 @@ class Resources(object):
         The check method will be called periodically (default: 60 seconds)
         on each resource. The cleanup method will be called on
         Resources.cleanup()
+
+        To spread the load, resources are assigned round-robin to one of
+        "buckets" groups and one group is checked every sleeptime/buckets
+        seconds, using up to "workers" threads. Both values may be changed
+        while running. Timings of the sweeps are available from
+        getMetrics().
         """
 
         self.stuff = []
@@ -645,6 +652,17 @@ class Resources(object):
                 "Sleep time should be greater than 5: %s" % sleeptime)
 
         self.sleeptime = sleeptime
+        self.buckets = buckets
+        self.workers = workers
+        self._added = 0
+        self._bucket = 0
+        self.metrics = {
+            "sweeps": 0,
+            "checked": 0,
+            "removed": 0,
+            "last_seconds": 0.0,
+            "max_seconds": 0.0,
+        }
 
         class Task(threading.Thread):
 
@@ -658,17 +676,17 @@ class Resources(object):
                 while not ctx.stop_event.isSet():
                     try:
                         ctx.logger.debug("Executing")
-                        copy = ctx.copyStuff()
-                        remove = ctx.checkAll(copy)
-                        ctx.removeAll(remove)
+                        ctx.sweep()
                     except:
                         ctx.logger.error(
                             "Exception during execution", exc_info=True)
 
-                    ctx.logger.debug("Sleeping %s" % ctx.sleeptime)
+                    wait = old_div(float(ctx.sleeptime),
+                                   max(int(ctx.buckets), 1))
+                    ctx.logger.debug("Sleeping %s" % wait)
                     # ticket:1531 - Attempting to catch threading issues
                     try:
-                        ctx.stop_event.wait(ctx.sleeptime)
+                        ctx.stop_event.wait(wait)
                     except ValueError:
                         pass
 
@@ -683,6 +701,44 @@ class Resources(object):
         self.thread.ctx = self
         self.thread.start()
 
+    def sweep(self):
+        """
+        Checks the next bucket of resources, cleans up those which
+        are no longer needed and records the timings.
+        """
+        start = time.time()
+        buckets = max(int(self.buckets), 1)
+        bucket = self._bucket % buckets
+        self._bucket = bucket + 1
+        copy = [m for m in self.copyStuff() if m[3] % buckets == bucket]
+        remove = self.checkAll(copy)
+        if remove is None:
+            return  # Stopped
+        self.removeAll(remove)
+        elapsed = time.time() - start
+        with self._lock:
+            metrics = self.metrics
+            metrics["sweeps"] += 1
+            metrics["checked"] += len(copy)
+            metrics["removed"] += len(remove)
+            metrics["last_seconds"] = elapsed
+            metrics["max_seconds"] = max(metrics["max_seconds"], elapsed)
+        self.logger.debug("Checked %s resource(s) in %.3fs, removed %s",
+                          len(copy), elapsed, len(remove))
+        if elapsed * buckets > self.sleeptime:
+            self.logger.warn(
+                "Checking %s resource(s) took %.1fs, longer than %ss/%s",
+                len(copy), elapsed, self.sleeptime, buckets)
+
+    @locked
+    def getMetrics(self):
+        """
+        Returns a copy of the sweep metrics: the number of sweeps, of
+        resources checked and removed, and the duration of the last and
+        of the longest sweep in seconds.
+        """
+        return dict(self.metrics)
+
     @locked
     def copyStuff(self):
         """
@@ -695,6 +751,22 @@ class Resources(object):
         copy.reverse()
         return copy
 
+    def checkOne(self, m):
+        """
+        Calls the check method of a single entry and returns whether
+        it should be kept. Not called once stop_event is set.
+        """
+        if self.stop_event.isSet():
+            return True  # Let cleanup handle this
+        self.logger.debug("Checking %s" % m[0])
+        method = getattr(m[0], m[2])
+        rv = None
+        try:
+            rv = method()
+        except:
+            self.logger.warn("Error from %s" % method, exc_info=True)
+        return rv
+
     # Not locked
     def checkAll(self, copy):
         """
@@ -702,21 +774,23 @@ class Resources(object):
         of stuff and call the check method on each
         entry. Any that throws an exception or returns
         a False value will be returned in the remove list.
+        If workers is greater than 1, entries are checked
+        in parallel.
         """
-        remove = []
-        for m in copy:
-            if self.stop_event.isSet():
-                return  # Let cleanup handle this
-            self.logger.debug("Checking %s" % m[0])
-            method = getattr(m[0], m[2])
-            rv = None
-            try:
-                rv = method()
-            except:
-                self.logger.warn("Error from %s" % method, exc_info=True)
-            if not rv:
-                remove.append(m)
-        return remove
+        workers = int(self.workers)
+        if workers > 1 and len(copy) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self.checkOne, copy))
+        else:
+            results = []
+            for m in copy:
+                if self.stop_event.isSet():
+                    break
+                results.append(self.checkOne(m))
+        if self.stop_event.isSet():
+            return  # Let cleanup handle this
+        return [m for m, rv in zip(copy, results) if not rv]
 
     @locked
     def removeAll(self, remove):
@@ -736,7 +810,8 @@ class Resources(object):
 
     @locked
     def add(self, object, cleanupMethod="cleanup", checkMethod="check"):
-        entry = (object, cleanupMethod, checkMethod)
+        entry = (object, cleanupMethod, checkMethod, self._added)
+        self._added += 1
         self.logger.debug("Adding object %s" % object)
         self.stuff.append(entry)
 
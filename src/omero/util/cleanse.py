@@ -35,6 +35,7 @@ import omero.clients
 import omero
 import sys
 import os
+import json
 import getpass
 import Ice
 
@@ -84,46 +85,140 @@ class Cleanser(object):
     """
     Keeps file cleansing state and performs OMERO database reconciliation of
     files within an OMERO binary repository.
+
+    Files are visited in sorted order of their path below the root so that
+    an interrupted run can be resumed from a checkpoint file, which records
+    the last path reconciled for each object type. If workers is greater
+    than 1, directory listings are read ahead by a pool of threads.
     """
 
     # Number of objects to defer before we actually make a query
-    QUERY_THRESHOLD = 25
+    QUERY_THRESHOLD = 1000
 
     # Strings identifying pyramid files
     PYRAMID_FILE = "_pyramid"
     PYRAMID_LOCK = ".pyr_lock"
     PYRAMID_TEMP = ".tmp"
 
-    def __init__(self, query_service, object_type):
+    def __init__(self, query_service, object_type, batch_size=None,
+                 workers=1, checkpoint=None):
         self.query_service = query_service
         self.object_type = object_type
+        self.batch_size = batch_size or self.QUERY_THRESHOLD
+        self.workers = workers
+        self.checkpoint = checkpoint
         self.cleansed = list()
         self.bytes_cleansed = 0
         self.deferred_paths = list()
         self.dry_run = False
+        self.root = None
+        self.resume_after = None
 
     def cleanse(self, root):
         """
         Begins a cleansing operation from a given OMERO binary repository
         root directory. /OMERO/Files or /OMERO/Pixels for instance.
         """
-        for file in os.listdir(root):
-            path = os.path.join(root, file)
-            if os.path.isdir(path):
-                self.cleanse(path)
-            else:
+        self.root = root
+        state = self.load_checkpoint().get(self.object_type)
+        if state is True:
+            if self.dry_run:
+                print("   \\_ %s (already done)" % root)
+            return
+        self.resume_after = tuple(state) if state else None
+
+        executor = None
+        if self.workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            for path in self.walk(root, executor):
                 self.query_or_defer(path)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    @staticmethod
+    def scan(directory):
+        """
+        Returns the sorted (name, is_dir) entries of a directory
+        """
+        with os.scandir(directory) as it:
+            return sorted(
+                (e.name, e.is_dir(follow_symlinks=False)) for e in it)
+
+    def walk(self, root, executor=None):
+        """
+        Generator of the file paths below root in sorted order, skipping
+        those up to and including the path to resume after, if any.
+        While a directory is being processed, executor (if given) lists
+        its subdirectories in the background.
+        """
+        def listing(directory):
+            if executor is None:
+                return self.scan(directory)
+            return executor.submit(self.scan, directory)
+
+        def visit(directory, parts, entries):
+            if executor is not None:
+                entries = entries.result()
+            entries = [(name, is_dir, parts + (name,))
+                       for name, is_dir in entries]
+            if self.resume_after:
+                entries = [e for e in entries if self._pending(e[2])]
+            pending = dict(
+                (name, listing(os.path.join(directory, name)))
+                for name, is_dir, key in entries if is_dir)
+            for name, is_dir, key in entries:
+                path = os.path.join(directory, name)
+                if is_dir:
+                    for p in visit(path, key, pending.pop(name)):
+                        yield p
+                else:
+                    yield path
+
+        return visit(root, (), listing(root))
+
+    def _pending(self, key):
+        """
+        Whether the file or directory with the given path components
+        still needs to be visited when resuming
+        """
+        done = self.resume_after
+        return key > done or key == done[:len(key)] and len(key) < len(done)
 
     def query_or_defer(self, path):
         """
         Adds a given path to the list of deferred paths. If the number of
-        deferred paths has reached the QUERY_THRESHOLD (to reduce database
+        deferred paths has reached the batch size (to reduce database
         hits) a reconciliation check will happen against OMERO.
         """
         self.deferred_paths.append(path)
-        if len(self.deferred_paths) == self.QUERY_THRESHOLD:
+        if len(self.deferred_paths) >= self.batch_size:
             self.do_cleanse()
 
+    def object_id(self, file_name):
+        """
+        Returns the id of the object a repository file belongs to, or -1
+        if the file should be ignored.
+        """
+        try:
+            return int(file_name)
+        except ValueError:
+            pass
+        if self.PYRAMID_FILE not in file_name:
+            return -1
+        id_part = file_name.split("_")[0]
+        try:
+            if file_name.endswith(self.PYRAMID_FILE):
+                return int(id_part)
+            elif (file_name.endswith(self.PYRAMID_LOCK)
+                    or file_name.endswith(self.PYRAMID_TEMP)):
+                return int(id_part.lstrip('.'))
+        except ValueError:
+            pass
+        return -1
+
     def do_cleanse(self):
         """
         Actually performs the reconciliation check against OMERO and
@@ -132,55 +227,70 @@ class Cleanser(object):
         if len(self.deferred_paths) == 0:
             return
         split = os.path.split
-        object_ids = []
-        for path in self.deferred_paths:
-            file_name = split(path)[1]
-            try:
-                object_id = omero.rtypes.rlong(int(file_name))
-            except ValueError:
-                try:
-                    file_name.index(self.PYRAMID_FILE)
-                    id_part = file_name.split("_")[0]
-                    if file_name.endswith(self.PYRAMID_FILE):
-                        object_id = omero.rtypes.rlong(int(id_part))
-                    elif (file_name.endswith(self.PYRAMID_LOCK)
-                            or file_name.endswith(self.PYRAMID_TEMP)):
-                        object_id = omero.rtypes.rlong(
-                            int(id_part.lstrip('.')))
-                    else:
-                        object_id = omero.rtypes.rlong(-1)
-                except ValueError:
-                    object_id = omero.rtypes.rlong(-1)
-            object_ids.append(object_id)
-
-        parameters = omero.sys.Parameters()
-        parameters.map = {'ids': omero.rtypes.rlist(object_ids)}
-        rows = self.query_service.projection(
-            "select o.id from %s as o where o.id in (:ids)" % self.object_type,
-            parameters, {"omero.group": "-1"})
-        existing_ids = [cols[0].val for cols in rows]
-
-        for i, object_id in enumerate(object_ids):
-            path = self.deferred_paths[i]
-            if object_id.val not in existing_ids:
-                if object_id.val == -1:
+        object_ids = [self.object_id(split(path)[1])
+                      for path in self.deferred_paths]
+
+        query_ids = set(object_ids)
+        query_ids.discard(-1)
+        existing_ids = set()
+        if query_ids:
+            parameters = omero.sys.Parameters()
+            parameters.map = {'ids': omero.rtypes.rlist(
+                [omero.rtypes.rlong(x) for x in sorted(query_ids)])}
+            rows = self.query_service.projection(
+                "select o.id from %s as o where o.id in (:ids)"
+                % self.object_type, parameters, {"omero.group": "-1"})
+            existing_ids = set(cols[0].val for cols in rows)
+
+        for path, object_id in zip(self.deferred_paths, object_ids):
+            if object_id not in existing_ids:
+                if object_id == -1:
                     if self.dry_run:
-                        print("   \_ %s (ignored/keep)" % path)
+                        print("   \\_ %s (ignored/keep)" % path)
                 else:
                     size = os.stat(path)[ST_SIZE]
                     self.cleansed.append(path)
-                    self.bytes_cleansed = size
+                    self.bytes_cleansed += size
                     if self.dry_run:
-                        print("   \_ %s (remove)" % path)
+                        print("   \\_ %s (remove)" % path)
                     else:
                         try:
                             os.unlink(path)
                         except OSError as e:
                             print(e)
             elif self.dry_run:
-                print("   \_ %s (keep)" % path)
+                print("   \\_ %s (keep)" % path)
+        self.save_checkpoint(self.deferred_paths[-1])
         self.deferred_paths = list()
 
+    def load_checkpoint(self):
+        """
+        Returns the state stored in the checkpoint file, mapping object
+        types to the path components of the last file reconciled or to
+        True once the whole directory has been reconciled.
+        """
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return {}
+        with open(self.checkpoint) as f:
+            return json.load(f)
+
+    def save_checkpoint(self, last_path=None):
+        """
+        Records last_path as reconciled, or the whole object type if None
+        """
+        if not self.checkpoint or self.dry_run:
+            return
+        state = self.load_checkpoint()
+        if last_path is None:
+            state[self.object_type] = True
+        else:
+            rel = os.path.relpath(last_path, self.root)
+            state[self.object_type] = rel.split(os.sep)
+        tmp = self.checkpoint + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.checkpoint)
+
     def finalize(self):
         """
         Takes the final set of deferred paths and performs a reconciliation
@@ -189,6 +299,8 @@ class Cleanser(object):
         any cleanup.
         """
         self.do_cleanse()
+        if self.root is not None:
+            self.save_checkpoint()
 
     def __str__(self):
         return "Cleansing context: %d files (%d bytes)" % \
@@ -219,7 +331,15 @@ def initial_check(config_service, admin_service=None):
         sys.exit(3)
 
 
-def cleanse(data_dir, client, dry_run=False):
+def cleanse(data_dir, client, dry_run=False, batch_size=None, workers=1,
+            checkpoint=None):
+    """
+    Removes the files of the data directory which have no matching object
+    in the database, see Cleanser. If checkpoint is given, progress is
+    recorded in that file so that an interrupted run can be resumed by
+    passing the same file again. It is removed once all directories have
+    been reconciled.
+    """
     client.getImplicitContext().put(omero.constants.GROUP, '-1')
 
     admin_service = client.sf.getAdminService()
@@ -238,7 +358,9 @@ def cleanse(data_dir, client, dry_run=False):
             if dry_run:
                 print("Reconciling OMERO data directory...\n %s" % full_path)
             object_type = SEARCH_DIRECTORIES[directory]
-            cleanser = Cleanser(query_service, object_type)
+            cleanser = Cleanser(query_service, object_type,
+                                batch_size=batch_size, workers=workers,
+                                checkpoint=checkpoint)
             cleanser.dry_run = dry_run
             cleanser.cleanse(full_path)
             cleanser.finalize()
@@ -246,6 +368,9 @@ def cleanse(data_dir, client, dry_run=False):
         if dry_run:
             print(cleanser)
 
+    if checkpoint and not dry_run and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
     # delete empty directories from the managed repositories
     proxy, description = client.getManagedRepository(description=True)
     if proxy:
@@ -116,3 +116,78 @@ class Timer(_Timer):
                     self.finished.set()
                     raise
             break
+
+
+class ReadWriteLock(object):
+
+    """
+    Lock which can be held either by any number of readers or by a
+    single writer.
+
+    acquire() and release() take the lock for writing, so that it can be
+    used with omero.util.decorators.locked, while acquire_read() and
+    release_read() are used by omero.util.decorators.read_locked. Both
+    are reentrant and the writer may also take the lock for reading.
+    Waiting writers are preferred over new readers.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = {}
+        self._writer = None
+        self._writes = 0
+        self._waiting = 0
+
+    def acquire_read(self):
+        me = threading.current_thread()
+        with self._cond:
+            if self._writer is not me and me not in self._readers:
+                while self._writer is not None or self._waiting:
+                    self._cond.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+
+    def release_read(self):
+        me = threading.current_thread()
+        with self._cond:
+            count = self._readers.get(me, 0)
+            if not count:
+                raise RuntimeError("cannot release un-acquired read lock")
+            if count > 1:
+                self._readers[me] = count - 1
+            else:
+                del self._readers[me]
+                self._cond.notify_all()
+
+    def acquire(self):
+        me = threading.current_thread()
+        with self._cond:
+            if self._writer is me:
+                self._writes += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("cannot upgrade a read lock")
+            self._waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting -= 1
+            self._writer = me
+            self._writes = 1
+
+    def release(self):
+        me = threading.current_thread()
+        with self._cond:
+            if self._writer is not me:
+                raise RuntimeError("cannot release un-acquired lock")
+            self._writes -= 1
+            if not self._writes:
+                self._writer = None
+                self._cond.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
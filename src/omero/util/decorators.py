@@ -98,6 +98,22 @@ def locked(func):
     return with_lock
 
 
+def read_locked(func):
+    """
+    Decorator for sharing the self._lock argument of the calling instance,
+    which must be a :class:`omero.util.concurrency.ReadWriteLock`
+    """
+    def with_read_lock(*args, **kwargs):
+        self = args[0]
+        self._lock.acquire_read()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._lock.release_read()
+    with_read_lock = wraps(func)(with_read_lock)
+    return with_read_lock
+
+
 class TimeIt (object):
 
     """
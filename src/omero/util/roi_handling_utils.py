@@ -24,10 +24,198 @@ Utility methods for manipulating roi.
 from __future__ import division
 
 from builtins import map
-from past.utils import old_div
-from numpy import asarray, int32, zeros, hstack, vstack
-import omero.util.script_utils as script_utils
-import math
+import numpy
+
+
+def line_coordinates(points, line_w=2):
+    """
+    Returns the (y, x) coordinates at which to sample a line or polyline,
+    as two float arrays of shape (line_w, length). Samples are one pixel
+    apart along the line, starting at the first point, and line_w samples
+    are taken across it. Viewed as an image the first point is on the left.
+
+    @param points:          List of (x, y) tuples, at least two
+    @param line_w:          Width of the line we want
+    """
+    points = numpy.asarray(points, dtype=numpy.float64)
+    if points.ndim != 2 or points.shape[0] < 2 or points.shape[1] != 2:
+        raise ValueError("At least two (x, y) points are needed")
+    steps = numpy.diff(points, axis=0)
+    seg_lengths = numpy.hypot(steps[:, 0], steps[:, 1])
+    cumulative = numpy.concatenate(([0], numpy.cumsum(seg_lengths)))
+    dist = numpy.arange(int(cumulative[-1]), dtype=numpy.float64)
+
+    xs = numpy.interp(dist, cumulative, points[:, 0])
+    ys = numpy.interp(dist, cumulative, points[:, 1])
+
+    # Unit normal of the segment each sample lies on
+    seg = numpy.clip(
+        numpy.searchsorted(cumulative, dist, side="right") - 1,
+        0, len(steps) - 1)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        unit = steps / seg_lengths[:, numpy.newaxis]
+    unit = numpy.nan_to_num(unit)[seg]
+    offsets = numpy.arange(line_w) - (line_w - 1) / 2.0
+    xs = xs[numpy.newaxis, :] - offsets[:, numpy.newaxis] * unit[:, 1]
+    ys = ys[numpy.newaxis, :] + offsets[:, numpy.newaxis] * unit[:, 0]
+    return ys, xs
+
+
+def _neighbours(ys, xs, size_y, size_x):
+    """
+    Yields the (y, x) coordinates of each of the four pixels around the
+    given coordinates, with their bilinear weights and whether they lie
+    within a plane of size_y by size_x. Weights are zero outside of it.
+    """
+    y0 = numpy.floor(ys).astype(numpy.intp)
+    x0 = numpy.floor(xs).astype(numpy.intp)
+    fy = ys - y0
+    fx = xs - x0
+    for dy, wy in ((0, 1 - fy), (1, fy)):
+        for dx, wx in ((0, 1 - fx), (1, fx)):
+            yy = y0 + dy
+            xx = x0 + dx
+            inside = (yy >= 0) & (yy < size_y) & (xx >= 0) & (xx < size_x)
+            yield yy, xx, numpy.where(inside, wy * wx, 0), inside
+
+
+def _cast(rv, dtype):
+    if numpy.issubdtype(dtype, numpy.integer):
+        rv = numpy.rint(rv)
+    return rv.astype(dtype)
+
+
+def interpolate(data, ys, xs, dtype=None):
+    """
+    Bilinear interpolation of data at the given coordinates. The last two
+    axes of data are Y and X, any leading axes (e.g. planes) are kept.
+    Coordinates outside of data are treated as zeros.
+
+    @param data:            numpy array of shape (..., Y, X)
+    @param ys, xs:          float arrays of coordinates of the same shape
+    @param dtype:           Type of the result, that of data if None.
+                            Integer results are rounded.
+    """
+    if dtype is None:
+        dtype = data.dtype
+    size_y, size_x = data.shape[-2:]
+    rv = numpy.zeros(data.shape[:-2] + ys.shape, dtype=numpy.float64)
+    for yy, xx, weight, inside in _neighbours(ys, xs, size_y, size_x):
+        values = data[..., numpy.clip(yy, 0, size_y - 1),
+                      numpy.clip(xx, 0, size_x - 1)]
+        rv += values * weight
+    return _cast(rv, dtype)
+
+
+def line_tiles(ys, xs, size_x, size_y, tile_size):
+    """
+    Finds the tiles to fetch to interpolate at the given coordinates, see
+    get_polyline_data. The plane is divided into cells of tile_size and
+    for each cell holding pixels next to the coordinates, the tile
+    bounding those pixels is returned. For a diagonal or bent line these
+    cover much less than the bounding box of the line.
+
+    Returns the list of tiles as (x, y, width, height) and, for each of
+    the four neighbours used by the interpolation, a pair of arrays of
+    the index of the pixel in the tiles flattened and concatenated, and
+    of its weight.
+
+    @param ys, xs:          float arrays of coordinates, see
+                            line_coordinates
+    @param size_x, size_y:  Size of the plane
+    @param tile_size:       (width, height) of the cells
+    """
+    tile_w, tile_h = tile_size
+    cells_x = -(-size_x // tile_w)
+    neighbours = list(_neighbours(ys, xs, size_y, size_x))
+    py = numpy.concatenate([yy[inside] for yy, _, _, inside in neighbours])
+    px = numpy.concatenate([xx[inside] for _, xx, _, inside in neighbours])
+    if not py.size:
+        return [], []
+
+    cells, group = numpy.unique(
+        (py // tile_h) * cells_x + px // tile_w, return_inverse=True)
+    top = numpy.full(len(cells), size_y)
+    left = numpy.full(len(cells), size_x)
+    bottom = numpy.zeros(len(cells), dtype=top.dtype)
+    right = numpy.zeros(len(cells), dtype=top.dtype)
+    numpy.minimum.at(top, group, py)
+    numpy.minimum.at(left, group, px)
+    numpy.maximum.at(bottom, group, py + 1)
+    numpy.maximum.at(right, group, px + 1)
+    width = right - left
+    offset = numpy.concatenate(([0], numpy.cumsum(width * (bottom - top))))
+    tiles = [(int(x), int(y), int(w), int(h)) for x, y, w, h
+             in zip(left, top, width, bottom - top)]
+
+    indexes = []
+    for yy, xx, weight, inside in neighbours:
+        yy = numpy.clip(yy, 0, size_y - 1)
+        xx = numpy.clip(xx, 0, size_x - 1)
+        cell = numpy.searchsorted(
+            cells, (yy // tile_h) * cells_x + xx // tile_w)
+        cell = numpy.where(inside, cell, 0)
+        index = (offset[cell] + (yy - top[cell]) * width[cell] +
+                 xx - left[cell])
+        indexes.append((numpy.where(inside, index, 0), weight))
+    return tiles, indexes
+
+
+def get_polyline_data(pixels, points, line_w=2, the_z=0, the_c=0, the_t=0,
+                      prefetch=2, tile_size=None):
+    """
+    Samples the pixel data along a line or polyline, straightened so that
+    the first point is to the left. Returns a numpy 2d array of shape
+    (line_w, length) with the pixel type of the image.
+
+    the_z and the_t may also be lists of indexes, in which case a 3d array
+    of shape (planes, line_w, length) is returned with one entry per Z
+    for each T, e.g. for building a kymograph over all timepoints. Only the
+    tiles holding pixels next to the line are fetched for each plane, see
+    line_tiles.
+
+    @param pixels:          PixelsWrapper object
+    @param points:          List of (x, y) tuples
+    @param line_w:          Width of the line we want
+    @param the_z:           Z index or indexes within pixels
+    @param the_c:           Channel index
+    @param the_t:           Time index or indexes
+    @param prefetch:        Number of tiles to request ahead, see
+                            PixelsWrapper.getTiles
+    @param tile_size:       (width, height) of the cells the tiles are
+                            fetched by, by default the tile size of the
+                            image, see PixelsWrapper.getTileSize
+    """
+    stack = isinstance(the_z, (list, tuple, range)) or \
+        isinstance(the_t, (list, tuple, range))
+    zs = the_z if isinstance(the_z, (list, tuple, range)) else [the_z]
+    ts = the_t if isinstance(the_t, (list, tuple, range)) else [the_t]
+    planes = [(z, the_c, t) for t in ts for z in zs]
+
+    ys, xs = line_coordinates(points, line_w)
+    dtype = pixels._getNumpyType()
+    rv = numpy.zeros((len(planes),) + ys.shape, dtype=dtype)
+
+    if ys.size:
+        if tile_size is None:
+            tile_size = pixels.getTileSize()
+        tiles, indexes = line_tiles(ys, xs, pixels.getSizeX(),
+                                    pixels.getSizeY(), tile_size)
+        if tiles:
+            fetched = pixels.getTiles(
+                [(z, c, t, tile) for z, c, t in planes for tile in tiles],
+                prefetch=prefetch)
+            for i in range(len(planes)):
+                values = numpy.concatenate(
+                    [next(fetched).ravel() for tile in tiles])
+                plane = numpy.zeros(ys.shape, dtype=numpy.float64)
+                for index, weight in indexes:
+                    plane += values[index] * weight
+                rv[i] = _cast(plane, dtype)
+
+    if not stack:
+        return rv[0]
+    return rv
 
 
 def get_line_data(pixels, x1, y1, x2, y2, line_w=2, the_z=0, the_c=0, the_t=0):
@@ -35,8 +223,8 @@ def get_line_data(pixels, x1, y1, x2, y2, line_w=2, the_z=0, the_c=0, the_t=0):
     Grabs pixel data covering the specified line, and rotates it horizontally
     so that x1,y1 is to the left,
     Returning a numpy 2d array. Used by Kymograph.py script.
-    Uses PIL to handle rotating and interpolating the data. Converts to numpy
-    to PIL and back (may change dtype.)
+    The data is interpolated along the line with numpy and keeps the pixel
+    type of the image, see get_polyline_data.
 
     @param pixels:          PixelsWrapper object
     @param x1, y1, x2, y2:  Coordinates of line
@@ -45,87 +233,8 @@ def get_line_data(pixels, x1, y1, x2, y2, line_w=2, the_z=0, the_c=0, the_t=0):
     @param the_c:           Channel index
     @param the_t:           Time index
     """
-
-    size_x = pixels.getSizeX()
-    size_y = pixels.getSizeY()
-
-    line_x = x2-x1
-    line_y = y2-y1
-
-    rads = math.atan2(line_x, line_y)
-
-    # How much extra Height do we need, top and bottom?
-    extra_h = abs(math.sin(rads) * line_w)
-    bottom = int(max(y1, y2) + old_div(extra_h,2))
-    top = int(min(y1, y2) - old_div(extra_h,2))
-
-    # How much extra width do we need, left and right?
-    extra_w = abs(math.cos(rads) * line_w)
-    left = int(min(x1, x2) - extra_w)
-    right = int(max(x1, x2) + extra_w)
-
-    # What's the larger area we need? - Are we outside the image?
-    pad_left, pad_right, pad_top, pad_bottom = 0, 0, 0, 0
-    if left < 0:
-        pad_left = abs(left)
-        left = 0
-    x = left
-    if top < 0:
-        pad_top = abs(top)
-        top = 0
-    y = top
-    if right > size_x:
-        pad_right = right-size_x
-        right = size_x
-    w = int(right - left)
-    if bottom > size_y:
-        pad_bottom = bottom-size_y
-        bottom = size_y
-    h = int(bottom - top)
-    tile = (x, y, w, h)
-
-    # get the Tile
-    plane = pixels.getTile(the_z, the_c, the_t, tile)
-
-    # pad if we wanted a bigger region
-    if pad_left > 0:
-        data_h, data_w = plane.shape
-        pad_data = zeros((data_h, pad_left), dtype=plane.dtype)
-        plane = hstack((pad_data, plane))
-    if pad_right > 0:
-        data_h, data_w = plane.shape
-        pad_data = zeros((data_h, pad_right), dtype=plane.dtype)
-        plane = hstack((plane, pad_data))
-    if pad_top > 0:
-        data_h, data_w = plane.shape
-        pad_data = zeros((pad_top, data_w), dtype=plane.dtype)
-        plane = vstack((pad_data, plane))
-    if pad_bottom > 0:
-        data_h, data_w = plane.shape
-        pad_data = zeros((pad_bottom, data_w), dtype=plane.dtype)
-        plane = vstack((plane, pad_data))
-
-    pil = script_utils.numpy_to_image(plane, (plane.min(), plane.max()), int32)
-
-    # Now need to rotate so that x1,y1 is horizontally to the left of x2,y2
-    to_rotate = 90 - math.degrees(rads)
-
-    if x1 > x2:
-        to_rotate += 180
-    # filter=Image.BICUBIC see
-    # http://www.ncbi.nlm.nih.gov/pmc/articles/PMC2172449/
-    rotated = pil.rotate(to_rotate, expand=True)
-    # rotated.show()
-
-    # finally we need to crop to the length of the line
-    length = int(math.sqrt(math.pow(line_x, 2) + math.pow(line_y, 2)))
-    rot_w, rot_h = rotated.size
-    crop_x = old_div((rot_w - length),2)
-    crop_x2 = crop_x + length
-    crop_y = old_div((rot_h - line_w),2)
-    crop_y2 = crop_y + line_w
-    cropped = rotated.crop((crop_x, crop_y, crop_x2, crop_y2))
-    return asarray(cropped)
+    return get_polyline_data(pixels, [(x1, y1), (x2, y2)], line_w,
+                             the_z, the_c, the_t)
 
 
 def points_string_to_xy_list(string):
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2026 University of Dundee & Open Microscopy Environment.
+# All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Client-side helpers for reading OMERO.tables
+"""
+
+from builtins import range
+from collections import OrderedDict
+
+import numpy
+
+# Call context key which, when set to "false", tells TableI.read not to
+# return the row numbers of the (contiguous) range that was read.
+ROW_NUMBERS = "omero.tables.rowNumbers"
+
+# Default number of rows per call to TablePrx.read
+CHUNK_SIZE = 10000
+
+MASK_FIELDS = ("imageId", "theZ", "theT", "x", "y", "w", "h")
+
+
+def column_values(col):
+    """
+    Returns the values of an omero.grid.Column as a numpy array.
+    MaskColumns are returned as a record array with one field per
+    attribute, the mask bytes being held as objects.
+    """
+    values = getattr(col, "values", None)
+    if values is None and hasattr(col, "bytes"):
+        arrays = [numpy.asarray(getattr(col, f)) for f in MASK_FIELDS]
+        masks = numpy.empty(len(col.bytes), dtype=object)
+        masks[:] = [bytes(b) for b in col.bytes]
+        return numpy.rec.fromarrays(
+            arrays + [masks], names=MASK_FIELDS + ("bytes",))
+    return numpy.asarray(values if values is not None else [])
+
+
+def read_chunks(table, colNumbers=None, start=0, stop=None,
+                chunk_size=CHUNK_SIZE, pandas=False, ctx=None):
+    """
+    Generator reading the rows [start, stop) of an omero.grid.TablePrx in
+    chunks of at most chunk_size rows, so that neither the client nor the
+    server needs to hold the whole range in memory. The read of the next
+    chunk is started before the current one is yielded. Row numbers are
+    not transferred since they are implied by the chunk.
+
+    :param table: omero.grid.TablePrx
+    :param colNumbers: column indexes to read, all columns if None
+    :param start: first row to read
+    :param stop: row after the last row to read, the end of the table if
+                 None
+    :param chunk_size: maximum number of rows per chunk
+    :param pandas: if True yield pandas.DataFrame objects instead of
+                   OrderedDicts of column name to numpy array
+    :param ctx: optional call context
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive: %s" % chunk_size)
+    if pandas:
+        import pandas as pd
+    if colNumbers is None:
+        colNumbers = list(range(len(table.getHeaders(ctx))))
+    if stop is None:
+        stop = table.getNumberOfRows(ctx)
+    ctx = dict(ctx or {})
+    ctx[ROW_NUMBERS] = "false"
+
+    offsets = range(start, stop, chunk_size)
+    pending = None
+    for i, offset in enumerate(offsets):
+        if pending is None:
+            pending = table.begin_read(
+                colNumbers, offset, min(offset + chunk_size, stop), ctx)
+        data = table.end_read(pending)
+        pending = None
+        if i + 1 < len(offsets):
+            nxt = offsets[i + 1]
+            pending = table.begin_read(
+                colNumbers, nxt, min(nxt + chunk_size, stop), ctx)
+
+        chunk = OrderedDict(
+            (col.name, column_values(col)) for col in data.columns)
+        if pandas:
+            chunk = pd.DataFrame(OrderedDict(
+                (name, list(v) if v.ndim > 1 or v.dtype.names else v)
+                for name, v in chunk.items()),
+                index=pd.RangeIndex(offset, offset + len(
+                    next(iter(chunk.values()), []))))
+        yield chunk
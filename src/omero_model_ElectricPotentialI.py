@@ -37,6 +37,7 @@ __name__ = "omero.model"
 from omero_model_UnitBase import UnitBase
 from omero.model.enums import UnitsElectricPotential
 
+from omero.conversions import ConversionTable
 from omero.conversions import Add  # nopep8
 from omero.conversions import Int  # nopep8
 from omero.conversions import Mul  # nopep8
@@ -48,850 +49,848 @@ from omero.conversions import Sym  # nopep8
 class ElectricPotentialI(_omero_model.ElectricPotential, UnitBase):
 
     UNIT_VALUES = sorted(UnitsElectricPotential._enumerators.values())
-    CONVERSIONS = dict()
-    for val in UNIT_VALUES:
-        CONVERSIONS[val] = dict()
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 6), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Int(1000), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ATTOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("attov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 16), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 13), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 4), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Int(10), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 7), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 10), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 22), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 19), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.CENTIVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("centiv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 19), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Int(1000), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Int(100), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 16), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 7), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 4), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 10), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 13), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Int(10), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 25), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 22), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("decav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 17), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Int(10), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 14), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 5), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Int(100), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 8), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 11), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 23), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 20), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.DECIVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("deciv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 36), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 20), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 17), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 19), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 33), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Pow(10, 9), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 16), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Pow(10, 15), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Pow(10, 12), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 24), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 21), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 27), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Int(1000), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 30), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Pow(10, 6), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 18), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 42), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 39), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.EXAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("exav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Int(1000), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 9), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 6), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.FEMTOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("femtov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 27), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 11), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 8), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 10), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 24), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 7), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Pow(10, 6), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Int(1000), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 15), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 12), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 18), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 21), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 9), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 33), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 30), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.GIGAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("gigav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 20), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 4), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Int(10), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Int(1000), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 17), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 8), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 5), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 11), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 14), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Int(100), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 26), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 23), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.HECTOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("hectov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 21), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 5), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Int(100), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 4), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 18), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Int(10), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 9), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 6), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 12), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 15), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Int(1000), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 27), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 24), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.KILOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("kilov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 24), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 8), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 5), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 7), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 21), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 4), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Int(1000), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 12), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 9), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 15), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 18), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 6), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 30), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 27), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MEGAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("megav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 12), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 9), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Int(1000), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 6), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 18), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 15), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MICROVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("microv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 15), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 12), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Int(1000), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 6), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 9), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 21), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 18), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.MILLIVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("milliv"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 9), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 6), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Int(1000), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 15), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 12), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.NANOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("nanov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 33), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 17), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 14), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 16), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 30), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Pow(10, 6), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 13), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Pow(10, 12), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Pow(10, 9), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 21), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 18), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 24), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 27), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Int(1000), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 15), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 39), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 36), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PETAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("petav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 6), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Int(1000), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 12), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 9), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.PICOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("picov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 30), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 14), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 11), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 13), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 27), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Int(1000), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 10), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Pow(10, 9), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Pow(10, 6), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 18), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 15), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 21), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 24), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 12), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 36), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 33), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.TERAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("terav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 18), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Int(100), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Int(10), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 15), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 6), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Int(1000), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 9), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 12), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 24), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 21), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.VOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("v"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOCTOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 42), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 26), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 23), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 25), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Pow(10, 6), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 39), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Pow(10, 15), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 22), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Pow(10, 21), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Pow(10, 18), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 30), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 27), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 33), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Pow(10, 9), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 36), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Pow(10, 12), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 24), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 48), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 45), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.YOTTAVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Int(1000), Sym("yottav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Int(1000), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZEPTOVOLT][UnitsElectricPotential.ZETTAVOLT] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptov"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.ATTOVOLT] = \
-        Mul(Pow(10, 39), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.CENTIVOLT] = \
-        Mul(Pow(10, 23), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.DECAVOLT] = \
-        Mul(Pow(10, 20), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.DECIVOLT] = \
-        Mul(Pow(10, 22), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.EXAVOLT] = \
-        Mul(Int(1000), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.FEMTOVOLT] = \
-        Mul(Pow(10, 36), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.GIGAVOLT] = \
-        Mul(Pow(10, 12), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.HECTOVOLT] = \
-        Mul(Pow(10, 19), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.KILOVOLT] = \
-        Mul(Pow(10, 18), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.MEGAVOLT] = \
-        Mul(Pow(10, 15), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.MICROVOLT] = \
-        Mul(Pow(10, 27), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.MILLIVOLT] = \
-        Mul(Pow(10, 24), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.NANOVOLT] = \
-        Mul(Pow(10, 30), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.PETAVOLT] = \
-        Mul(Pow(10, 6), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.PICOVOLT] = \
-        Mul(Pow(10, 33), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.TERAVOLT] = \
-        Mul(Pow(10, 9), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.VOLT] = \
-        Mul(Pow(10, 21), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.YOCTOVOLT] = \
-        Mul(Pow(10, 45), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.YOTTAVOLT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zettav"))  # nopep8
-    CONVERSIONS[UnitsElectricPotential.ZETTAVOLT][UnitsElectricPotential.ZEPTOVOLT] = \
-        Mul(Pow(10, 42), Sym("zettav"))  # nopep8
-    del val
+    CONVERSIONS = ConversionTable(UNIT_VALUES, {
+        ("ATTOVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "MICROVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "NANOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "PICOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Int(1000), Sym("attov")),  # nopep8
+        ("ATTOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("attov")),  # nopep8
+        ("CENTIVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 16), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 13), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 4), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "MILLIVOLT"): lambda:
+            Mul(Int(10), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 7), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 10), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 22), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 19), Sym("centiv")),  # nopep8
+        ("CENTIVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("centiv")),  # nopep8
+        ("DECAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 19), Sym("decav")),  # nopep8
+        ("DECAVOLT", "CENTIVOLT"): lambda:
+            Mul(Int(1000), Sym("decav")),  # nopep8
+        ("DECAVOLT", "DECIVOLT"): lambda:
+            Mul(Int(100), Sym("decav")),  # nopep8
+        ("DECAVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 16), Sym("decav")),  # nopep8
+        ("DECAVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 7), Sym("decav")),  # nopep8
+        ("DECAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 4), Sym("decav")),  # nopep8
+        ("DECAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 10), Sym("decav")),  # nopep8
+        ("DECAVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 13), Sym("decav")),  # nopep8
+        ("DECAVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "VOLT"): lambda:
+            Mul(Int(10), Sym("decav")),  # nopep8
+        ("DECAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 25), Sym("decav")),  # nopep8
+        ("DECAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("decav")),  # nopep8
+        ("DECAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 22), Sym("decav")),  # nopep8
+        ("DECAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("decav")),  # nopep8
+        ("DECIVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 17), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "CENTIVOLT"): lambda:
+            Mul(Int(10), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 14), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 5), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "MILLIVOLT"): lambda:
+            Mul(Int(100), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 8), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 11), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 23), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 20), Sym("deciv")),  # nopep8
+        ("DECIVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("deciv")),  # nopep8
+        ("EXAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 36), Sym("exav")),  # nopep8
+        ("EXAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 20), Sym("exav")),  # nopep8
+        ("EXAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 17), Sym("exav")),  # nopep8
+        ("EXAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 19), Sym("exav")),  # nopep8
+        ("EXAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 33), Sym("exav")),  # nopep8
+        ("EXAVOLT", "GIGAVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("exav")),  # nopep8
+        ("EXAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 16), Sym("exav")),  # nopep8
+        ("EXAVOLT", "KILOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("exav")),  # nopep8
+        ("EXAVOLT", "MEGAVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("exav")),  # nopep8
+        ("EXAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("exav")),  # nopep8
+        ("EXAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("exav")),  # nopep8
+        ("EXAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("exav")),  # nopep8
+        ("EXAVOLT", "PETAVOLT"): lambda:
+            Mul(Int(1000), Sym("exav")),  # nopep8
+        ("EXAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("exav")),  # nopep8
+        ("EXAVOLT", "TERAVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("exav")),  # nopep8
+        ("EXAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 18), Sym("exav")),  # nopep8
+        ("EXAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 42), Sym("exav")),  # nopep8
+        ("EXAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("exav")),  # nopep8
+        ("EXAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 39), Sym("exav")),  # nopep8
+        ("EXAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("exav")),  # nopep8
+        ("FEMTOVOLT", "ATTOVOLT"): lambda:
+            Mul(Int(1000), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "MICROVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "NANOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "PICOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("femtov")),  # nopep8
+        ("FEMTOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("femtov")),  # nopep8
+        ("GIGAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 11), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 8), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 10), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 7), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "KILOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "MEGAVOLT"): lambda:
+            Mul(Int(1000), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 9), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 33), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("gigav")),  # nopep8
+        ("GIGAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("gigav")),  # nopep8
+        ("HECTOVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 20), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 4), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "DECAVOLT"): lambda:
+            Mul(Int(10), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "DECIVOLT"): lambda:
+            Mul(Int(1000), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 17), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 8), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 5), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 11), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 14), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "VOLT"): lambda:
+            Mul(Int(100), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 26), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 23), Sym("hectov")),  # nopep8
+        ("HECTOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("hectov")),  # nopep8
+        ("KILOVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 5), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "DECAVOLT"): lambda:
+            Mul(Int(100), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 4), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "HECTOVOLT"): lambda:
+            Mul(Int(10), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "VOLT"): lambda:
+            Mul(Int(1000), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("kilov")),  # nopep8
+        ("KILOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("kilov")),  # nopep8
+        ("MEGAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 8), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 5), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 7), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 4), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "KILOVOLT"): lambda:
+            Mul(Int(1000), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 6), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("megav")),  # nopep8
+        ("MEGAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("megav")),  # nopep8
+        ("MICROVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("microv")),  # nopep8
+        ("MICROVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("microv")),  # nopep8
+        ("MICROVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "NANOVOLT"): lambda:
+            Mul(Int(1000), Sym("microv")),  # nopep8
+        ("MICROVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("microv")),  # nopep8
+        ("MICROVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("microv")),  # nopep8
+        ("MICROVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("microv")),  # nopep8
+        ("MICROVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("microv")),  # nopep8
+        ("MICROVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("microv")),  # nopep8
+        ("MILLIVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "MICROVOLT"): lambda:
+            Mul(Int(1000), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("milliv")),  # nopep8
+        ("MILLIVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("milliv")),  # nopep8
+        ("NANOVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "MICROVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "PICOVOLT"): lambda:
+            Mul(Int(1000), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("nanov")),  # nopep8
+        ("NANOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("nanov")),  # nopep8
+        ("PETAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 33), Sym("petav")),  # nopep8
+        ("PETAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 17), Sym("petav")),  # nopep8
+        ("PETAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 14), Sym("petav")),  # nopep8
+        ("PETAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 16), Sym("petav")),  # nopep8
+        ("PETAVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("petav")),  # nopep8
+        ("PETAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("petav")),  # nopep8
+        ("PETAVOLT", "GIGAVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("petav")),  # nopep8
+        ("PETAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 13), Sym("petav")),  # nopep8
+        ("PETAVOLT", "KILOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("petav")),  # nopep8
+        ("PETAVOLT", "MEGAVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("petav")),  # nopep8
+        ("PETAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("petav")),  # nopep8
+        ("PETAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("petav")),  # nopep8
+        ("PETAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("petav")),  # nopep8
+        ("PETAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("petav")),  # nopep8
+        ("PETAVOLT", "TERAVOLT"): lambda:
+            Mul(Int(1000), Sym("petav")),  # nopep8
+        ("PETAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 15), Sym("petav")),  # nopep8
+        ("PETAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 39), Sym("petav")),  # nopep8
+        ("PETAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("petav")),  # nopep8
+        ("PETAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 36), Sym("petav")),  # nopep8
+        ("PETAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("petav")),  # nopep8
+        ("PICOVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("picov")),  # nopep8
+        ("PICOVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Int(1000), Sym("picov")),  # nopep8
+        ("PICOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "MICROVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "NANOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("picov")),  # nopep8
+        ("PICOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("picov")),  # nopep8
+        ("PICOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("picov")),  # nopep8
+        ("PICOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("picov")),  # nopep8
+        ("TERAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("terav")),  # nopep8
+        ("TERAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 14), Sym("terav")),  # nopep8
+        ("TERAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 11), Sym("terav")),  # nopep8
+        ("TERAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 13), Sym("terav")),  # nopep8
+        ("TERAVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("terav")),  # nopep8
+        ("TERAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("terav")),  # nopep8
+        ("TERAVOLT", "GIGAVOLT"): lambda:
+            Mul(Int(1000), Sym("terav")),  # nopep8
+        ("TERAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 10), Sym("terav")),  # nopep8
+        ("TERAVOLT", "KILOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("terav")),  # nopep8
+        ("TERAVOLT", "MEGAVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("terav")),  # nopep8
+        ("TERAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("terav")),  # nopep8
+        ("TERAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("terav")),  # nopep8
+        ("TERAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("terav")),  # nopep8
+        ("TERAVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("terav")),  # nopep8
+        ("TERAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("terav")),  # nopep8
+        ("TERAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 12), Sym("terav")),  # nopep8
+        ("TERAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 36), Sym("terav")),  # nopep8
+        ("TERAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("terav")),  # nopep8
+        ("TERAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 33), Sym("terav")),  # nopep8
+        ("TERAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("terav")),  # nopep8
+        ("VOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("v")),  # nopep8
+        ("VOLT", "CENTIVOLT"): lambda:
+            Mul(Int(100), Sym("v")),  # nopep8
+        ("VOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("v")),  # nopep8
+        ("VOLT", "DECIVOLT"): lambda:
+            Mul(Int(10), Sym("v")),  # nopep8
+        ("VOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("v")),  # nopep8
+        ("VOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("v")),  # nopep8
+        ("VOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("v")),  # nopep8
+        ("VOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("v")),  # nopep8
+        ("VOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("v")),  # nopep8
+        ("VOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("v")),  # nopep8
+        ("VOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("v")),  # nopep8
+        ("VOLT", "MILLIVOLT"): lambda:
+            Mul(Int(1000), Sym("v")),  # nopep8
+        ("VOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("v")),  # nopep8
+        ("VOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("v")),  # nopep8
+        ("VOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("v")),  # nopep8
+        ("VOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("v")),  # nopep8
+        ("VOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("v")),  # nopep8
+        ("VOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("v")),  # nopep8
+        ("VOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("v")),  # nopep8
+        ("VOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("v")),  # nopep8
+        ("YOCTOVOLT", "ATTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "MICROVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "NANOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "PICOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("yoctov")),  # nopep8
+        ("YOCTOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctov")),  # nopep8
+        ("YOTTAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 42), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 26), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 23), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 25), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "EXAVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 39), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "GIGAVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 22), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "KILOVOLT"): lambda:
+            Mul(Pow(10, 21), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "MEGAVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 33), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "PETAVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 36), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "TERAVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 24), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 48), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 45), Sym("yottav")),  # nopep8
+        ("YOTTAVOLT", "ZETTAVOLT"): lambda:
+            Mul(Int(1000), Sym("yottav")),  # nopep8
+        ("ZEPTOVOLT", "ATTOVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "CENTIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "DECAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "DECIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "EXAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "FEMTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "GIGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "HECTOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "KILOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "MEGAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "MICROVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "MILLIVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "NANOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "PETAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "PICOVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "TERAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "VOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "YOCTOVOLT"): lambda:
+            Mul(Int(1000), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptov")),  # nopep8
+        ("ZEPTOVOLT", "ZETTAVOLT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptov")),  # nopep8
+        ("ZETTAVOLT", "ATTOVOLT"): lambda:
+            Mul(Pow(10, 39), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "CENTIVOLT"): lambda:
+            Mul(Pow(10, 23), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "DECAVOLT"): lambda:
+            Mul(Pow(10, 20), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "DECIVOLT"): lambda:
+            Mul(Pow(10, 22), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "EXAVOLT"): lambda:
+            Mul(Int(1000), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "FEMTOVOLT"): lambda:
+            Mul(Pow(10, 36), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "GIGAVOLT"): lambda:
+            Mul(Pow(10, 12), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "HECTOVOLT"): lambda:
+            Mul(Pow(10, 19), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "KILOVOLT"): lambda:
+            Mul(Pow(10, 18), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "MEGAVOLT"): lambda:
+            Mul(Pow(10, 15), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "MICROVOLT"): lambda:
+            Mul(Pow(10, 27), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "MILLIVOLT"): lambda:
+            Mul(Pow(10, 24), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "NANOVOLT"): lambda:
+            Mul(Pow(10, 30), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "PETAVOLT"): lambda:
+            Mul(Pow(10, 6), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "PICOVOLT"): lambda:
+            Mul(Pow(10, 33), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "TERAVOLT"): lambda:
+            Mul(Pow(10, 9), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "VOLT"): lambda:
+            Mul(Pow(10, 21), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "YOCTOVOLT"): lambda:
+            Mul(Pow(10, 45), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "YOTTAVOLT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zettav")),  # nopep8
+        ("ZETTAVOLT", "ZEPTOVOLT"): lambda:
+            Mul(Pow(10, 42), Sym("zettav")),  # nopep8
+    })
 
     SYMBOLS = dict()
     SYMBOLS["ATTOVOLT"] = "aV"
@@ -949,7 +948,7 @@ class ElectricPotentialI(_omero_model.ElectricPotential, UnitBase):
                     t = (value.getValue(), source, target)
                     msg = "%s %s cannot be converted to %s" % t
                     raise Exception(msg)
-                self.setValue(c(value.getValue()))
+                self.setValue(c.convert(value.getValue()))
                 self.setUnit(target)
         else:
             self.setValue(value)
@@ -37,6 +37,7 @@ __name__ = "omero.model"
 from omero_model_UnitBase import UnitBase
 from omero.model.enums import UnitsFrequency
 
+from omero.conversions import ConversionTable
 from omero.conversions import Add  # nopep8
 from omero.conversions import Int  # nopep8
 from omero.conversions import Mul  # nopep8
@@ -48,850 +49,848 @@ from omero.conversions import Sym  # nopep8
 class FrequencyI(_omero_model.Frequency, UnitBase):
 
     UNIT_VALUES = sorted(UnitsFrequency._enumerators.values())
-    CONVERSIONS = dict()
-    for val in UNIT_VALUES:
-        CONVERSIONS[val] = dict()
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 6), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Int(1000), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ATTOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("attohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 16), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Int(10)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 13), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Int(100)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 4), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Int(10), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 7), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 10), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 22), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 19), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.CENTIHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("centihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 19), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Int(1000), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Int(100), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 16), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Int(10)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Int(10), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Int(100)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 7), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 4), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 10), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 13), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 25), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 22), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("decahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 17), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Int(10), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Int(100)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 14), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Int(10)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 5), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Int(100), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 8), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 11), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 23), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 20), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.DECIHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("decihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 36), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 20), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 17), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 19), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 33), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Pow(10, 9), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 16), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 18), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Pow(10, 15), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Pow(10, 12), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 24), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 21), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 27), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Int(1000), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 30), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Pow(10, 6), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 42), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 39), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.EXAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("exahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Int(1000), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 9), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 6), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.FEMTOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("femtohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 27), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 11), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 8), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 10), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 24), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 7), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 9), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Pow(10, 6), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Int(1000), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 15), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 12), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 18), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 21), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 33), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 30), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.GIGAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("gigahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 20), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 4), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Int(10), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Int(1000), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 17), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Int(100), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Int(10)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 8), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 5), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 11), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 14), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 26), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 23), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HECTOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("hectohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 18), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Int(100), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Int(10)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Int(10), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 15), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Int(100)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 6), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Int(1000), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 9), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 12), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 24), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 21), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.HERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("hz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 21), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 5), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Int(100), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 4), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 18), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Int(10), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Int(1000), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 9), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 6), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 12), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 15), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 27), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 24), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.KILOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("kilohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 24), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 8), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 5), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 7), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 21), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 4), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 6), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Int(1000), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 12), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 9), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 15), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 18), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 30), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 27), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MEGAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("megahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 12), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 9), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Int(1000), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 6), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 18), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 15), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MICROHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("microhz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 15), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Int(10)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Int(100)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 12), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Int(1000), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 6), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 9), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 21), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 18), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.MILLIHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("millihz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 9), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 6), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Int(1000), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 15), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 12), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.NANOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("nanohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 33), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 17), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 14), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 16), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 30), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Pow(10, 6), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 13), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 15), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Pow(10, 12), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Pow(10, 9), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 21), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 18), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 24), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 27), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Int(1000), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 39), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 36), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PETAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("petahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 6), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Int(1000), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 12), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 9), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.PICOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("picohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 30), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 14), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 11), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 13), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 27), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Int(1000), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 10), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 12), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Pow(10, 9), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Pow(10, 6), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 18), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 15), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 21), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 24), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 36), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 33), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.TERAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("terahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOCTOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 42), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 26), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 23), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 25), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Pow(10, 6), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 39), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Pow(10, 15), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 22), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 24), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Pow(10, 21), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Pow(10, 18), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 30), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 27), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 33), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Pow(10, 9), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 36), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Pow(10, 12), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 48), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 45), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.YOTTAHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Int(1000), Sym("yottahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Int(1000), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZEPTOHERTZ][UnitsFrequency.ZETTAHERTZ] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptohz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.ATTOHERTZ] = \
-        Mul(Pow(10, 39), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.CENTIHERTZ] = \
-        Mul(Pow(10, 23), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.DECAHERTZ] = \
-        Mul(Pow(10, 20), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.DECIHERTZ] = \
-        Mul(Pow(10, 22), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.EXAHERTZ] = \
-        Mul(Int(1000), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.FEMTOHERTZ] = \
-        Mul(Pow(10, 36), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.GIGAHERTZ] = \
-        Mul(Pow(10, 12), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.HECTOHERTZ] = \
-        Mul(Pow(10, 19), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.HERTZ] = \
-        Mul(Pow(10, 21), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.KILOHERTZ] = \
-        Mul(Pow(10, 18), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.MEGAHERTZ] = \
-        Mul(Pow(10, 15), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.MICROHERTZ] = \
-        Mul(Pow(10, 27), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.MILLIHERTZ] = \
-        Mul(Pow(10, 24), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.NANOHERTZ] = \
-        Mul(Pow(10, 30), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.PETAHERTZ] = \
-        Mul(Pow(10, 6), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.PICOHERTZ] = \
-        Mul(Pow(10, 33), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.TERAHERTZ] = \
-        Mul(Pow(10, 9), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.YOCTOHERTZ] = \
-        Mul(Pow(10, 45), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.YOTTAHERTZ] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zettahz"))  # nopep8
-    CONVERSIONS[UnitsFrequency.ZETTAHERTZ][UnitsFrequency.ZEPTOHERTZ] = \
-        Mul(Pow(10, 42), Sym("zettahz"))  # nopep8
-    del val
+    CONVERSIONS = ConversionTable(UNIT_VALUES, {
+        ("ATTOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Int(1000), Sym("attohz")),  # nopep8
+        ("ATTOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("attohz")),  # nopep8
+        ("CENTIHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 16), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 13), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 4), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Int(10), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 7), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 10), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 22), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 19), Sym("centihz")),  # nopep8
+        ("CENTIHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("centihz")),  # nopep8
+        ("DECAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 19), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Int(1000), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Int(100), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 16), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "HERTZ"): lambda:
+            Mul(Int(10), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 7), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 4), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 10), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 13), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 25), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 22), Sym("decahz")),  # nopep8
+        ("DECAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("decahz")),  # nopep8
+        ("DECIHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 17), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Int(10), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 14), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 5), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Int(100), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 8), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 11), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 23), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 20), Sym("decihz")),  # nopep8
+        ("DECIHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("decihz")),  # nopep8
+        ("EXAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 36), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 20), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 17), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 19), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 33), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 16), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Int(1000), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 42), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 39), Sym("exahz")),  # nopep8
+        ("EXAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("exahz")),  # nopep8
+        ("FEMTOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Int(1000), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("femtohz")),  # nopep8
+        ("FEMTOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("femtohz")),  # nopep8
+        ("GIGAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 11), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 8), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 10), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 7), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Int(1000), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 33), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("gigahz")),  # nopep8
+        ("GIGAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("gigahz")),  # nopep8
+        ("HECTOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 20), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 4), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Int(10), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Int(1000), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 17), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "HERTZ"): lambda:
+            Mul(Int(100), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 8), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 5), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 11), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 14), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 26), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 23), Sym("hectohz")),  # nopep8
+        ("HECTOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("hectohz")),  # nopep8
+        ("HERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("hz")),  # nopep8
+        ("HERTZ", "CENTIHERTZ"): lambda:
+            Mul(Int(100), Sym("hz")),  # nopep8
+        ("HERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("hz")),  # nopep8
+        ("HERTZ", "DECIHERTZ"): lambda:
+            Mul(Int(10), Sym("hz")),  # nopep8
+        ("HERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("hz")),  # nopep8
+        ("HERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("hz")),  # nopep8
+        ("HERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("hz")),  # nopep8
+        ("HERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("hz")),  # nopep8
+        ("HERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("hz")),  # nopep8
+        ("HERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("hz")),  # nopep8
+        ("HERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("hz")),  # nopep8
+        ("HERTZ", "MILLIHERTZ"): lambda:
+            Mul(Int(1000), Sym("hz")),  # nopep8
+        ("HERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("hz")),  # nopep8
+        ("HERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("hz")),  # nopep8
+        ("HERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("hz")),  # nopep8
+        ("HERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("hz")),  # nopep8
+        ("HERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("hz")),  # nopep8
+        ("HERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("hz")),  # nopep8
+        ("HERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("hz")),  # nopep8
+        ("HERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("hz")),  # nopep8
+        ("KILOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 5), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Int(100), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 4), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Int(10), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "HERTZ"): lambda:
+            Mul(Int(1000), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("kilohz")),  # nopep8
+        ("KILOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("kilohz")),  # nopep8
+        ("MEGAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 8), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 5), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 7), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 4), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Int(1000), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("megahz")),  # nopep8
+        ("MEGAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("megahz")),  # nopep8
+        ("MICROHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "NANOHERTZ"): lambda:
+            Mul(Int(1000), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("microhz")),  # nopep8
+        ("MICROHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("microhz")),  # nopep8
+        ("MILLIHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "MICROHERTZ"): lambda:
+            Mul(Int(1000), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("millihz")),  # nopep8
+        ("MILLIHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("millihz")),  # nopep8
+        ("NANOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Int(1000), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("nanohz")),  # nopep8
+        ("NANOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("nanohz")),  # nopep8
+        ("PETAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 33), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 17), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 14), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 16), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 13), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Int(1000), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 39), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 36), Sym("petahz")),  # nopep8
+        ("PETAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("petahz")),  # nopep8
+        ("PICOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Int(1000), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("picohz")),  # nopep8
+        ("PICOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("picohz")),  # nopep8
+        ("TERAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 14), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 11), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 13), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Int(1000), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 10), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 36), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 33), Sym("terahz")),  # nopep8
+        ("TERAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("terahz")),  # nopep8
+        ("YOCTOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("yoctohz")),  # nopep8
+        ("YOCTOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctohz")),  # nopep8
+        ("YOTTAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 42), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 26), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 23), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 25), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 39), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 22), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 33), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 36), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 48), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 45), Sym("yottahz")),  # nopep8
+        ("YOTTAHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Int(1000), Sym("yottahz")),  # nopep8
+        ("ZEPTOHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "DECAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "DECIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "EXAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "HERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "KILOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "MICROHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "NANOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "PETAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "PICOHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "TERAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Int(1000), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptohz")),  # nopep8
+        ("ZEPTOHERTZ", "ZETTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptohz")),  # nopep8
+        ("ZETTAHERTZ", "ATTOHERTZ"): lambda:
+            Mul(Pow(10, 39), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "CENTIHERTZ"): lambda:
+            Mul(Pow(10, 23), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "DECAHERTZ"): lambda:
+            Mul(Pow(10, 20), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "DECIHERTZ"): lambda:
+            Mul(Pow(10, 22), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "EXAHERTZ"): lambda:
+            Mul(Int(1000), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "FEMTOHERTZ"): lambda:
+            Mul(Pow(10, 36), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "GIGAHERTZ"): lambda:
+            Mul(Pow(10, 12), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "HECTOHERTZ"): lambda:
+            Mul(Pow(10, 19), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "HERTZ"): lambda:
+            Mul(Pow(10, 21), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "KILOHERTZ"): lambda:
+            Mul(Pow(10, 18), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "MEGAHERTZ"): lambda:
+            Mul(Pow(10, 15), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "MICROHERTZ"): lambda:
+            Mul(Pow(10, 27), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "MILLIHERTZ"): lambda:
+            Mul(Pow(10, 24), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "NANOHERTZ"): lambda:
+            Mul(Pow(10, 30), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "PETAHERTZ"): lambda:
+            Mul(Pow(10, 6), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "PICOHERTZ"): lambda:
+            Mul(Pow(10, 33), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "TERAHERTZ"): lambda:
+            Mul(Pow(10, 9), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "YOCTOHERTZ"): lambda:
+            Mul(Pow(10, 45), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "YOTTAHERTZ"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zettahz")),  # nopep8
+        ("ZETTAHERTZ", "ZEPTOHERTZ"): lambda:
+            Mul(Pow(10, 42), Sym("zettahz")),  # nopep8
+    })
 
     SYMBOLS = dict()
     SYMBOLS["ATTOHERTZ"] = "aHz"
@@ -949,7 +948,7 @@ class FrequencyI(_omero_model.Frequency, UnitBase):
                     t = (value.getValue(), source, target)
                     msg = "%s %s cannot be converted to %s" % t
                     raise Exception(msg)
-                self.setValue(c(value.getValue()))
+                self.setValue(c.convert(value.getValue()))
                 self.setUnit(target)
         else:
             self.setValue(value)
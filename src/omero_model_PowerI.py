@@ -37,6 +37,7 @@ __name__ = "omero.model"
 from omero_model_UnitBase import UnitBase
 from omero.model.enums import UnitsPower
 
+from omero.conversions import ConversionTable
 from omero.conversions import Add  # nopep8
 from omero.conversions import Int  # nopep8
 from omero.conversions import Mul  # nopep8
@@ -48,850 +49,848 @@ from omero.conversions import Sym  # nopep8
 class PowerI(_omero_model.Power, UnitBase):
 
     UNIT_VALUES = sorted(UnitsPower._enumerators.values())
-    CONVERSIONS = dict()
-    for val in UNIT_VALUES:
-        CONVERSIONS[val] = dict()
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.MICROWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.NANOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.PICOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 6), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Int(1000), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.ATTOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("attow"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 16), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 13), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 4), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.MILLIWATT] = \
-        Mul(Int(10), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 7), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 10), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 22), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 19), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.CENTIWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("centiw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 19), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Int(1000), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.DECIWATT] = \
-        Mul(Int(100), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 16), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 7), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 4), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 10), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 13), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.WATT] = \
-        Mul(Int(10), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 25), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 22), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("decaw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 17), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.CENTIWATT] = \
-        Mul(Int(10), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 14), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 5), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.MILLIWATT] = \
-        Mul(Int(100), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 8), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 11), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 23), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 20), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.DECIWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("deciw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 36), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 20), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 17), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 19), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 33), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Pow(10, 9), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 16), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.KILOWATT] = \
-        Mul(Pow(10, 15), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Pow(10, 12), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 24), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 21), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 27), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.PETAWATT] = \
-        Mul(Int(1000), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 30), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.TERAWATT] = \
-        Mul(Pow(10, 6), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 18), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 42), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 39), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.EXAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("exaw"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Int(1000), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.MICROWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.NANOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.PICOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 9), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 6), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.FEMTOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("femtow"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 27), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 11), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 8), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 10), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 24), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 7), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.KILOWATT] = \
-        Mul(Pow(10, 6), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Int(1000), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 15), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 12), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 18), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 21), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 9), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 33), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 30), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.GIGAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("gigaw"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 20), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 4), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.DECAWATT] = \
-        Mul(Int(10), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.DECIWATT] = \
-        Mul(Int(1000), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 17), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 8), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 5), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 11), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 14), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.WATT] = \
-        Mul(Int(100), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 26), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 23), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.HECTOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("hectow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 21), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 5), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.DECAWATT] = \
-        Mul(Int(100), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 4), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 18), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Int(10), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 9), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 6), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 12), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 15), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.WATT] = \
-        Mul(Int(1000), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 27), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 24), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.KILOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("kilow"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 24), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 8), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 5), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 7), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 21), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 4), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.KILOWATT] = \
-        Mul(Int(1000), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 12), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 9), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 15), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 18), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 6), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 30), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 27), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MEGAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("megaw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 12), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 9), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.NANOWATT] = \
-        Mul(Int(1000), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 6), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 18), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 15), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MICROWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("microw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 15), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 12), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.MICROWATT] = \
-        Mul(Int(1000), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 6), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 9), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 21), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 18), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.MILLIWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("milliw"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 9), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 6), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.MICROWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.PICOWATT] = \
-        Mul(Int(1000), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 15), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 12), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.NANOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("nanow"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 33), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 17), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 14), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 16), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 30), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Pow(10, 6), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 13), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.KILOWATT] = \
-        Mul(Pow(10, 12), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Pow(10, 9), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 21), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 18), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 24), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 27), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.TERAWATT] = \
-        Mul(Int(1000), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 15), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 39), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 36), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PETAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("petaw"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 6), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Int(1000), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.MICROWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.NANOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 12), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 9), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.PICOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("picow"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 30), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 14), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 11), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 13), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 27), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Int(1000), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 10), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.KILOWATT] = \
-        Mul(Pow(10, 9), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Pow(10, 6), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 18), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 15), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 21), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 24), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 12), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 36), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 33), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.TERAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("teraw"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 18), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.CENTIWATT] = \
-        Mul(Int(100), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Int(10)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.DECIWATT] = \
-        Mul(Int(10), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 15), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Int(100)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 6), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.MILLIWATT] = \
-        Mul(Int(1000), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 9), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 12), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 24), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 21), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.WATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("w"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.MICROWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.NANOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.PICOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOCTOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctow"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 42), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 26), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 23), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 25), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.EXAWATT] = \
-        Mul(Pow(10, 6), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 39), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Pow(10, 15), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 22), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.KILOWATT] = \
-        Mul(Pow(10, 21), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Pow(10, 18), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 30), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 27), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 33), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.PETAWATT] = \
-        Mul(Pow(10, 9), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 36), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.TERAWATT] = \
-        Mul(Pow(10, 12), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 24), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 48), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 45), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.YOTTAWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Int(1000), Sym("yottaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.ATTOWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.CENTIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.DECAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.DECIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.EXAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.GIGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.HECTOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.KILOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.MEGAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.MICROWATT] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.MILLIWATT] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.NANOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.PETAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.PICOWATT] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.TERAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.WATT] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Int(1000), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZEPTOWATT][UnitsPower.ZETTAWATT] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptow"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.ATTOWATT] = \
-        Mul(Pow(10, 39), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.CENTIWATT] = \
-        Mul(Pow(10, 23), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.DECAWATT] = \
-        Mul(Pow(10, 20), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.DECIWATT] = \
-        Mul(Pow(10, 22), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.EXAWATT] = \
-        Mul(Int(1000), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.FEMTOWATT] = \
-        Mul(Pow(10, 36), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.GIGAWATT] = \
-        Mul(Pow(10, 12), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.HECTOWATT] = \
-        Mul(Pow(10, 19), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.KILOWATT] = \
-        Mul(Pow(10, 18), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.MEGAWATT] = \
-        Mul(Pow(10, 15), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.MICROWATT] = \
-        Mul(Pow(10, 27), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.MILLIWATT] = \
-        Mul(Pow(10, 24), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.NANOWATT] = \
-        Mul(Pow(10, 30), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.PETAWATT] = \
-        Mul(Pow(10, 6), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.PICOWATT] = \
-        Mul(Pow(10, 33), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.TERAWATT] = \
-        Mul(Pow(10, 9), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.WATT] = \
-        Mul(Pow(10, 21), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.YOCTOWATT] = \
-        Mul(Pow(10, 45), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.YOTTAWATT] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zettaw"))  # nopep8
-    CONVERSIONS[UnitsPower.ZETTAWATT][UnitsPower.ZEPTOWATT] = \
-        Mul(Pow(10, 42), Sym("zettaw"))  # nopep8
-    del val
+    CONVERSIONS = ConversionTable(UNIT_VALUES, {
+        ("ATTOWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "FEMTOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "MICROWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "NANOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "PICOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("attow")),  # nopep8
+        ("ATTOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("attow")),  # nopep8
+        ("ATTOWATT", "ZEPTOWATT"): lambda:
+            Mul(Int(1000), Sym("attow")),  # nopep8
+        ("ATTOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("attow")),  # nopep8
+        ("CENTIWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 16), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 13), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 4), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "MILLIWATT"): lambda:
+            Mul(Int(10), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 7), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 10), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 22), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 19), Sym("centiw")),  # nopep8
+        ("CENTIWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("centiw")),  # nopep8
+        ("DECAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 19), Sym("decaw")),  # nopep8
+        ("DECAWATT", "CENTIWATT"): lambda:
+            Mul(Int(1000), Sym("decaw")),  # nopep8
+        ("DECAWATT", "DECIWATT"): lambda:
+            Mul(Int(100), Sym("decaw")),  # nopep8
+        ("DECAWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 16), Sym("decaw")),  # nopep8
+        ("DECAWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 7), Sym("decaw")),  # nopep8
+        ("DECAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 4), Sym("decaw")),  # nopep8
+        ("DECAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 10), Sym("decaw")),  # nopep8
+        ("DECAWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 13), Sym("decaw")),  # nopep8
+        ("DECAWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "WATT"): lambda:
+            Mul(Int(10), Sym("decaw")),  # nopep8
+        ("DECAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 25), Sym("decaw")),  # nopep8
+        ("DECAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("decaw")),  # nopep8
+        ("DECAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 22), Sym("decaw")),  # nopep8
+        ("DECAWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("decaw")),  # nopep8
+        ("DECIWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 17), Sym("deciw")),  # nopep8
+        ("DECIWATT", "CENTIWATT"): lambda:
+            Mul(Int(10), Sym("deciw")),  # nopep8
+        ("DECIWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 14), Sym("deciw")),  # nopep8
+        ("DECIWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 5), Sym("deciw")),  # nopep8
+        ("DECIWATT", "MILLIWATT"): lambda:
+            Mul(Int(100), Sym("deciw")),  # nopep8
+        ("DECIWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 8), Sym("deciw")),  # nopep8
+        ("DECIWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 11), Sym("deciw")),  # nopep8
+        ("DECIWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 23), Sym("deciw")),  # nopep8
+        ("DECIWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("deciw")),  # nopep8
+        ("DECIWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 20), Sym("deciw")),  # nopep8
+        ("DECIWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("deciw")),  # nopep8
+        ("EXAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 36), Sym("exaw")),  # nopep8
+        ("EXAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 20), Sym("exaw")),  # nopep8
+        ("EXAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 17), Sym("exaw")),  # nopep8
+        ("EXAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 19), Sym("exaw")),  # nopep8
+        ("EXAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 33), Sym("exaw")),  # nopep8
+        ("EXAWATT", "GIGAWATT"): lambda:
+            Mul(Pow(10, 9), Sym("exaw")),  # nopep8
+        ("EXAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 16), Sym("exaw")),  # nopep8
+        ("EXAWATT", "KILOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("exaw")),  # nopep8
+        ("EXAWATT", "MEGAWATT"): lambda:
+            Mul(Pow(10, 12), Sym("exaw")),  # nopep8
+        ("EXAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 24), Sym("exaw")),  # nopep8
+        ("EXAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 21), Sym("exaw")),  # nopep8
+        ("EXAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 27), Sym("exaw")),  # nopep8
+        ("EXAWATT", "PETAWATT"): lambda:
+            Mul(Int(1000), Sym("exaw")),  # nopep8
+        ("EXAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 30), Sym("exaw")),  # nopep8
+        ("EXAWATT", "TERAWATT"): lambda:
+            Mul(Pow(10, 6), Sym("exaw")),  # nopep8
+        ("EXAWATT", "WATT"): lambda:
+            Mul(Pow(10, 18), Sym("exaw")),  # nopep8
+        ("EXAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 42), Sym("exaw")),  # nopep8
+        ("EXAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("exaw")),  # nopep8
+        ("EXAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 39), Sym("exaw")),  # nopep8
+        ("EXAWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("exaw")),  # nopep8
+        ("FEMTOWATT", "ATTOWATT"): lambda:
+            Mul(Int(1000), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "MICROWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "NANOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "PICOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("femtow")),  # nopep8
+        ("FEMTOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("femtow")),  # nopep8
+        ("GIGAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 27), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 11), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 8), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 10), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 24), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 7), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "KILOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "MEGAWATT"): lambda:
+            Mul(Int(1000), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 15), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 12), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "WATT"): lambda:
+            Mul(Pow(10, 9), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 33), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 30), Sym("gigaw")),  # nopep8
+        ("GIGAWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("gigaw")),  # nopep8
+        ("HECTOWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 20), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 4), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "DECAWATT"): lambda:
+            Mul(Int(10), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "DECIWATT"): lambda:
+            Mul(Int(1000), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 17), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 8), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 5), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 11), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 14), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "WATT"): lambda:
+            Mul(Int(100), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 26), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 23), Sym("hectow")),  # nopep8
+        ("HECTOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("hectow")),  # nopep8
+        ("KILOWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("kilow")),  # nopep8
+        ("KILOWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 5), Sym("kilow")),  # nopep8
+        ("KILOWATT", "DECAWATT"): lambda:
+            Mul(Int(100), Sym("kilow")),  # nopep8
+        ("KILOWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 4), Sym("kilow")),  # nopep8
+        ("KILOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("kilow")),  # nopep8
+        ("KILOWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("kilow")),  # nopep8
+        ("KILOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("kilow")),  # nopep8
+        ("KILOWATT", "HECTOWATT"): lambda:
+            Mul(Int(10), Sym("kilow")),  # nopep8
+        ("KILOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("kilow")),  # nopep8
+        ("KILOWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 9), Sym("kilow")),  # nopep8
+        ("KILOWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 6), Sym("kilow")),  # nopep8
+        ("KILOWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("kilow")),  # nopep8
+        ("KILOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("kilow")),  # nopep8
+        ("KILOWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("kilow")),  # nopep8
+        ("KILOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("kilow")),  # nopep8
+        ("KILOWATT", "WATT"): lambda:
+            Mul(Int(1000), Sym("kilow")),  # nopep8
+        ("KILOWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 27), Sym("kilow")),  # nopep8
+        ("KILOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("kilow")),  # nopep8
+        ("KILOWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 24), Sym("kilow")),  # nopep8
+        ("KILOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("kilow")),  # nopep8
+        ("MEGAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 24), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 8), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 5), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 7), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 4), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "KILOWATT"): lambda:
+            Mul(Int(1000), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 12), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 9), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "WATT"): lambda:
+            Mul(Pow(10, 6), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 30), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 27), Sym("megaw")),  # nopep8
+        ("MEGAWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("megaw")),  # nopep8
+        ("MICROWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("microw")),  # nopep8
+        ("MICROWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("microw")),  # nopep8
+        ("MICROWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("microw")),  # nopep8
+        ("MICROWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("microw")),  # nopep8
+        ("MICROWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("microw")),  # nopep8
+        ("MICROWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("microw")),  # nopep8
+        ("MICROWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("microw")),  # nopep8
+        ("MICROWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("microw")),  # nopep8
+        ("MICROWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("microw")),  # nopep8
+        ("MICROWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("microw")),  # nopep8
+        ("MICROWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("microw")),  # nopep8
+        ("MICROWATT", "NANOWATT"): lambda:
+            Mul(Int(1000), Sym("microw")),  # nopep8
+        ("MICROWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("microw")),  # nopep8
+        ("MICROWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("microw")),  # nopep8
+        ("MICROWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("microw")),  # nopep8
+        ("MICROWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("microw")),  # nopep8
+        ("MICROWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("microw")),  # nopep8
+        ("MICROWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("microw")),  # nopep8
+        ("MICROWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("microw")),  # nopep8
+        ("MICROWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("microw")),  # nopep8
+        ("MILLIWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "MICROWATT"): lambda:
+            Mul(Int(1000), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("milliw")),  # nopep8
+        ("MILLIWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("milliw")),  # nopep8
+        ("NANOWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("nanow")),  # nopep8
+        ("NANOWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("nanow")),  # nopep8
+        ("NANOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "MICROWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "PICOWATT"): lambda:
+            Mul(Int(1000), Sym("nanow")),  # nopep8
+        ("NANOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("nanow")),  # nopep8
+        ("NANOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("nanow")),  # nopep8
+        ("NANOWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("nanow")),  # nopep8
+        ("NANOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("nanow")),  # nopep8
+        ("PETAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 33), Sym("petaw")),  # nopep8
+        ("PETAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 17), Sym("petaw")),  # nopep8
+        ("PETAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 14), Sym("petaw")),  # nopep8
+        ("PETAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 16), Sym("petaw")),  # nopep8
+        ("PETAWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("petaw")),  # nopep8
+        ("PETAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 30), Sym("petaw")),  # nopep8
+        ("PETAWATT", "GIGAWATT"): lambda:
+            Mul(Pow(10, 6), Sym("petaw")),  # nopep8
+        ("PETAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 13), Sym("petaw")),  # nopep8
+        ("PETAWATT", "KILOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("petaw")),  # nopep8
+        ("PETAWATT", "MEGAWATT"): lambda:
+            Mul(Pow(10, 9), Sym("petaw")),  # nopep8
+        ("PETAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 21), Sym("petaw")),  # nopep8
+        ("PETAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 18), Sym("petaw")),  # nopep8
+        ("PETAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 24), Sym("petaw")),  # nopep8
+        ("PETAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 27), Sym("petaw")),  # nopep8
+        ("PETAWATT", "TERAWATT"): lambda:
+            Mul(Int(1000), Sym("petaw")),  # nopep8
+        ("PETAWATT", "WATT"): lambda:
+            Mul(Pow(10, 15), Sym("petaw")),  # nopep8
+        ("PETAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 39), Sym("petaw")),  # nopep8
+        ("PETAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("petaw")),  # nopep8
+        ("PETAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 36), Sym("petaw")),  # nopep8
+        ("PETAWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("petaw")),  # nopep8
+        ("PICOWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 6), Sym("picow")),  # nopep8
+        ("PICOWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("picow")),  # nopep8
+        ("PICOWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("picow")),  # nopep8
+        ("PICOWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("picow")),  # nopep8
+        ("PICOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("picow")),  # nopep8
+        ("PICOWATT", "FEMTOWATT"): lambda:
+            Mul(Int(1000), Sym("picow")),  # nopep8
+        ("PICOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("picow")),  # nopep8
+        ("PICOWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("picow")),  # nopep8
+        ("PICOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("picow")),  # nopep8
+        ("PICOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("picow")),  # nopep8
+        ("PICOWATT", "MICROWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("picow")),  # nopep8
+        ("PICOWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("picow")),  # nopep8
+        ("PICOWATT", "NANOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("picow")),  # nopep8
+        ("PICOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("picow")),  # nopep8
+        ("PICOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("picow")),  # nopep8
+        ("PICOWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("picow")),  # nopep8
+        ("PICOWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("picow")),  # nopep8
+        ("PICOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("picow")),  # nopep8
+        ("PICOWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("picow")),  # nopep8
+        ("PICOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("picow")),  # nopep8
+        ("TERAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 30), Sym("teraw")),  # nopep8
+        ("TERAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 14), Sym("teraw")),  # nopep8
+        ("TERAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 11), Sym("teraw")),  # nopep8
+        ("TERAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 13), Sym("teraw")),  # nopep8
+        ("TERAWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("teraw")),  # nopep8
+        ("TERAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 27), Sym("teraw")),  # nopep8
+        ("TERAWATT", "GIGAWATT"): lambda:
+            Mul(Int(1000), Sym("teraw")),  # nopep8
+        ("TERAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 10), Sym("teraw")),  # nopep8
+        ("TERAWATT", "KILOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("teraw")),  # nopep8
+        ("TERAWATT", "MEGAWATT"): lambda:
+            Mul(Pow(10, 6), Sym("teraw")),  # nopep8
+        ("TERAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 18), Sym("teraw")),  # nopep8
+        ("TERAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 15), Sym("teraw")),  # nopep8
+        ("TERAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("teraw")),  # nopep8
+        ("TERAWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("teraw")),  # nopep8
+        ("TERAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 24), Sym("teraw")),  # nopep8
+        ("TERAWATT", "WATT"): lambda:
+            Mul(Pow(10, 12), Sym("teraw")),  # nopep8
+        ("TERAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 36), Sym("teraw")),  # nopep8
+        ("TERAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("teraw")),  # nopep8
+        ("TERAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 33), Sym("teraw")),  # nopep8
+        ("TERAWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("teraw")),  # nopep8
+        ("WATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("w")),  # nopep8
+        ("WATT", "CENTIWATT"): lambda:
+            Mul(Int(100), Sym("w")),  # nopep8
+        ("WATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("w")),  # nopep8
+        ("WATT", "DECIWATT"): lambda:
+            Mul(Int(10), Sym("w")),  # nopep8
+        ("WATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("w")),  # nopep8
+        ("WATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 15), Sym("w")),  # nopep8
+        ("WATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("w")),  # nopep8
+        ("WATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("w")),  # nopep8
+        ("WATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("w")),  # nopep8
+        ("WATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("w")),  # nopep8
+        ("WATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 6), Sym("w")),  # nopep8
+        ("WATT", "MILLIWATT"): lambda:
+            Mul(Int(1000), Sym("w")),  # nopep8
+        ("WATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 9), Sym("w")),  # nopep8
+        ("WATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("w")),  # nopep8
+        ("WATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 12), Sym("w")),  # nopep8
+        ("WATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("w")),  # nopep8
+        ("WATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 24), Sym("w")),  # nopep8
+        ("WATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("w")),  # nopep8
+        ("WATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("w")),  # nopep8
+        ("WATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("w")),  # nopep8
+        ("YOCTOWATT", "ATTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "FEMTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "MICROWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "NANOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "PICOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "ZEPTOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("yoctow")),  # nopep8
+        ("YOCTOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctow")),  # nopep8
+        ("YOTTAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 42), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 26), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 23), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 25), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "EXAWATT"): lambda:
+            Mul(Pow(10, 6), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 39), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "GIGAWATT"): lambda:
+            Mul(Pow(10, 15), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 22), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "KILOWATT"): lambda:
+            Mul(Pow(10, 21), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "MEGAWATT"): lambda:
+            Mul(Pow(10, 18), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 30), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 27), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 33), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "PETAWATT"): lambda:
+            Mul(Pow(10, 9), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 36), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "TERAWATT"): lambda:
+            Mul(Pow(10, 12), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "WATT"): lambda:
+            Mul(Pow(10, 24), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 48), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 45), Sym("yottaw")),  # nopep8
+        ("YOTTAWATT", "ZETTAWATT"): lambda:
+            Mul(Int(1000), Sym("yottaw")),  # nopep8
+        ("ZEPTOWATT", "ATTOWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "CENTIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "DECAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "DECIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "EXAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "FEMTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "GIGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "HECTOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "KILOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "MEGAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "MICROWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "MILLIWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "NANOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "PETAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "PICOWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "TERAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "WATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "YOCTOWATT"): lambda:
+            Mul(Int(1000), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptow")),  # nopep8
+        ("ZEPTOWATT", "ZETTAWATT"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptow")),  # nopep8
+        ("ZETTAWATT", "ATTOWATT"): lambda:
+            Mul(Pow(10, 39), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "CENTIWATT"): lambda:
+            Mul(Pow(10, 23), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "DECAWATT"): lambda:
+            Mul(Pow(10, 20), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "DECIWATT"): lambda:
+            Mul(Pow(10, 22), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "EXAWATT"): lambda:
+            Mul(Int(1000), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "FEMTOWATT"): lambda:
+            Mul(Pow(10, 36), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "GIGAWATT"): lambda:
+            Mul(Pow(10, 12), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "HECTOWATT"): lambda:
+            Mul(Pow(10, 19), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "KILOWATT"): lambda:
+            Mul(Pow(10, 18), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "MEGAWATT"): lambda:
+            Mul(Pow(10, 15), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "MICROWATT"): lambda:
+            Mul(Pow(10, 27), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "MILLIWATT"): lambda:
+            Mul(Pow(10, 24), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "NANOWATT"): lambda:
+            Mul(Pow(10, 30), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "PETAWATT"): lambda:
+            Mul(Pow(10, 6), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "PICOWATT"): lambda:
+            Mul(Pow(10, 33), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "TERAWATT"): lambda:
+            Mul(Pow(10, 9), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "WATT"): lambda:
+            Mul(Pow(10, 21), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "YOCTOWATT"): lambda:
+            Mul(Pow(10, 45), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "YOTTAWATT"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zettaw")),  # nopep8
+        ("ZETTAWATT", "ZEPTOWATT"): lambda:
+            Mul(Pow(10, 42), Sym("zettaw")),  # nopep8
+    })
 
     SYMBOLS = dict()
     SYMBOLS["ATTOWATT"] = "aW"
@@ -949,7 +948,7 @@ class PowerI(_omero_model.Power, UnitBase):
                     t = (value.getValue(), source, target)
                     msg = "%s %s cannot be converted to %s" % t
                     raise Exception(msg)
-                self.setValue(c(value.getValue()))
+                self.setValue(c.convert(value.getValue()))
                 self.setUnit(target)
         else:
             self.setValue(value)
@@ -37,6 +37,7 @@ __name__ = "omero.model"
 from omero_model_UnitBase import UnitBase
 from omero.model.enums import UnitsTemperature
 
+from omero.conversions import ConversionTable
 from omero.conversions import Add  # nopep8
 from omero.conversions import Int  # nopep8
 from omero.conversions import Mul  # nopep8
@@ -48,34 +49,32 @@ from omero.conversions import Sym  # nopep8
 class TemperatureI(_omero_model.Temperature, UnitBase):
 
     UNIT_VALUES = sorted(UnitsTemperature._enumerators.values())
-    CONVERSIONS = dict()
-    for val in UNIT_VALUES:
-        CONVERSIONS[val] = dict()
-    CONVERSIONS[UnitsTemperature.CELSIUS][UnitsTemperature.FAHRENHEIT] = \
-        Add(Mul(Rat(Int(9), Int(5)), Sym("c")), Int(32))  # nopep8
-    CONVERSIONS[UnitsTemperature.CELSIUS][UnitsTemperature.KELVIN] = \
-        Add(Sym("c"), Rat(Int(5463), Int(20)))  # nopep8
-    CONVERSIONS[UnitsTemperature.CELSIUS][UnitsTemperature.RANKINE] = \
-        Add(Mul(Rat(Int(9), Int(5)), Sym("c")), Rat(Int(49167), Int(100)))  # nopep8
-    CONVERSIONS[UnitsTemperature.FAHRENHEIT][UnitsTemperature.CELSIUS] = \
-        Add(Mul(Rat(Int(5), Int(9)), Sym("f")), Rat(Int(-160), Int(9)))  # nopep8
-    CONVERSIONS[UnitsTemperature.FAHRENHEIT][UnitsTemperature.KELVIN] = \
-        Add(Mul(Rat(Int(5), Int(9)), Sym("f")), Rat(Int(45967), Int(180)))  # nopep8
-    CONVERSIONS[UnitsTemperature.FAHRENHEIT][UnitsTemperature.RANKINE] = \
-        Add(Sym("f"), Rat(Int(45967), Int(100)))  # nopep8
-    CONVERSIONS[UnitsTemperature.KELVIN][UnitsTemperature.CELSIUS] = \
-        Add(Sym("k"), Rat(Int(-5463), Int(20)))  # nopep8
-    CONVERSIONS[UnitsTemperature.KELVIN][UnitsTemperature.FAHRENHEIT] = \
-        Add(Mul(Rat(Int(9), Int(5)), Sym("k")), Rat(Int(-45967), Int(100)))  # nopep8
-    CONVERSIONS[UnitsTemperature.KELVIN][UnitsTemperature.RANKINE] = \
-        Mul(Rat(Int(9), Int(5)), Sym("k"))  # nopep8
-    CONVERSIONS[UnitsTemperature.RANKINE][UnitsTemperature.CELSIUS] = \
-        Add(Mul(Rat(Int(5), Int(9)), Sym("r")), Rat(Int(-5463), Int(20)))  # nopep8
-    CONVERSIONS[UnitsTemperature.RANKINE][UnitsTemperature.FAHRENHEIT] = \
-        Add(Sym("r"), Rat(Int(-45967), Int(100)))  # nopep8
-    CONVERSIONS[UnitsTemperature.RANKINE][UnitsTemperature.KELVIN] = \
-        Mul(Rat(Int(5), Int(9)), Sym("r"))  # nopep8
-    del val
+    CONVERSIONS = ConversionTable(UNIT_VALUES, {
+        ("CELSIUS", "FAHRENHEIT"): lambda:
+            Add(Mul(Rat(Int(9), Int(5)), Sym("c")), Int(32)),  # nopep8
+        ("CELSIUS", "KELVIN"): lambda:
+            Add(Sym("c"), Rat(Int(5463), Int(20))),  # nopep8
+        ("CELSIUS", "RANKINE"): lambda:
+            Add(Mul(Rat(Int(9), Int(5)), Sym("c")), Rat(Int(49167), Int(100))),  # nopep8
+        ("FAHRENHEIT", "CELSIUS"): lambda:
+            Add(Mul(Rat(Int(5), Int(9)), Sym("f")), Rat(Int(-160), Int(9))),  # nopep8
+        ("FAHRENHEIT", "KELVIN"): lambda:
+            Add(Mul(Rat(Int(5), Int(9)), Sym("f")), Rat(Int(45967), Int(180))),  # nopep8
+        ("FAHRENHEIT", "RANKINE"): lambda:
+            Add(Sym("f"), Rat(Int(45967), Int(100))),  # nopep8
+        ("KELVIN", "CELSIUS"): lambda:
+            Add(Sym("k"), Rat(Int(-5463), Int(20))),  # nopep8
+        ("KELVIN", "FAHRENHEIT"): lambda:
+            Add(Mul(Rat(Int(9), Int(5)), Sym("k")), Rat(Int(-45967), Int(100))),  # nopep8
+        ("KELVIN", "RANKINE"): lambda:
+            Mul(Rat(Int(9), Int(5)), Sym("k")),  # nopep8
+        ("RANKINE", "CELSIUS"): lambda:
+            Add(Mul(Rat(Int(5), Int(9)), Sym("r")), Rat(Int(-5463), Int(20))),  # nopep8
+        ("RANKINE", "FAHRENHEIT"): lambda:
+            Add(Sym("r"), Rat(Int(-45967), Int(100))),  # nopep8
+        ("RANKINE", "KELVIN"): lambda:
+            Mul(Rat(Int(5), Int(9)), Sym("r")),  # nopep8
+    })
 
     SYMBOLS = dict()
     SYMBOLS["CELSIUS"] = "°C"
@@ -116,7 +115,7 @@ class TemperatureI(_omero_model.Temperature, UnitBase):
                     t = (value.getValue(), source, target)
                     msg = "%s %s cannot be converted to %s" % t
                     raise Exception(msg)
-                self.setValue(c(value.getValue()))
+                self.setValue(c.convert(value.getValue()))
                 self.setUnit(target)
         else:
             self.setValue(value)
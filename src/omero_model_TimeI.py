@@ -37,6 +37,7 @@ __name__ = "omero.model"
 from omero_model_UnitBase import UnitBase
 from omero.model.enums import UnitsTime
 
+from omero.conversions import ConversionTable
 from omero.conversions import Add  # nopep8
 from omero.conversions import Int  # nopep8
 from omero.conversions import Mul  # nopep8
@@ -48,1114 +49,1112 @@ from omero.conversions import Sym  # nopep8
 class TimeI(_omero_model.Time, UnitBase):
 
     UNIT_VALUES = sorted(UnitsTime._enumerators.values())
-    CONVERSIONS = dict()
-    for val in UNIT_VALUES:
-        CONVERSIONS[val] = dict()
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 20))), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 20))), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 19))), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 6), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Int(1000), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.ATTOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("attos"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 16), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 4))), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Int(10)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 13), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 4))), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 4), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.MILLISECOND] = \
-        Mul(Int(10), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Int(6000)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 7), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 10), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Int(100)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 22), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 19), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.CENTISECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("centis"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.ATTOSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 20)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.CENTISECOND] = \
-        Mul(Mul(Int(864), Pow(10, 4)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.DECASECOND] = \
-        Mul(Int(8640), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.DECISECOND] = \
-        Mul(Int(864000), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 11))), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.FEMTOSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 17)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(27), Int(312500)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.HECTOSECOND] = \
-        Mul(Int(864), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.HOUR] = \
-        Mul(Int(24), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(432), Int(5)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(54), Int(625)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.MICROSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 8)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.MILLISECOND] = \
-        Mul(Mul(Int(864), Pow(10, 5)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.MINUTE] = \
-        Mul(Int(1440), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.NANOSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 11)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 8))), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.PICOSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 14)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.SECOND] = \
-        Mul(Int(86400), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 5))), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.YOCTOSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 26)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 17))), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.ZEPTOSECOND] = \
-        Mul(Mul(Int(864), Pow(10, 23)), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DAY][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 14))), Sym("d"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 19), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Int(1000), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Int(8640)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.DECISECOND] = \
-        Mul(Int(100), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 16), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Int(10)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Int(360)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Int(100)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 7), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 4), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Int(6)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 10), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 13), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.SECOND] = \
-        Mul(Int(10), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 25), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 22), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("decas"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 17), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.CENTISECOND] = \
-        Mul(Int(10), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Int(864000)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Int(100)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 14), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Int(36000)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 5), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.MILLISECOND] = \
-        Mul(Int(100), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Int(600)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 8), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 11), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Int(10)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 23), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 20), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.DECISECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("decis"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 36), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 20), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Mul(Int(3125), Pow(10, 11)), Int(27)), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 17), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 19), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 33), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Pow(10, 9), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 16), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Mul(Int(25), Pow(10, 14)), Int(9)), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Pow(10, 15), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Pow(10, 12), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 24), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 21), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 16)), Int(3)), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 27), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.PETASECOND] = \
-        Mul(Int(1000), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 30), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 18), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.TERASECOND] = \
-        Mul(Pow(10, 6), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 42), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 39), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.EXASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("exas"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Int(1000), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 17))), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 17)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 17))), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 16))), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 9), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 6), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.FEMTOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("femtos"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 27), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 11), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(312500), Int(27)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 8), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 10), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 24), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 7), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Mul(Int(25), Pow(10, 5)), Int(9)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Pow(10, 6), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Int(1000), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 15), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 12), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 7)), Int(3)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 18), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 21), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 9), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 33), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 30), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.GIGASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("gigas"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 20), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 4), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Int(864)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Int(10), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Int(1000), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 16)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 17), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Int(36)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Int(10)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 8), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 5), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(5), Int(3)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 11), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 14), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.SECOND] = \
-        Mul(Int(100), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 26), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 23), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HECTOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("hectos"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.ATTOSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 20)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.CENTISECOND] = \
-        Mul(Mul(Int(36), Pow(10, 4)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Int(24)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.DECASECOND] = \
-        Mul(Int(360), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.DECISECOND] = \
-        Mul(Int(36000), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(9), Mul(Int(25), Pow(10, 14))), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.FEMTOSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 17)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(9), Mul(Int(25), Pow(10, 5))), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.HECTOSECOND] = \
-        Mul(Int(36), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(18), Int(5)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(9), Int(2500)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.MICROSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 8)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.MILLISECOND] = \
-        Mul(Mul(Int(36), Pow(10, 5)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.MINUTE] = \
-        Mul(Int(60), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.NANOSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 11)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(9), Mul(Int(25), Pow(10, 11))), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.PICOSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 14)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.SECOND] = \
-        Mul(Int(3600), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(9), Mul(Int(25), Pow(10, 8))), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.YOCTOSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 26)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(9), Mul(Int(25), Pow(10, 20))), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.ZEPTOSECOND] = \
-        Mul(Mul(Int(36), Pow(10, 23)), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.HOUR][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(9), Mul(Int(25), Pow(10, 17))), Sym("h"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 21), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 5), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(5), Int(432)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Int(100), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 4), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 18), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Int(10), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(5), Int(18)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 9), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 6), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(50), Int(3)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 12), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 15), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.SECOND] = \
-        Mul(Int(1000), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 27), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 24), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.KILOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("kilos"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 24), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 8), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(625), Int(54)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 5), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 7), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 21), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 4), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(2500), Int(9)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Int(1000), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 12), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 9), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 4)), Int(3)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 15), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 18), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 6), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 30), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 27), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MEGASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("megas"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 12), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 8))), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 9), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 8))), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 7))), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Int(1000), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 6), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 18), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 15), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MICROSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("micros"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 15), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Int(10)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 5))), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 4)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Int(100)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 12), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 5)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 5))), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.MICROSECOND] = \
-        Mul(Int(1000), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 4))), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 6), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 9), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 21), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 18), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MILLISECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("millis"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.ATTOSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 19)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.CENTISECOND] = \
-        Mul(Int(6000), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Int(1440)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.DECASECOND] = \
-        Mul(Int(6), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.DECISECOND] = \
-        Mul(Int(600), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 16))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.FEMTOSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 16)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 7))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(3), Int(5)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Int(60)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(3), Int(50)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 4))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.MICROSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 7)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.MILLISECOND] = \
-        Mul(Mul(Int(6), Pow(10, 4)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.NANOSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 10)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 13))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.PICOSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 13)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.SECOND] = \
-        Mul(Int(60), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 10))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.YOCTOSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 25)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 22))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.ZEPTOSECOND] = \
-        Mul(Mul(Int(6), Pow(10, 22)), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.MINUTE][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(3), Mul(Int(5), Pow(10, 19))), Sym("m"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 9), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 7)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 11))), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 8)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 6), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 11))), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 10))), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Int(1000), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 15), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 12), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.NANOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("nanos"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 33), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 17), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Mul(Int(3125), Pow(10, 8)), Int(27)), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 14), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 16), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 30), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Pow(10, 6), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 13), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Mul(Int(25), Pow(10, 11)), Int(9)), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Pow(10, 12), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Pow(10, 9), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 21), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 18), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 13)), Int(3)), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 24), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 27), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 15), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.TERASECOND] = \
-        Mul(Int(1000), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 39), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 36), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PETASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("petas"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 6), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 10)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 14))), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 13)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 11)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Int(1000), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 14)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 14))), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 13))), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 12), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 9), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.PICOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("picos"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 18), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.CENTISECOND] = \
-        Mul(Int(100), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Int(86400)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Int(10)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.DECISECOND] = \
-        Mul(Int(10), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 15), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Int(100)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Int(3600)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 6), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.MILLISECOND] = \
-        Mul(Int(1000), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Int(60)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 9), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 12), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 24), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 21), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.SECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("s"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 30), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 14), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Mul(Int(3125), Pow(10, 5)), Int(27)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 11), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 13), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 27), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Int(1000), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 10), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Mul(Int(25), Pow(10, 8)), Int(9)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Pow(10, 9), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Pow(10, 6), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 18), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 15), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 10)), Int(3)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 21), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 24), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 12), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 36), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 33), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.TERASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("teras"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 26))), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 26))), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 25))), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOCTOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctos"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 42), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 26), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Mul(Int(3125), Pow(10, 17)), Int(27)), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 23), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 25), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.EXASECOND] = \
-        Mul(Pow(10, 6), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 39), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Pow(10, 15), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 22), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Mul(Int(25), Pow(10, 20)), Int(9)), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Pow(10, 21), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Pow(10, 18), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 30), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 27), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 22)), Int(3)), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 33), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.PETASECOND] = \
-        Mul(Pow(10, 9), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 36), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 24), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.TERASECOND] = \
-        Mul(Pow(10, 12), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 48), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 45), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.YOTTASECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Int(1000), Sym("yottas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.CENTISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.DAY] = \
-        Mul(Rat(Int(1), Mul(Int(864), Pow(10, 23))), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.DECASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.DECISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.EXASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.GIGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Int(1), Mul(Int(36), Pow(10, 23))), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.KILOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.MEGASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.MICROSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.MILLISECOND] = \
-        Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Int(1), Mul(Int(6), Pow(10, 22))), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.NANOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.PETASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.PICOSECOND] = \
-        Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.SECOND] = \
-        Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.TERASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Int(1000), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZEPTOSECOND][UnitsTime.ZETTASECOND] = \
-        Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptos"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.ATTOSECOND] = \
-        Mul(Pow(10, 39), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.CENTISECOND] = \
-        Mul(Pow(10, 23), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.DAY] = \
-        Mul(Rat(Mul(Int(3125), Pow(10, 14)), Int(27)), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.DECASECOND] = \
-        Mul(Pow(10, 20), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.DECISECOND] = \
-        Mul(Pow(10, 22), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.EXASECOND] = \
-        Mul(Int(1000), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.FEMTOSECOND] = \
-        Mul(Pow(10, 36), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.GIGASECOND] = \
-        Mul(Pow(10, 12), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.HECTOSECOND] = \
-        Mul(Pow(10, 19), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.HOUR] = \
-        Mul(Rat(Mul(Int(25), Pow(10, 17)), Int(9)), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.KILOSECOND] = \
-        Mul(Pow(10, 18), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.MEGASECOND] = \
-        Mul(Pow(10, 15), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.MICROSECOND] = \
-        Mul(Pow(10, 27), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.MILLISECOND] = \
-        Mul(Pow(10, 24), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.MINUTE] = \
-        Mul(Rat(Mul(Int(5), Pow(10, 19)), Int(3)), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.NANOSECOND] = \
-        Mul(Pow(10, 30), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.PETASECOND] = \
-        Mul(Pow(10, 6), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.PICOSECOND] = \
-        Mul(Pow(10, 33), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.SECOND] = \
-        Mul(Pow(10, 21), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.TERASECOND] = \
-        Mul(Pow(10, 9), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.YOCTOSECOND] = \
-        Mul(Pow(10, 45), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.YOTTASECOND] = \
-        Mul(Rat(Int(1), Int(1000)), Sym("zettas"))  # nopep8
-    CONVERSIONS[UnitsTime.ZETTASECOND][UnitsTime.ZEPTOSECOND] = \
-        Mul(Pow(10, 42), Sym("zettas"))  # nopep8
-    del val
+    CONVERSIONS = ConversionTable(UNIT_VALUES, {
+        ("ATTOSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 20))), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 20))), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "MICROSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 19))), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "NANOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "PICOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Int(1000), Sym("attos")),  # nopep8
+        ("ATTOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("attos")),  # nopep8
+        ("CENTISECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 16), Sym("centis")),  # nopep8
+        ("CENTISECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 4))), Sym("centis")),  # nopep8
+        ("CENTISECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 13), Sym("centis")),  # nopep8
+        ("CENTISECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 4))), Sym("centis")),  # nopep8
+        ("CENTISECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 4), Sym("centis")),  # nopep8
+        ("CENTISECOND", "MILLISECOND"): lambda:
+            Mul(Int(10), Sym("centis")),  # nopep8
+        ("CENTISECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Int(6000)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 7), Sym("centis")),  # nopep8
+        ("CENTISECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 10), Sym("centis")),  # nopep8
+        ("CENTISECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 22), Sym("centis")),  # nopep8
+        ("CENTISECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("centis")),  # nopep8
+        ("CENTISECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 19), Sym("centis")),  # nopep8
+        ("CENTISECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("centis")),  # nopep8
+        ("DAY", "ATTOSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 20)), Sym("d")),  # nopep8
+        ("DAY", "CENTISECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 4)), Sym("d")),  # nopep8
+        ("DAY", "DECASECOND"): lambda:
+            Mul(Int(8640), Sym("d")),  # nopep8
+        ("DAY", "DECISECOND"): lambda:
+            Mul(Int(864000), Sym("d")),  # nopep8
+        ("DAY", "EXASECOND"): lambda:
+            Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 11))), Sym("d")),  # nopep8
+        ("DAY", "FEMTOSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 17)), Sym("d")),  # nopep8
+        ("DAY", "GIGASECOND"): lambda:
+            Mul(Rat(Int(27), Int(312500)), Sym("d")),  # nopep8
+        ("DAY", "HECTOSECOND"): lambda:
+            Mul(Int(864), Sym("d")),  # nopep8
+        ("DAY", "HOUR"): lambda:
+            Mul(Int(24), Sym("d")),  # nopep8
+        ("DAY", "KILOSECOND"): lambda:
+            Mul(Rat(Int(432), Int(5)), Sym("d")),  # nopep8
+        ("DAY", "MEGASECOND"): lambda:
+            Mul(Rat(Int(54), Int(625)), Sym("d")),  # nopep8
+        ("DAY", "MICROSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 8)), Sym("d")),  # nopep8
+        ("DAY", "MILLISECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 5)), Sym("d")),  # nopep8
+        ("DAY", "MINUTE"): lambda:
+            Mul(Int(1440), Sym("d")),  # nopep8
+        ("DAY", "NANOSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 11)), Sym("d")),  # nopep8
+        ("DAY", "PETASECOND"): lambda:
+            Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 8))), Sym("d")),  # nopep8
+        ("DAY", "PICOSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 14)), Sym("d")),  # nopep8
+        ("DAY", "SECOND"): lambda:
+            Mul(Int(86400), Sym("d")),  # nopep8
+        ("DAY", "TERASECOND"): lambda:
+            Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 5))), Sym("d")),  # nopep8
+        ("DAY", "YOCTOSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 26)), Sym("d")),  # nopep8
+        ("DAY", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 17))), Sym("d")),  # nopep8
+        ("DAY", "ZEPTOSECOND"): lambda:
+            Mul(Mul(Int(864), Pow(10, 23)), Sym("d")),  # nopep8
+        ("DAY", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(27), Mul(Int(3125), Pow(10, 14))), Sym("d")),  # nopep8
+        ("DECASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 19), Sym("decas")),  # nopep8
+        ("DECASECOND", "CENTISECOND"): lambda:
+            Mul(Int(1000), Sym("decas")),  # nopep8
+        ("DECASECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Int(8640)), Sym("decas")),  # nopep8
+        ("DECASECOND", "DECISECOND"): lambda:
+            Mul(Int(100), Sym("decas")),  # nopep8
+        ("DECASECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("decas")),  # nopep8
+        ("DECASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 16), Sym("decas")),  # nopep8
+        ("DECASECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("decas")),  # nopep8
+        ("DECASECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("decas")),  # nopep8
+        ("DECASECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Int(360)), Sym("decas")),  # nopep8
+        ("DECASECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("decas")),  # nopep8
+        ("DECASECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("decas")),  # nopep8
+        ("DECASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 7), Sym("decas")),  # nopep8
+        ("DECASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 4), Sym("decas")),  # nopep8
+        ("DECASECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Int(6)), Sym("decas")),  # nopep8
+        ("DECASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 10), Sym("decas")),  # nopep8
+        ("DECASECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("decas")),  # nopep8
+        ("DECASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 13), Sym("decas")),  # nopep8
+        ("DECASECOND", "SECOND"): lambda:
+            Mul(Int(10), Sym("decas")),  # nopep8
+        ("DECASECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("decas")),  # nopep8
+        ("DECASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 25), Sym("decas")),  # nopep8
+        ("DECASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("decas")),  # nopep8
+        ("DECASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 22), Sym("decas")),  # nopep8
+        ("DECASECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("decas")),  # nopep8
+        ("DECISECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 17), Sym("decis")),  # nopep8
+        ("DECISECOND", "CENTISECOND"): lambda:
+            Mul(Int(10), Sym("decis")),  # nopep8
+        ("DECISECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Int(864000)), Sym("decis")),  # nopep8
+        ("DECISECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("decis")),  # nopep8
+        ("DECISECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("decis")),  # nopep8
+        ("DECISECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 14), Sym("decis")),  # nopep8
+        ("DECISECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("decis")),  # nopep8
+        ("DECISECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("decis")),  # nopep8
+        ("DECISECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Int(36000)), Sym("decis")),  # nopep8
+        ("DECISECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("decis")),  # nopep8
+        ("DECISECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("decis")),  # nopep8
+        ("DECISECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 5), Sym("decis")),  # nopep8
+        ("DECISECOND", "MILLISECOND"): lambda:
+            Mul(Int(100), Sym("decis")),  # nopep8
+        ("DECISECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Int(600)), Sym("decis")),  # nopep8
+        ("DECISECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 8), Sym("decis")),  # nopep8
+        ("DECISECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("decis")),  # nopep8
+        ("DECISECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 11), Sym("decis")),  # nopep8
+        ("DECISECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("decis")),  # nopep8
+        ("DECISECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("decis")),  # nopep8
+        ("DECISECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 23), Sym("decis")),  # nopep8
+        ("DECISECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("decis")),  # nopep8
+        ("DECISECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 20), Sym("decis")),  # nopep8
+        ("DECISECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("decis")),  # nopep8
+        ("EXASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 36), Sym("exas")),  # nopep8
+        ("EXASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 20), Sym("exas")),  # nopep8
+        ("EXASECOND", "DAY"): lambda:
+            Mul(Rat(Mul(Int(3125), Pow(10, 11)), Int(27)), Sym("exas")),  # nopep8
+        ("EXASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 17), Sym("exas")),  # nopep8
+        ("EXASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 19), Sym("exas")),  # nopep8
+        ("EXASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 33), Sym("exas")),  # nopep8
+        ("EXASECOND", "GIGASECOND"): lambda:
+            Mul(Pow(10, 9), Sym("exas")),  # nopep8
+        ("EXASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 16), Sym("exas")),  # nopep8
+        ("EXASECOND", "HOUR"): lambda:
+            Mul(Rat(Mul(Int(25), Pow(10, 14)), Int(9)), Sym("exas")),  # nopep8
+        ("EXASECOND", "KILOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("exas")),  # nopep8
+        ("EXASECOND", "MEGASECOND"): lambda:
+            Mul(Pow(10, 12), Sym("exas")),  # nopep8
+        ("EXASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("exas")),  # nopep8
+        ("EXASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 21), Sym("exas")),  # nopep8
+        ("EXASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 16)), Int(3)), Sym("exas")),  # nopep8
+        ("EXASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("exas")),  # nopep8
+        ("EXASECOND", "PETASECOND"): lambda:
+            Mul(Int(1000), Sym("exas")),  # nopep8
+        ("EXASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("exas")),  # nopep8
+        ("EXASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 18), Sym("exas")),  # nopep8
+        ("EXASECOND", "TERASECOND"): lambda:
+            Mul(Pow(10, 6), Sym("exas")),  # nopep8
+        ("EXASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 42), Sym("exas")),  # nopep8
+        ("EXASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("exas")),  # nopep8
+        ("EXASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 39), Sym("exas")),  # nopep8
+        ("EXASECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("exas")),  # nopep8
+        ("FEMTOSECOND", "ATTOSECOND"): lambda:
+            Mul(Int(1000), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 17))), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 17)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 17))), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "MICROSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 16))), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "NANOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "PICOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("femtos")),  # nopep8
+        ("FEMTOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("femtos")),  # nopep8
+        ("GIGASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 11), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "DAY"): lambda:
+            Mul(Rat(Int(312500), Int(27)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 8), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 10), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 7), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "HOUR"): lambda:
+            Mul(Rat(Mul(Int(25), Pow(10, 5)), Int(9)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "KILOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "MEGASECOND"): lambda:
+            Mul(Int(1000), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 12), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 7)), Int(3)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 9), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 33), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("gigas")),  # nopep8
+        ("GIGASECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("gigas")),  # nopep8
+        ("HECTOSECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 20), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 4), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Int(864)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "DECASECOND"): lambda:
+            Mul(Int(10), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "DECISECOND"): lambda:
+            Mul(Int(1000), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 16)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 17), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Int(36)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 8), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 5), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(5), Int(3)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 11), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 14), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "SECOND"): lambda:
+            Mul(Int(100), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 26), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 23), Sym("hectos")),  # nopep8
+        ("HECTOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("hectos")),  # nopep8
+        ("HOUR", "ATTOSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 20)), Sym("h")),  # nopep8
+        ("HOUR", "CENTISECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 4)), Sym("h")),  # nopep8
+        ("HOUR", "DAY"): lambda:
+            Mul(Rat(Int(1), Int(24)), Sym("h")),  # nopep8
+        ("HOUR", "DECASECOND"): lambda:
+            Mul(Int(360), Sym("h")),  # nopep8
+        ("HOUR", "DECISECOND"): lambda:
+            Mul(Int(36000), Sym("h")),  # nopep8
+        ("HOUR", "EXASECOND"): lambda:
+            Mul(Rat(Int(9), Mul(Int(25), Pow(10, 14))), Sym("h")),  # nopep8
+        ("HOUR", "FEMTOSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 17)), Sym("h")),  # nopep8
+        ("HOUR", "GIGASECOND"): lambda:
+            Mul(Rat(Int(9), Mul(Int(25), Pow(10, 5))), Sym("h")),  # nopep8
+        ("HOUR", "HECTOSECOND"): lambda:
+            Mul(Int(36), Sym("h")),  # nopep8
+        ("HOUR", "KILOSECOND"): lambda:
+            Mul(Rat(Int(18), Int(5)), Sym("h")),  # nopep8
+        ("HOUR", "MEGASECOND"): lambda:
+            Mul(Rat(Int(9), Int(2500)), Sym("h")),  # nopep8
+        ("HOUR", "MICROSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 8)), Sym("h")),  # nopep8
+        ("HOUR", "MILLISECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 5)), Sym("h")),  # nopep8
+        ("HOUR", "MINUTE"): lambda:
+            Mul(Int(60), Sym("h")),  # nopep8
+        ("HOUR", "NANOSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 11)), Sym("h")),  # nopep8
+        ("HOUR", "PETASECOND"): lambda:
+            Mul(Rat(Int(9), Mul(Int(25), Pow(10, 11))), Sym("h")),  # nopep8
+        ("HOUR", "PICOSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 14)), Sym("h")),  # nopep8
+        ("HOUR", "SECOND"): lambda:
+            Mul(Int(3600), Sym("h")),  # nopep8
+        ("HOUR", "TERASECOND"): lambda:
+            Mul(Rat(Int(9), Mul(Int(25), Pow(10, 8))), Sym("h")),  # nopep8
+        ("HOUR", "YOCTOSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 26)), Sym("h")),  # nopep8
+        ("HOUR", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(9), Mul(Int(25), Pow(10, 20))), Sym("h")),  # nopep8
+        ("HOUR", "ZEPTOSECOND"): lambda:
+            Mul(Mul(Int(36), Pow(10, 23)), Sym("h")),  # nopep8
+        ("HOUR", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(9), Mul(Int(25), Pow(10, 17))), Sym("h")),  # nopep8
+        ("KILOSECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 5), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(5), Int(432)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "DECASECOND"): lambda:
+            Mul(Int(100), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 4), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "HECTOSECOND"): lambda:
+            Mul(Int(10), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(5), Int(18)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 6), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(50), Int(3)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "SECOND"): lambda:
+            Mul(Int(1000), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("kilos")),  # nopep8
+        ("KILOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("kilos")),  # nopep8
+        ("MEGASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("megas")),  # nopep8
+        ("MEGASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 8), Sym("megas")),  # nopep8
+        ("MEGASECOND", "DAY"): lambda:
+            Mul(Rat(Int(625), Int(54)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 5), Sym("megas")),  # nopep8
+        ("MEGASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 7), Sym("megas")),  # nopep8
+        ("MEGASECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("megas")),  # nopep8
+        ("MEGASECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 4), Sym("megas")),  # nopep8
+        ("MEGASECOND", "HOUR"): lambda:
+            Mul(Rat(Int(2500), Int(9)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "KILOSECOND"): lambda:
+            Mul(Int(1000), Sym("megas")),  # nopep8
+        ("MEGASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("megas")),  # nopep8
+        ("MEGASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 9), Sym("megas")),  # nopep8
+        ("MEGASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 4)), Int(3)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("megas")),  # nopep8
+        ("MEGASECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("megas")),  # nopep8
+        ("MEGASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 6), Sym("megas")),  # nopep8
+        ("MEGASECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("megas")),  # nopep8
+        ("MEGASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("megas")),  # nopep8
+        ("MEGASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("megas")),  # nopep8
+        ("MEGASECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("megas")),  # nopep8
+        ("MICROSECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("micros")),  # nopep8
+        ("MICROSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 8))), Sym("micros")),  # nopep8
+        ("MICROSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("micros")),  # nopep8
+        ("MICROSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 8))), Sym("micros")),  # nopep8
+        ("MICROSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 7))), Sym("micros")),  # nopep8
+        ("MICROSECOND", "NANOSECOND"): lambda:
+            Mul(Int(1000), Sym("micros")),  # nopep8
+        ("MICROSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("micros")),  # nopep8
+        ("MICROSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("micros")),  # nopep8
+        ("MICROSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("micros")),  # nopep8
+        ("MICROSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("micros")),  # nopep8
+        ("MICROSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("micros")),  # nopep8
+        ("MILLISECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("millis")),  # nopep8
+        ("MILLISECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 5))), Sym("millis")),  # nopep8
+        ("MILLISECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 4)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("millis")),  # nopep8
+        ("MILLISECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 5)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 5))), Sym("millis")),  # nopep8
+        ("MILLISECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "MICROSECOND"): lambda:
+            Mul(Int(1000), Sym("millis")),  # nopep8
+        ("MILLISECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 4))), Sym("millis")),  # nopep8
+        ("MILLISECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("millis")),  # nopep8
+        ("MILLISECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("millis")),  # nopep8
+        ("MILLISECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("millis")),  # nopep8
+        ("MILLISECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("millis")),  # nopep8
+        ("MILLISECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("millis")),  # nopep8
+        ("MILLISECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("millis")),  # nopep8
+        ("MINUTE", "ATTOSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 19)), Sym("m")),  # nopep8
+        ("MINUTE", "CENTISECOND"): lambda:
+            Mul(Int(6000), Sym("m")),  # nopep8
+        ("MINUTE", "DAY"): lambda:
+            Mul(Rat(Int(1), Int(1440)), Sym("m")),  # nopep8
+        ("MINUTE", "DECASECOND"): lambda:
+            Mul(Int(6), Sym("m")),  # nopep8
+        ("MINUTE", "DECISECOND"): lambda:
+            Mul(Int(600), Sym("m")),  # nopep8
+        ("MINUTE", "EXASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 16))), Sym("m")),  # nopep8
+        ("MINUTE", "FEMTOSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 16)), Sym("m")),  # nopep8
+        ("MINUTE", "GIGASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 7))), Sym("m")),  # nopep8
+        ("MINUTE", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(3), Int(5)), Sym("m")),  # nopep8
+        ("MINUTE", "HOUR"): lambda:
+            Mul(Rat(Int(1), Int(60)), Sym("m")),  # nopep8
+        ("MINUTE", "KILOSECOND"): lambda:
+            Mul(Rat(Int(3), Int(50)), Sym("m")),  # nopep8
+        ("MINUTE", "MEGASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 4))), Sym("m")),  # nopep8
+        ("MINUTE", "MICROSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 7)), Sym("m")),  # nopep8
+        ("MINUTE", "MILLISECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 4)), Sym("m")),  # nopep8
+        ("MINUTE", "NANOSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 10)), Sym("m")),  # nopep8
+        ("MINUTE", "PETASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 13))), Sym("m")),  # nopep8
+        ("MINUTE", "PICOSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 13)), Sym("m")),  # nopep8
+        ("MINUTE", "SECOND"): lambda:
+            Mul(Int(60), Sym("m")),  # nopep8
+        ("MINUTE", "TERASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 10))), Sym("m")),  # nopep8
+        ("MINUTE", "YOCTOSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 25)), Sym("m")),  # nopep8
+        ("MINUTE", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 22))), Sym("m")),  # nopep8
+        ("MINUTE", "ZEPTOSECOND"): lambda:
+            Mul(Mul(Int(6), Pow(10, 22)), Sym("m")),  # nopep8
+        ("MINUTE", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(3), Mul(Int(5), Pow(10, 19))), Sym("m")),  # nopep8
+        ("NANOSECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 7)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 11))), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 8)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 11))), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "MICROSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 10))), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "PICOSECOND"): lambda:
+            Mul(Int(1000), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("nanos")),  # nopep8
+        ("NANOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("nanos")),  # nopep8
+        ("PETASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 33), Sym("petas")),  # nopep8
+        ("PETASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 17), Sym("petas")),  # nopep8
+        ("PETASECOND", "DAY"): lambda:
+            Mul(Rat(Mul(Int(3125), Pow(10, 8)), Int(27)), Sym("petas")),  # nopep8
+        ("PETASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 14), Sym("petas")),  # nopep8
+        ("PETASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 16), Sym("petas")),  # nopep8
+        ("PETASECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("petas")),  # nopep8
+        ("PETASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("petas")),  # nopep8
+        ("PETASECOND", "GIGASECOND"): lambda:
+            Mul(Pow(10, 6), Sym("petas")),  # nopep8
+        ("PETASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 13), Sym("petas")),  # nopep8
+        ("PETASECOND", "HOUR"): lambda:
+            Mul(Rat(Mul(Int(25), Pow(10, 11)), Int(9)), Sym("petas")),  # nopep8
+        ("PETASECOND", "KILOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("petas")),  # nopep8
+        ("PETASECOND", "MEGASECOND"): lambda:
+            Mul(Pow(10, 9), Sym("petas")),  # nopep8
+        ("PETASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("petas")),  # nopep8
+        ("PETASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 18), Sym("petas")),  # nopep8
+        ("PETASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 13)), Int(3)), Sym("petas")),  # nopep8
+        ("PETASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("petas")),  # nopep8
+        ("PETASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("petas")),  # nopep8
+        ("PETASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 15), Sym("petas")),  # nopep8
+        ("PETASECOND", "TERASECOND"): lambda:
+            Mul(Int(1000), Sym("petas")),  # nopep8
+        ("PETASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 39), Sym("petas")),  # nopep8
+        ("PETASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("petas")),  # nopep8
+        ("PETASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 36), Sym("petas")),  # nopep8
+        ("PETASECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("petas")),  # nopep8
+        ("PICOSECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("picos")),  # nopep8
+        ("PICOSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 10)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 14))), Sym("picos")),  # nopep8
+        ("PICOSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 13)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 11)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Int(1000), Sym("picos")),  # nopep8
+        ("PICOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 14)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 14))), Sym("picos")),  # nopep8
+        ("PICOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "MICROSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 13))), Sym("picos")),  # nopep8
+        ("PICOSECOND", "NANOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("picos")),  # nopep8
+        ("PICOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("picos")),  # nopep8
+        ("PICOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("picos")),  # nopep8
+        ("PICOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("picos")),  # nopep8
+        ("SECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("s")),  # nopep8
+        ("SECOND", "CENTISECOND"): lambda:
+            Mul(Int(100), Sym("s")),  # nopep8
+        ("SECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Int(86400)), Sym("s")),  # nopep8
+        ("SECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Int(10)), Sym("s")),  # nopep8
+        ("SECOND", "DECISECOND"): lambda:
+            Mul(Int(10), Sym("s")),  # nopep8
+        ("SECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("s")),  # nopep8
+        ("SECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 15), Sym("s")),  # nopep8
+        ("SECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("s")),  # nopep8
+        ("SECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(100)), Sym("s")),  # nopep8
+        ("SECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Int(3600)), Sym("s")),  # nopep8
+        ("SECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("s")),  # nopep8
+        ("SECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("s")),  # nopep8
+        ("SECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 6), Sym("s")),  # nopep8
+        ("SECOND", "MILLISECOND"): lambda:
+            Mul(Int(1000), Sym("s")),  # nopep8
+        ("SECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Int(60)), Sym("s")),  # nopep8
+        ("SECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("s")),  # nopep8
+        ("SECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("s")),  # nopep8
+        ("SECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 12), Sym("s")),  # nopep8
+        ("SECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("s")),  # nopep8
+        ("SECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("s")),  # nopep8
+        ("SECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("s")),  # nopep8
+        ("SECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("s")),  # nopep8
+        ("SECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("s")),  # nopep8
+        ("TERASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("teras")),  # nopep8
+        ("TERASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 14), Sym("teras")),  # nopep8
+        ("TERASECOND", "DAY"): lambda:
+            Mul(Rat(Mul(Int(3125), Pow(10, 5)), Int(27)), Sym("teras")),  # nopep8
+        ("TERASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 11), Sym("teras")),  # nopep8
+        ("TERASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 13), Sym("teras")),  # nopep8
+        ("TERASECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("teras")),  # nopep8
+        ("TERASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("teras")),  # nopep8
+        ("TERASECOND", "GIGASECOND"): lambda:
+            Mul(Int(1000), Sym("teras")),  # nopep8
+        ("TERASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 10), Sym("teras")),  # nopep8
+        ("TERASECOND", "HOUR"): lambda:
+            Mul(Rat(Mul(Int(25), Pow(10, 8)), Int(9)), Sym("teras")),  # nopep8
+        ("TERASECOND", "KILOSECOND"): lambda:
+            Mul(Pow(10, 9), Sym("teras")),  # nopep8
+        ("TERASECOND", "MEGASECOND"): lambda:
+            Mul(Pow(10, 6), Sym("teras")),  # nopep8
+        ("TERASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("teras")),  # nopep8
+        ("TERASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 15), Sym("teras")),  # nopep8
+        ("TERASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 10)), Int(3)), Sym("teras")),  # nopep8
+        ("TERASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("teras")),  # nopep8
+        ("TERASECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("teras")),  # nopep8
+        ("TERASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 24), Sym("teras")),  # nopep8
+        ("TERASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 12), Sym("teras")),  # nopep8
+        ("TERASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 36), Sym("teras")),  # nopep8
+        ("TERASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("teras")),  # nopep8
+        ("TERASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 33), Sym("teras")),  # nopep8
+        ("TERASECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("teras")),  # nopep8
+        ("YOCTOSECOND", "ATTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 26))), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 25)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 26)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 26))), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "MICROSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 25))), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "NANOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "PICOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 48)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "ZEPTOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("yoctos")),  # nopep8
+        ("YOCTOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("yoctos")),  # nopep8
+        ("YOTTASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 42), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 26), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "DAY"): lambda:
+            Mul(Rat(Mul(Int(3125), Pow(10, 17)), Int(27)), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 23), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 25), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "EXASECOND"): lambda:
+            Mul(Pow(10, 6), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 39), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "GIGASECOND"): lambda:
+            Mul(Pow(10, 15), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 22), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "HOUR"): lambda:
+            Mul(Rat(Mul(Int(25), Pow(10, 20)), Int(9)), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "KILOSECOND"): lambda:
+            Mul(Pow(10, 21), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "MEGASECOND"): lambda:
+            Mul(Pow(10, 18), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 27), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 22)), Int(3)), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 33), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "PETASECOND"): lambda:
+            Mul(Pow(10, 9), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 36), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 24), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "TERASECOND"): lambda:
+            Mul(Pow(10, 12), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 48), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 45), Sym("yottas")),  # nopep8
+        ("YOTTASECOND", "ZETTASECOND"): lambda:
+            Mul(Int(1000), Sym("yottas")),  # nopep8
+        ("ZEPTOSECOND", "ATTOSECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "CENTISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 19)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "DAY"): lambda:
+            Mul(Rat(Int(1), Mul(Int(864), Pow(10, 23))), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "DECASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 22)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "DECISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 20)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "EXASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 39)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "FEMTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 6)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "GIGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 30)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "HECTOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 23)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "HOUR"): lambda:
+            Mul(Rat(Int(1), Mul(Int(36), Pow(10, 23))), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "KILOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 24)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "MEGASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 27)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "MICROSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 15)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "MILLISECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 18)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "MINUTE"): lambda:
+            Mul(Rat(Int(1), Mul(Int(6), Pow(10, 22))), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "NANOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 12)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "PETASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 36)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "PICOSECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 9)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "SECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 21)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "TERASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 33)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "YOCTOSECOND"): lambda:
+            Mul(Int(1000), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 45)), Sym("zeptos")),  # nopep8
+        ("ZEPTOSECOND", "ZETTASECOND"): lambda:
+            Mul(Rat(Int(1), Pow(10, 42)), Sym("zeptos")),  # nopep8
+        ("ZETTASECOND", "ATTOSECOND"): lambda:
+            Mul(Pow(10, 39), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "CENTISECOND"): lambda:
+            Mul(Pow(10, 23), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "DAY"): lambda:
+            Mul(Rat(Mul(Int(3125), Pow(10, 14)), Int(27)), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "DECASECOND"): lambda:
+            Mul(Pow(10, 20), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "DECISECOND"): lambda:
+            Mul(Pow(10, 22), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "EXASECOND"): lambda:
+            Mul(Int(1000), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "FEMTOSECOND"): lambda:
+            Mul(Pow(10, 36), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "GIGASECOND"): lambda:
+            Mul(Pow(10, 12), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "HECTOSECOND"): lambda:
+            Mul(Pow(10, 19), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "HOUR"): lambda:
+            Mul(Rat(Mul(Int(25), Pow(10, 17)), Int(9)), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "KILOSECOND"): lambda:
+            Mul(Pow(10, 18), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "MEGASECOND"): lambda:
+            Mul(Pow(10, 15), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "MICROSECOND"): lambda:
+            Mul(Pow(10, 27), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "MILLISECOND"): lambda:
+            Mul(Pow(10, 24), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "MINUTE"): lambda:
+            Mul(Rat(Mul(Int(5), Pow(10, 19)), Int(3)), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "NANOSECOND"): lambda:
+            Mul(Pow(10, 30), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "PETASECOND"): lambda:
+            Mul(Pow(10, 6), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "PICOSECOND"): lambda:
+            Mul(Pow(10, 33), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "SECOND"): lambda:
+            Mul(Pow(10, 21), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "TERASECOND"): lambda:
+            Mul(Pow(10, 9), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "YOCTOSECOND"): lambda:
+            Mul(Pow(10, 45), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "YOTTASECOND"): lambda:
+            Mul(Rat(Int(1), Int(1000)), Sym("zettas")),  # nopep8
+        ("ZETTASECOND", "ZEPTOSECOND"): lambda:
+            Mul(Pow(10, 42), Sym("zettas")),  # nopep8
+    })
 
     SYMBOLS = dict()
     SYMBOLS["ATTOSECOND"] = "as"
@@ -1216,7 +1215,7 @@ class TimeI(_omero_model.Time, UnitBase):
                     t = (value.getValue(), source, target)
                     msg = "%s %s cannot be converted to %s" % t
                     raise Exception(msg)
-                self.setValue(c(value.getValue()))
+                self.setValue(c.convert(value.getValue()))
                 self.setUnit(target)
         else:
             self.setValue(value)
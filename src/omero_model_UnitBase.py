@@ -27,8 +27,36 @@ the unit implementations.
 
 from builtins import str
 from builtins import object
+from past.builtins import basestring
+import numbers
+
+
 class UnitBase(object):
 
+    @classmethod
+    def convert(cls, values, source, target):
+        """
+        Converts values from the source to the target unit, either of
+        which may be given as an enum value or by name. values may be
+        a single number or a sequence or numpy array, in which case
+        a numpy array of floats is returned, converted in one step.
+        """
+        unit_type = type(cls.UNIT_VALUES[0])
+        if isinstance(source, basestring):
+            source = getattr(unit_type, source)
+        if isinstance(target, basestring):
+            target = getattr(unit_type, target)
+        if not isinstance(values, numbers.Number):
+            import numpy
+            values = numpy.asarray(values, dtype=float)
+        if source == target:
+            return values
+        c = cls.CONVERSIONS.get(source).get(target)
+        if c is None:
+            raise Exception("%s cannot be converted to %s" % (
+                source, target))
+        return c.convert(values)
+
     def _base_string(self, v, u):
         if v is not None:
             return "%s %s" % (v, str(u))
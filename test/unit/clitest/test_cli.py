@@ -11,6 +11,8 @@
 
 from builtins import range
 from builtins import object
+import os
+import time
 import pytest
 
 from omero.cli import CLI, NonZeroReturnCode
@@ -65,3 +67,171 @@ class TestCli(object):
 
         self.cli.invoke("load -k %s" % tmpfile, strict=True)
         self.cli.invoke("load --keep-going %s" % tmpfile, strict=True)
+
+    LAZY_PLUGIN = """
+from omero.cli import BaseControl
+
+with open(%r, "a") as f:
+    f.write("loaded\\n")
+
+
+class LazyControl(BaseControl):
+
+    def _configure(self, parser):
+        parser.add_argument("--flag", action="store_true")
+        parser.set_defaults(func=self.__call__)
+
+    def __call__(self, args):
+        self.ctx.set("lazy.flag", args.flag)
+
+register("lazytest", LazyControl, "Lazily loaded%s")
+"""
+
+    def testPluginManifest(self, tmpdir, monkeypatch):
+        monkeypatch.setenv("OMERO_USERDIR", str(tmpdir))
+        log = tmpdir.join("log")
+        plugins = tmpdir.mkdir("plugins")
+        plugin = plugins.join("lazytest.py")
+        plugin.write(self.LAZY_PLUGIN % (str(log), ""))
+
+        def load():
+            cli = CLI()
+            cli._plugin_paths.append(str(plugins))
+            cli.loadplugins()
+            return cli
+
+        load()
+        assert log.read() == "loaded\n"
+
+        # Unchanged plugins are only executed when used
+        cli = load()
+        assert log.read() == "loaded\n"
+        assert isinstance(
+            dict.get(cli.controls, "lazytest"), CLI.LazyControl)
+        cli.invoke(["lazytest", "--flag"], strict=True)
+        assert cli.get("lazy.flag")
+        assert log.read() == "loaded\n" * 2
+
+        # Modified plugins are executed again
+        plugin.write(self.LAZY_PLUGIN % (str(log), " (modified)"))
+        cli = load()
+        assert log.read() == "loaded\n" * 3
+        assert "lazytest" in cli.controls
+        assert not isinstance(cli.controls["lazytest"], CLI.LazyControl)
+
+    CONDITIONAL_PLUGIN = """
+import os
+from omero.cli import BaseControl
+
+
+class CondControl(BaseControl):
+
+    def _configure(self, parser):
+        parser.set_defaults(func=self.__call__)
+
+    def __call__(self, args):
+        self.ctx.set("cond.called", True)
+
+if "OMERO_DEV_PLUGINS" in os.environ:
+    register("devtest", CondControl, "Development")
+if "CONDTEST" in os.environ:
+    register("condtest", CondControl, "Conditional")
+"""
+
+    def testPluginManifestConditional(self, tmpdir, monkeypatch):
+        monkeypatch.setenv("OMERO_USERDIR", str(tmpdir))
+        monkeypatch.delenv("OMERO_DEV_PLUGINS", raising=False)
+        plugins = tmpdir.mkdir("plugins")
+        plugins.join("condtest.py").write(self.CONDITIONAL_PLUGIN)
+
+        def load():
+            cli = CLI()
+            cli._plugin_paths.append(str(plugins))
+            cli.loadplugins()
+            return cli
+
+        monkeypatch.setenv("CONDTEST", "1")
+        assert "devtest" not in load().controls
+
+        # The manifest is not used if the environment changed
+        monkeypatch.setenv("OMERO_DEV_PLUGINS", "1")
+        cli = load()
+        assert not isinstance(dict.get(cli.controls, "devtest"),
+                              CLI.LazyControl)
+        cli.invoke(["devtest"], strict=True)
+        assert cli.get("cond.called")
+
+        # Commands which are not registered any more fail cleanly
+        cli = load()
+        assert isinstance(
+            dict.get(cli.controls, "condtest"), CLI.LazyControl)
+        monkeypatch.delenv("CONDTEST")
+        with pytest.raises(NonZeroReturnCode):
+            cli.invoke(["condtest"], strict=True)
+        assert "condtest" not in cli.controls
+        cli = load()
+        assert "condtest" not in cli.controls
+        assert "devtest" in cli.controls
+
+        # Plugins emitting warnings are executed each time
+        plugins.join("warntest.py").write(
+            "import warnings\n"
+            "from omero.cli import BaseControl\n"
+            "warnings.warn('Deprecated', DeprecationWarning)\n"
+            "register('warntest', BaseControl, 'Deprecated')\n")
+        for x in range(2):
+            with pytest.warns(DeprecationWarning):
+                cli = load()
+            assert not isinstance(
+                dict.get(cli.controls, "warntest"), CLI.LazyControl)
+
+    def testServer(self, tmpdir, monkeypatch, capsys):
+        import subprocess
+        import sys
+        from threading import Thread
+        from omero.cli import BaseControl, CLIServer
+        from omero.main import forward
+
+        class EchoControl(BaseControl):
+
+            def _configure(self, parser):
+                parser.add_argument("text", nargs="*")
+                parser.add_argument("--fail", action="store_true")
+                parser.add_argument("--child", action="store_true")
+                parser.set_defaults(func=self.__call__)
+
+            def __call__(self, args):
+                self.ctx.out(" ".join(args.text))
+                self.ctx.err(os.getcwd())
+                if args.child:
+                    subprocess.call([sys.executable, "-c", "print('child')"])
+                    self.ctx.out("done")
+                if args.fail:
+                    self.ctx.input("Password:", hidden=True)
+
+        socket_path = str(tmpdir.join("cli.sock"))
+        cli = CLI()
+        cli.register("echo", EchoControl, "help")
+        server = CLIServer(cli, socket_path)
+        thread = Thread(target=server.serve)
+        thread.start()
+        try:
+            for x in range(50):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(0.1)
+            monkeypatch.chdir(tmpdir)
+            assert forward(socket_path, ["echo", "a", "b"]) == 0
+            out, err = capsys.readouterr()
+            assert out == "a b\n"
+            assert err.endswith(os.path.realpath(str(tmpdir)) + "\n")
+            assert forward(socket_path, ["echo", "--child"]) == 0
+            assert capsys.readouterr()[0] == "\nchild\ndone\n"
+            assert forward(socket_path, ["echo", "--fail"]) == 1
+            assert "Input is not available" in capsys.readouterr()[1]
+            assert forward(socket_path, ["shell"]) is None
+        finally:
+            server.stop()
+            thread.join()
+        assert not os.path.exists(socket_path)
+        assert forward(socket_path, ["echo"]) is None
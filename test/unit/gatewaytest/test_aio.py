@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+   gateway tests - asyncio facade
+
+   Copyright 2026 University of Dundee. All rights reserved.
+   Use is subject to license terms supplied in LICENSE.txt
+
+"""
+
+from builtins import object
+import asyncio
+import threading
+
+import pytest
+
+from omero.gateway.aio import AsyncBlitzGateway, ami
+
+
+class MockQueryPrx(object):
+    """
+    Answers begin_ calls from another thread, as Ice does
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def _answer(self, _response, _ex, rv, delay=0.05):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        def done():
+            with self.lock:
+                self.in_flight -= 1
+            if isinstance(rv, Exception):
+                _ex(rv)
+            else:
+                _response(*rv)
+        threading.Timer(delay, done).start()
+
+    def begin_findByQuery(self, query, params, _response=None, _ex=None,
+                          _ctx=None):
+        self.calls.append((query, _ctx))
+        self._answer(_response, _ex, (query.upper(),))
+
+    def begin_getTwo(self, _response=None, _ex=None, _ctx=None):
+        self._answer(_response, _ex, (1, 2))
+
+    def begin_fail(self, _response=None, _ex=None, _ctx=None):
+        self._answer(_response, _ex, ValueError("failed"))
+
+
+class MockProxyObjectWrapper(object):
+
+    def __init__(self, prx):
+        self._obj = None
+        self.prx = prx
+        self.threads = []
+
+    def _getObj(self):
+        self.threads.append(threading.current_thread())
+        self._obj = self.prx
+        return self._obj
+
+
+class MockConnection(object):
+
+    def __init__(self):
+        self.query = MockProxyObjectWrapper(MockQueryPrx())
+
+    def getQueryService(self):
+        return self.query
+
+
+class TestAsyncBlitzGateway(object):
+
+    def test_concurrent_calls(self):
+        conn = MockConnection()
+        aio = AsyncBlitzGateway(conn)
+
+        async def main():
+            qs = aio.getQueryService()
+            return await asyncio.gather(
+                *[qs.findByQuery("q%s" % i, None, _ctx={"omero.group": "-1"})
+                  for i in range(50)])
+        rv = asyncio.run(main())
+        aio.close()
+        assert rv == ["Q%s" % i for i in range(50)]
+        prx = conn.query.prx
+        assert ("q0", {"omero.group": "-1"}) in prx.calls
+        # All the calls were in flight at once, without a thread each
+        assert prx.max_in_flight == 50
+        # The service was created once, off the event loop
+        assert len(conn.query.threads) == 1
+        assert conn.query.threads[0] is not threading.main_thread()
+
+    def test_results(self):
+        prx = MockQueryPrx()
+
+        async def main():
+            two = await ami(prx.begin_getTwo)
+            with pytest.raises(ValueError):
+                await ami(prx.begin_fail)
+            return two
+        assert asyncio.run(main()) == (1, 2)
+
+    def test_run(self):
+        aio = AsyncBlitzGateway(MockConnection(), workers=2)
+
+        async def main():
+            return await aio.run(lambda x, y=0: (
+                x + y, threading.current_thread()), 1, y=2)
+        rv, thread = asyncio.run(main())
+        aio.close()
+        assert rv == 3
+        assert thread is not threading.main_thread()
+
+    def test_unknown(self):
+        aio = AsyncBlitzGateway(MockConnection())
+        with pytest.raises(AttributeError):
+            aio.renderJpeg
+        qs = aio.getQueryService()
+        with pytest.raises(AttributeError):
+            asyncio.run(qs.unknownMethod())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+   gateway tests - Connection pool
+
+   Copyright 2026 University of Dundee. All rights reserved.
+   Use is subject to license terms supplied in LICENSE.txt
+
+"""
+
+from builtins import object
+import threading
+
+import omero
+import pytest
+
+from omero.gateway.pool import BlitzGatewayPool
+from omero.gateway.utils import ServiceOptsDict
+
+
+class MockGateway(object):
+
+    created = []
+
+    def __init__(self, host=None, port=None, **kwargs):
+        self.host = host
+        self.closed = None
+        self.alive = True
+        self.session = None
+        self.SERVICE_OPTS = self.createServiceOptsDict()
+        MockGateway.created.append(self)
+
+    def connect(self, sUuid=None):
+        self.session = sUuid
+        return sUuid != "invalid"
+
+    def getLastError(self):
+        return "no session"
+
+    def createServiceOptsDict(self):
+        return ServiceOptsDict()
+
+    def isConnected(self):
+        return self.closed is None
+
+    def keepAlive(self):
+        return self.alive
+
+    def close(self, hard=True):
+        self.closed = hard
+
+
+@pytest.fixture
+def pool():
+    MockGateway.created = []
+    pool = BlitzGatewayPool(host="localhost", maxsize=2, check_interval=0,
+                            timeout=0.1, gateway_class=MockGateway)
+    yield pool
+    pool.close()
+
+
+class TestBlitzGatewayPool(object):
+
+    def test_reuse(self, pool):
+        with pool.connect("a", group=3) as conn:
+            assert conn.session == "a"
+            assert conn.SERVICE_OPTS.getOmeroGroup() == "3"
+            conn.SERVICE_OPTS.setOmeroGroup(-1)
+        with pool.connect("a", group=3) as again:
+            assert again is conn
+            assert again.SERVICE_OPTS.getOmeroGroup() == "3"
+        with pool.connect("a") as other:
+            assert other is not conn
+        stats = pool.getStats()
+        assert (stats["created"], stats["reused"]) == (2, 1)
+        assert (stats["open"], stats["idle"]) == (2, 2)
+
+    def test_evict(self, pool):
+        with pool.connect("a"):
+            pass
+        with pool.connect("b"):
+            pass
+        with pool.connect("c") as conn:
+            assert conn.session == "c"
+        a, b, c = MockGateway.created
+        # The least recently used connection was closed, keeping the session
+        assert a.closed is False
+        assert b.closed is None
+        assert pool.getStats()["open"] == 2
+
+    def test_full(self, pool):
+        first = pool.checkout("a")
+        pool.checkout("b")
+        with pytest.raises(omero.ClientError):
+            pool.checkout("c")
+
+        def checkin():
+            pool.checkin(first)
+        t = threading.Timer(0.05, checkin)
+        t.start()
+        assert pool.checkout("a", timeout=5) is first
+        t.join()
+
+    def test_invalid_session(self, pool):
+        with pytest.raises(omero.ClientError):
+            pool.checkout("invalid")
+        assert MockGateway.created[0].closed is False
+        assert pool.getStats()["open"] == 0
+
+    def test_discard_on_ice_error(self, pool):
+        import Ice
+        with pytest.raises(Ice.LocalException):
+            with pool.connect("a") as conn:
+                raise Ice.LocalException()
+        assert conn.closed is False
+        with pytest.raises(ValueError):
+            with pool.connect("a") as again:
+                raise ValueError()
+        assert again.closed is None
+        assert pool.getStats()["idle"] == 1
+
+    def test_check(self, pool):
+        with pool.connect("a") as a:
+            pass
+        with pool.connect("b") as b:
+            pass
+        b.alive = False
+        pool.check()
+        assert a.closed is None
+        assert b.closed is False
+        pool.idle_timeout = 0
+        pool.check()
+        assert a.closed is False
+        assert pool.getStats()["open"] == 0
+
+    def test_close(self, pool):
+        conn = pool.checkout("a")
+        pool.close()
+        pool.checkin(conn)
+        assert conn.closed is False
+        with pytest.raises(omero.ClientError):
+            pool.checkout("a")
@@ -16,6 +16,7 @@ from builtins import object
 from omero.gateway.utils import ServiceOptsDict
 from omero.gateway.utils import toBoolean
 from omero.gateway.utils import propertiesToDict
+from omero.gateway.utils import GatewayCache
 import pytest
 
 
@@ -306,3 +307,48 @@ class TestHelpers (object):
 
         assert dictprop['str']['1']['enabled'] == 't'
         assert dictprop['str']['2']['enabled'] == 'f'
+
+
+class TestGatewayCache (object):
+
+    def test_hits(self):
+        cache = GatewayCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return len(calls)
+        assert cache.get("a", loader) == 1
+        assert cache.get("a", loader) == 1
+        assert cache.get("b", loader) == 2
+        assert cache.getStats()["hits"] == 1
+        assert cache.getStats()["misses"] == 2
+        assert cache.getStats()["size"] == 2
+        cache.invalidate()
+        assert cache.get("a", loader) == 3
+        assert cache.getStats()["misses"] == 3
+
+    def test_lru(self):
+        cache = GatewayCache(maxsize=2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        assert cache.get("a", lambda: -1) == 1
+        cache.get("c", lambda: 3)
+        # "b" was the least recently used
+        assert cache.get("b", lambda: -2) == -2
+        assert cache.get("c", lambda: -3) == 3
+        assert cache.getStats()["size"] == 2
+
+    def test_ttl(self):
+        cache = GatewayCache(ttl=0)
+        cache.get("a", lambda: 1)
+        assert cache.get("a", lambda: 2) == 2
+
+    def test_invalidate_while_loading(self):
+        cache = GatewayCache()
+
+        def loader():
+            cache.invalidate()
+            return 1
+        assert cache.get("a", loader) == 1
+        assert cache.get("a", lambda: 2) == 2
@@ -14,6 +14,7 @@ from __future__ import print_function
 from builtins import str
 from past.utils import old_div
 from builtins import object
+import os
 import time
 import pytest
 import omero.columns
@@ -155,6 +156,44 @@ class TestHdfStorage(TestCase):
         assert 7 == data.columns[2].values[1]
         hdf.cleanup()
 
+    def testUpdateRuns(self):
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        self.init(hdf, True)
+        for i in range(6):
+            self.append(hdf, {"a": i, "b": i, "c": i})
+        data = hdf.readCoordinates(hdf._stamp, [4, 0, 1, 5, 1], self.current)
+        data.columns[0].values = [40, 0, 10, 50, 11]
+        assert 4 == hdf.update(hdf._stamp, data)
+        data = hdf.read(hdf._stamp, [0, 1], 0, 6, self.current)
+        assert data.columns[0].values.tolist() == [0, 11, 2, 3, 40, 50]
+        assert data.columns[1].values.tolist() == [0, 1, 2, 3, 4, 5]
+
+        data.columns[0].values = [1]
+        with pytest.raises(omero.ValidationException):
+            hdf.update(hdf._stamp, data)
+        hdf.cleanup()
+
+    def testColumnProjection(self):
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        self.init(hdf, True)
+        self.append(hdf, {"a": 1, "b": 2, "c": 3})
+        self.append(hdf, {"a": 5, "b": 6, "c": 7})
+        data = hdf.readCoordinates(hdf._stamp, [1], self.current, [2, 0])
+        assert [c.name for c in data.columns] == ["c", "a"]
+        assert data.columns[0].values.tolist() == [7]
+        assert data.columns[1].values.tolist() == [5]
+
+        data = hdf.slice(hdf._stamp, [1], [0, 1], self.current)
+        assert [c.name for c in data.columns] == ["b"]
+        assert data.columns[0].values.tolist() == [2, 6]
+
+        # Columns are copies of a cached prototype
+        cols1 = hdf.cols(None, self.current, [0])
+        cols2 = hdf.cols(None, self.current, [0])
+        assert cols1[0] is not cols2[0]
+        assert cols1[0].name == cols2[0].name == "a"
+        hdf.cleanup()
+
     def testReadTicket1951(self):
         hdf = HdfStorage(self.hdfpath(), self.lock)
         self.init(hdf, True)
@@ -182,6 +221,103 @@ class TestHdfStorage(TestCase):
         # Doesn't work yet.
         hdf.cleanup()
 
+    def testPool(self, monkeypatch):
+        hdflist = HdfList(pool_size=1)
+        monkeypatch.setattr(storage_module, 'HDFLIST', hdflist)
+        p1 = str(self.hdfpath())
+        p2 = str(self.hdfpath())
+        t = object()
+
+        # Writable storages are closed
+        hdf = hdflist.getOrCreate(p1, t)
+        self.init(hdf)
+        hdf.decr(t)
+        assert hdf._HdfStorage__hdf_file is None
+
+        hdf = hdflist.getOrCreate(p1, t, read_only=True)
+        hdf.decr(t)
+        assert hdflist.getOrCreate(p1, t, read_only=True) is hdf
+        hdf.decr(t)
+
+        # Files changed on disk are re-opened
+        os.utime(p1, (0, 0))
+        hdf2 = hdflist.getOrCreate(p1, t, read_only=True)
+        assert hdf2 is not hdf
+        assert hdf._HdfStorage__hdf_file is None
+        hdf2.decr(t)
+
+        # The least recently used file is closed
+        hdf3 = HdfStorage(p2, self.lock)
+        self.init(hdf3)
+        hdf3.cleanup()
+        hdf3 = hdflist.getOrCreate(p2, t, read_only=True)
+        hdf3.decr(t)
+        assert hdf2._HdfStorage__hdf_file is None
+        assert hdf3._HdfStorage__hdf_file is not None
+
+        # Idle storages are not handed out for writing
+        hdf4 = hdflist.getOrCreate(p2, t)
+        assert hdf4 is not hdf3
+        assert hdf3._HdfStorage__hdf_file is None
+        hdf4.decr(t)
+
+        hdflist.drain()
+        assert hdf4._HdfStorage__hdf_file is None
+
+    def testPoolReleasesLock(self, monkeypatch, mocker):
+        hdflist = HdfList(pool_size=1)
+        monkeypatch.setattr(storage_module, 'HDFLIST', hdflist)
+        p1 = str(self.hdfpath())
+        t = object()
+        hdf = hdflist.getOrCreate(p1, t)
+        self.init(hdf)
+        hdf.decr(t)
+        # The writable storage was not kept, so a new HdfList can lock it
+        other = mocker.Mock()
+        other.openfile.return_value = open(p1)
+        hdffile = HdfList().addOrThrow(p1, other)
+        hdffile.close()
+
+    def testQueryCache(self, monkeypatch):
+        cache = storage_module.QueryCache()
+        monkeypatch.setattr(storage_module, 'QUERYCACHE', cache)
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        self.init(hdf, True)
+        self.append(hdf, {"a": 1, "b": 2, "c": 3})
+        self.append(hdf, {"a": 1, "b": 0, "c": 3})
+
+        def where(condition='(a==v)', variables=None):
+            return hdf.getWhereList(time.time(), condition,
+                                    variables or {"v": 1}, None,
+                                    None, None, None)
+
+        assert where() == [0, 1]
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert where() == [0, 1]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert where(variables={"v": 2}) == []
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # Modifications invalidate the results of the file
+        self.append(hdf, {"a": 1, "b": 4, "c": 3})
+        assert where() == [0, 1, 2]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        # Least recently used entries are evicted to stay within maxbytes
+        cache.maxbytes = 2 * (cache.OVERHEAD + 24)
+        assert where('(b>v)') == [0, 2]
+        assert where('(c>v)') == [0, 1, 2]
+        assert cache.nbytes <= cache.maxbytes
+        assert where('(c>v)') == [0, 1, 2]
+        assert where() == [0, 1, 2]
+        assert (cache.hits, cache.misses) == (2, 6)
+
+        cache.maxbytes = 0
+        assert where() == [0, 1, 2]
+        assert cache.hits == 2
+        hdf.cleanup()
+        assert cache.nbytes == 0
+
     def testInitializeInvalidColoumnNames(self):
         hdf = HdfStorage(self.hdfpath(), self.lock)
 
@@ -406,6 +542,12 @@ class TestHdfStorage(TestCase):
         assert data.columns[0].values[0] == 5
         assert data.rowNumbers == [1]
 
+        # Row numbers can be omitted for chunked reads
+        data = hdf.read(time.time(), [0], 1, 3, self.current,
+                        row_numbers=False)
+        assert data.columns[0].values.tolist() == [2, 3]
+        assert data.rowNumbers == []
+
        # Reads no row
         data = hdf.read(time.time(), [0, 1, 2], 1, 1, self.current)
         assert len(data.columns) == 3
@@ -443,6 +585,240 @@ class TestHdfStorage(TestCase):
         assert data.rowNumbers == [1, 2]
         hdf.cleanup()
 
+    def testAppendNumpyArrays(self):
+        numpy = pytest.importorskip("numpy")
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        cols = [
+            omero.columns.LongColumnI('a'),
+            omero.columns.DoubleColumnI('b'),
+            omero.columns.StringColumnI('c', '', 3),
+            omero.columns.DoubleArrayColumnI('d', '', 2)]
+        hdf.initialize(cols)
+        for col in cols[2:]:
+            col.settable(hdf._HdfStorage__mea)  # Needed for size
+        cols[0].values = numpy.arange(3, dtype=numpy.int64)
+        cols[1].values = numpy.array([0.5, 1.5, 2.5])
+        cols[2].values = numpy.array(["x", "yy", "zzz"])
+        cols[3].values = numpy.arange(6, dtype=numpy.float64).reshape(3, 2)
+        hdf.append(cols)
+
+        data = hdf.read(time.time(), [0, 1, 2, 3], 0, 3, self.current)
+        assert data.columns[0].values.tolist() == [0, 1, 2]
+        assert data.columns[1].values.tolist() == [0.5, 1.5, 2.5]
+        assert data.columns[2].values == ["x", "yy", "zzz"]
+        assert data.columns[3].values.tolist() == [[0, 1], [2, 3], [4, 5]]
+
+        cols[2].values = numpy.array(["toolong"])
+        with pytest.raises(omero.ValidationException):
+            cols[2].arrays()
+        cols[3].values = numpy.zeros((1, 3))
+        with pytest.raises(omero.ValidationException):
+            cols[3].arrays()
+        hdf.cleanup()
+
+    def testNumpyColumnValues(self):
+        numpy = pytest.importorskip("numpy")
+        col = omero.columns.LongColumnI('a')
+        col.setsize(3)
+        assert isinstance(col.values, numpy.ndarray)
+        assert col.values.dtype == numpy.int64
+        col.fromrows(numpy.arange(3, dtype=numpy.int64), field_only=True)
+        assert isinstance(col.values, numpy.ndarray)
+        assert col.marshal() is col
+        assert isinstance(col.values, numpy.ndarray)
+        assert col.values.tolist() == [0, 1, 2]
+
+        # Other types are converted to lists
+        col.fromrows(numpy.arange(3, dtype=numpy.int32), field_only=True)
+        col.marshal()
+        assert col.values == [0, 1, 2]
+
+        col = omero.columns.StringColumnI('s', '', 3)
+        col.fromrows(numpy.array([b"x", b"yy"]), field_only=True)
+        assert col.values == ["x", "yy"]
+
+    def testReadNumpy(self):
+        """
+        Read values are handed to Ice as contiguous numpy arrays.
+        """
+        numpy = pytest.importorskip("numpy")
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        self.init(hdf, False)
+        for i in range(3):
+            self.append(hdf, {"a": i, "b": 10 * i, "c": -i})
+        data = hdf.read(time.time(), [0, 2], 0, 3, self.current)
+        for col in data.columns:
+            assert isinstance(col.values, numpy.ndarray)
+            assert col.values.dtype == numpy.int64
+            assert col.values.flags.c_contiguous
+        assert data.columns[1].values.tolist() == [0, -1, -2]
+        data = hdf.readCoordinates(time.time(), [2, 0], self.current)
+        assert isinstance(data.columns[2].values, numpy.ndarray)
+        assert data.columns[2].values.tolist() == [-2, 0]
+        hdf.cleanup()
+
+    def testMarshalNumpy(self):
+        """
+        Ice sends numpy arrays as it sends the equivalent lists.
+        """
+        numpy = pytest.importorskip("numpy")
+
+        class Table(omero.grid.Table):
+
+            def __init__(self, columns):
+                self.columns = columns
+
+            def read(self, colNumbers, start, stop, current=None):
+                return omero.grid.Data(columns=[
+                    col.marshal() for col in self.columns])
+
+        def column(cls, values, *args):
+            col = cls("c", "", *args)
+            col.values = values
+            return col
+
+        adapter = self.ic.createObjectAdapterWithEndpoints(
+            "MarshalNumpy", "tcp -h 127.0.0.1")
+        adapter.activate()
+        try:
+            columns = []
+            for values in (
+                    numpy.array([1, -2, 2 ** 40], dtype=numpy.int64),
+                    numpy.array([0.5, -1e300, numpy.pi]),
+                    numpy.array([True, False, True])):
+                cls = {"i": omero.columns.LongColumnI,
+                       "f": omero.columns.DoubleColumnI,
+                       "b": omero.columns.BoolColumnI}[values.dtype.kind]
+                columns.append((column(cls, values),
+                                column(cls, values.tolist())))
+            values = numpy.arange(6, dtype=numpy.int64).reshape((3, 2))
+            columns.append((
+                column(omero.columns.LongArrayColumnI, values, 2),
+                column(omero.columns.LongArrayColumnI, values.tolist(), 2)))
+            values = numpy.arange(6, dtype=numpy.float32).reshape((2, 3))
+            columns.append((
+                column(omero.columns.FloatArrayColumnI, values, 3),
+                column(omero.columns.FloatArrayColumnI, values.tolist(), 3)))
+
+            arrays = omero.grid.TablePrx.uncheckedCast(adapter.addWithUUID(
+                Table([x[0] for x in columns]))).read([], 0, 0)
+            lists = omero.grid.TablePrx.uncheckedCast(adapter.addWithUUID(
+                Table([x[1] for x in columns]))).read([], 0, 0)
+            for (col, expected), a, b in zip(
+                    columns, arrays.columns, lists.columns):
+                assert isinstance(col.values, numpy.ndarray)
+                assert a.values == b.values == expected.values
+        finally:
+            adapter.destroy()
+
+    def testConcurrentReaders(self):
+        """
+        Several threads reading one file hold its read lock together
+        and see the same data while a writer appends more rows.
+        """
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        cols = self.cols()
+        hdf.initialize(cols)
+        n = 1000
+        for i, col in enumerate(cols):
+            col.values = list(range(i * n, (i + 1) * n))
+        hdf.append(cols)
+
+        errors = []
+        inside = []
+        entered = threading.Barrier(2, timeout=10)
+
+        def reader(count, barrier=None):
+            try:
+                if barrier:
+                    hdf._lock.acquire_read()
+                    try:
+                        inside.append(threading.current_thread())
+                        barrier.wait()
+                    finally:
+                        hdf._lock.release_read()
+                for x in range(count):
+                    data = hdf.read(time.time(), [0, 2], 0, n, self.current)
+                    assert list(data.columns[0].values) == list(range(n))
+                    assert data.columns[1].values[-1] == 3 * n - 1
+            except Exception as e:
+                errors.append(e)
+
+        # Two readers must be able to hold the lock at the same time,
+        # otherwise the barrier times out.
+        threads = [threading.Thread(target=reader, args=(1, entered))
+                   for x in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not errors
+        assert len(inside) == 2
+
+        threads = [threading.Thread(target=reader, args=(20,))
+                   for x in range(4)]
+        for t in threads:
+            t.start()
+        for x in range(5):
+            self.append(hdf, {"a": -1, "b": -1, "c": -1})
+        for t in threads:
+            t.join()
+        assert not errors
+        assert hdf.rows() == n + 5
+        hdf.cleanup()
+
+    def testConcurrentReadersBenchmark(self, monkeypatch):
+        """
+        Compares the read throughput of one and of four threads reading
+        a file opened with omero.tables.hdf5.threadsafe=true. The calls
+        into PyTables are serialised by the HDF5 lock of the file, so
+        only the rest of each read runs in parallel. The speedup is
+        logged rather than asserted since it depends on the machine.
+        """
+        log = logging.getLogger("omero.tables.benchmark")
+        hdflist = HdfList(threadsafe=True)
+        monkeypatch.setattr(storage_module, 'HDFLIST', hdflist)
+        t = object()
+        hdf = hdflist.getOrCreate(str(self.hdfpath()), t)
+        # The file has its own HDF5 lock rather than the one of the list
+        assert hdf._hdf5lock is not hdflist._lock
+        cols = self.cols()
+        hdf.initialize(cols)
+        n = 10000
+        for i, col in enumerate(cols):
+            col.values = list(range(i * n, (i + 1) * n))
+        hdf.append(cols)
+
+        count = 20
+        errors = []
+
+        def reader():
+            try:
+                for x in range(count):
+                    data = hdf.read(time.time(), [0, 2], 0, n, self.current)
+                    assert data.columns[0].values[-1] == n - 1
+                    assert data.columns[1].values[-1] == 3 * n - 1
+            except Exception as e:
+                errors.append(e)
+
+        rates = {}
+        for size in (1, 4):
+            threads = [threading.Thread(target=reader)
+                       for x in range(size)]
+            start = time.time()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = max(time.time() - start, 1e-6)
+            assert not errors
+            rates[size] = old_div(size * count, elapsed)
+            log.info("%s reader(s): %.1f reads/s", size, rates[size])
+        log.info("Speedup of 4 readers: %.2f", old_div(rates[4], rates[1]))
+
+        hdf.decr(t)
+        assert hdf._HdfStorage__hdf_file is None
+
     #
     # ROIs
     #
@@ -469,7 +845,7 @@ class TestHdfStorage(TestCase):
         assert 5 == data.columns[0].y[0]
         assert 6 == data.columns[0].w[0]
         assert 7 == data.columns[0].h[0]
-        assert [0] == data.columns[0].bytes[0]
+        assert b"\x00" == data.columns[0].bytes[0]
 
         assert 2 == data.columns[0].imageId[1]
         assert 2 == data.columns[0].theZ[1]
@@ -478,7 +854,7 @@ class TestHdfStorage(TestCase):
         assert 5 == data.columns[0].y[1]
         assert 6 == data.columns[0].w[1]
         assert 7 == data.columns[0].h[1]
-        assert [0, 1, 2, 3, 4] == data.columns[0].bytes[1]
+        assert b"\x00\x01\x02\x03\x04" == data.columns[0].bytes[1]
 
         data = hdf.read(hdf._stamp, [0], 0, 1, self.current)
         assert len(data.columns) == 1
@@ -490,7 +866,27 @@ class TestHdfStorage(TestCase):
         assert 5 == data.columns[0].y[0]
         assert 6 == data.columns[0].w[0]
         assert 7 == data.columns[0].h[0]
-        assert [0] == data.columns[0].bytes[0]
+        assert b"\x00" == data.columns[0].bytes[0]
+        hdf.cleanup()
+
+    def testMaskColumnBulk(self):
+        hdf = HdfStorage(self.hdfpath(), self.lock)
+        mask = omero.columns.MaskColumnI('mask', 'desc', None)
+        hdf.initialize([mask], None)
+        mask.setsize(5)
+        mask.imageId[:] = range(5)
+        mask.bytes = [bytes(bytearray(range(i + 1))) for i in range(5)]
+        hdf.append([mask])
+
+        data = hdf.readCoordinates(
+            hdf._stamp, [3, 4, 0, 1, 1], self.current)
+        col = data.columns[0]
+        assert list(col.imageId) == [3, 4, 0, 1, 1]
+        assert col.bytes == [b"\x00\x01\x02\x03", b"\x00\x01\x02\x03\x04",
+                             b"\x00", b"\x00\x01", b"\x00\x01"]
+
+        data = hdf.read(hdf._stamp, [0], 2, 4, self.current)
+        assert data.columns[0].bytes == [b"\x00\x01\x02", b"\x00\x01\x02\x03"]
         hdf.cleanup()
 
 
@@ -102,6 +102,9 @@ class mocked_service_factory(object):
     def keepAlive(self, *args):
         pass
 
+    def ice_getIdentity(self):
+        return Ice.Identity(self.db_uuid, "")
+
     def getAdminService(self):
         return mocked_admin_service(True)
 
@@ -165,6 +168,7 @@ class mocked_query_service(object):
 class mock_internal_repo(object):
     def __init__(self, dir):
         self.path = old_div(dir, "mock.h5")
+        self.calls = 0
 
     def __call__(self, *args):
         return self
@@ -173,6 +177,7 @@ class mock_internal_repo(object):
         return self
 
     def getFilePath(self, *args):
+        self.calls += 1
         return self.path
 
 
@@ -375,6 +380,73 @@ class TestTables(TestCase):
             assert 2.0 == data.columns[1].values[i]
         table.cleanup()
 
+    def testTableLookupsCached(self):
+        self.repofile(self.sf.db_uuid)
+        f = omero.model.OriginalFileI(1, True)
+        f.details.group = omero.model.ExperimenterGroupI(1, False)
+        self.sf.return_values.append(f)
+        admin = mocked_admin_service(False)
+        checks = []
+
+        def canUpdate(*args):
+            checks.append(args)
+            return admin.can_update
+        admin.canUpdate = canUpdate
+        self.sf.getAdminService = lambda: admin
+
+        internal_repo = mock_internal_repo(self.tmp)
+        tables = self.tablesI(internal_repo)
+        table1 = tables.getTable(f, self.sf, self.current).table
+        table2 = tables.getTable(f, self.sf, self.current).table
+        assert internal_repo.calls == 1
+        assert len(checks) == 1
+        assert not table2.can_write
+        assert table1.storage is table2.storage
+
+        # Permissions are cached per call context
+        self.current.ctx = {"omero.group": "-1"}
+        tables.getTable(f, self.sf, self.current).table.cleanup()
+        assert internal_repo.calls == 1
+        assert len(checks) == 2
+        table1.cleanup()
+        table2.cleanup()
+
+    def testSessionChecksShared(self):
+        self.repofile(self.sf.db_uuid)
+        f = omero.model.OriginalFileI(1, True)
+        f.details.group = omero.model.ExperimenterGroupI(1, False)
+        self.sf.return_values.append(f)
+        lookups = []
+        errors = []
+
+        class session(object):
+            def getClosed(self):
+                return False
+
+        class session_service(object):
+            def getSession(self, idname, ctx):
+                lookups.append(idname)
+                if errors:
+                    raise errors.pop()
+                return session()
+        self.sf.getSessionService = lambda: session_service()
+
+        tables = self.tablesI()
+        table1 = tables.getTable(f, self.sf, self.current).table
+        table2 = tables.getTable(f, self.sf, self.current).table
+        assert table1.check()
+        assert table2.check()
+        assert len(lookups) == 1
+
+        # Each sweep looks the session up again, failures are not shared
+        tables.resources.metrics["sweeps"] += 1
+        errors.append(Exception("Mock error"))
+        assert not table1.check()
+        assert table2.check()
+        assert len(lookups) == 3
+        table1.cleanup()
+        table2.cleanup()
+
     def testErrorInStorage(self):
         self.repofile(self.sf.db_uuid)
         of = omero.model.OriginalFileI(1, False)
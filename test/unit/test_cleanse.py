@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2026 University of Dundee & Open Microscopy Environment.
+# All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Test of the repository cleanser
+"""
+
+from builtins import object
+import json
+import pytest
+
+from omero.rtypes import rlong, unwrap
+from omero.util.cleanse import Cleanser
+
+
+class MockQueryService(object):
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.queries = []
+
+    def projection(self, query, params, ctx=None):
+        ids = unwrap(params.map["ids"])
+        self.queries.append(ids)
+        return [[rlong(x)] for x in ids if x in self.existing]
+
+
+@pytest.fixture
+def repo(tmpdir):
+    pixels = tmpdir.mkdir("Pixels")
+    for name in ("1", "2", "2_pyramid", ".3_pyramid.pyr_lock", "README"):
+        pixels.join(name).write("x")
+    sub = pixels.mkdir("Dir-001")
+    for name in ("1001", "1002", "1003"):
+        sub.join(name).write("xx")
+    return pixels
+
+
+def names(paths):
+    return sorted(p.split("Pixels")[1] for p in paths)
+
+
+class TestCleanser(object):
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def testCleanse(self, repo, workers):
+        qs = MockQueryService([1, 1002])
+        cleanser = Cleanser(qs, "Pixels", batch_size=4, workers=workers)
+        cleanser.cleanse(str(repo))
+        cleanser.finalize()
+        assert names(cleanser.cleansed) == [
+            "/.3_pyramid.pyr_lock", "/2", "/2_pyramid",
+            "/Dir-001/1001", "/Dir-001/1003"]
+        assert cleanser.bytes_cleansed == 7
+        assert sorted(x.basename for x in repo.listdir()) == [
+            "1", "Dir-001", "README"]
+        assert [x.basename for x in repo.join("Dir-001").listdir()] == [
+            "1002"]
+        # Ids are only queried once per batch
+        assert [len(q) for q in qs.queries] == [3, 3]
+
+    def testWalkOrder(self, repo):
+        cleanser = Cleanser(None, "Pixels")
+        paths = list(cleanser.walk(str(repo)))
+        assert [p.split("Pixels")[1] for p in paths] == [
+            "/.3_pyramid.pyr_lock", "/1", "/2", "/2_pyramid",
+            "/Dir-001/1001", "/Dir-001/1002", "/Dir-001/1003", "/README"]
+
+    def testCheckpoint(self, repo, tmpdir):
+        checkpoint = str(tmpdir.join("checkpoint.json"))
+        qs = MockQueryService([1, 2, 3, 1001, 1002, 1003])
+        cleanser = Cleanser(qs, "Pixels", batch_size=3,
+                            checkpoint=checkpoint)
+        paths = cleanser.walk(str(repo))
+        cleanser.root = str(repo)
+        for x in range(5):
+            cleanser.query_or_defer(next(paths))
+        # Interrupted after the first batch
+        with open(checkpoint) as f:
+            assert json.load(f) == {"Pixels": ["2"]}
+
+        qs.queries = []
+        cleanser = Cleanser(qs, "Pixels", batch_size=100,
+                            checkpoint=checkpoint)
+        cleanser.cleanse(str(repo))
+        cleanser.finalize()
+        assert sorted(qs.queries[0]) == [2, 1001, 1002, 1003]
+        with open(checkpoint) as f:
+            assert json.load(f) == {"Pixels": True}
+
+        qs.queries = []
+        cleanser = Cleanser(qs, "Pixels", checkpoint=checkpoint)
+        cleanser.cleanse(str(repo))
+        cleanser.finalize()
+        assert qs.queries == []
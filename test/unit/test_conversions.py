@@ -25,8 +25,10 @@ Simple tests of the new conversions used for units.
 
 from builtins import str
 from builtins import object
+import pytest
 from pytest import assertAlmostEqual
 from omero.conversions import Add
+from omero.conversions import ConversionTable
 from omero.conversions import Int
 from omero.conversions import Mul
 from omero.conversions import Pow
@@ -94,3 +96,48 @@ class TestConversions(object):
         self.assertEquals(0.0, ftoc(32.0))
         self.assertEquals(100.0, ftoc(212.0))
         self.assertEquals(-40.0, ftoc(-40.0))
+
+    def testLinear(self):
+        ftoc = Add(Mul(Rat(5, 9), Sym("f")), Rat(-160, 9))
+        scale, offset = ftoc.linear()
+        self.assertEquals(5.0 / 9, scale)
+        self.assertEquals(-160.0 / 9, offset)
+        for f in (32.0, 212.0, -40.0, 98.6):
+            self.assertEquals(ftoc(f), ftoc.convert(f))
+
+    def testLinearBigInt(self):
+        big = Mul(Rat(Int(1), Mul(Int("94607304725808"), Pow(10, 12))),
+                  Sym("ly"))
+        assert big.linear() == (big(1.0), 0.0)
+        assert big.convert(2.0) == big(2.0)
+
+    def testConvertArray(self):
+        import numpy
+        ctof = Add(Mul(Rat(Int(9), Int(5)), Sym("c")), Int(32))
+        values = numpy.array([0.0, 100.0, -40.0])
+        assert list(ctof.convert(values)) == [32.0, 212.0, -40.0]
+
+    def testNotLinear(self):
+        square = Mul(Sym("x"), Sym("x"))
+        with pytest.raises(ValueError):
+            square.linear()
+
+    def testConversionTable(self):
+        built = []
+
+        def ctof():
+            built.append("ctof")
+            return Add(Mul(Rat(Int(9), Int(5)), Sym("c")), Int(32))
+        table = ConversionTable(["CELSIUS", "FAHRENHEIT", "KELVIN"], {
+            ("CELSIUS", "FAHRENHEIT"): ctof,
+        })
+        assert built == []
+        c = table["CELSIUS"]["FAHRENHEIT"]
+        assert c is table.get("CELSIUS").get("FAHRENHEIT")
+        assert built == ["ctof"]
+        self.assertEquals(212.0, c(100.0))
+        assert "FAHRENHEIT" in table["CELSIUS"]
+        assert table.get("KELVIN").get("CELSIUS") is None
+        assert table.get("RANKINE") is None
+        with pytest.raises(KeyError):
+            table["FAHRENHEIT"]["CELSIUS"]
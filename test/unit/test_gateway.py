@@ -28,15 +28,20 @@ from builtins import object
 import Ice
 import pytest
 import sys
+import threading
 
 from omero.gateway import BlitzGateway, ImageWrapper, \
-    WellWrapper, LogicalChannelWrapper, OriginalFileWrapper
+    WellWrapper, LogicalChannelWrapper, OriginalFileWrapper, PixelsWrapper
+from omero.gateway.utils import ServiceOptsDict
 from omero.model import ImageI, PixelsI, ExperimenterI, EventI, \
     ProjectI, TagAnnotationI, FileAnnotationI, OriginalFileI, \
     MapAnnotationI, NamedValue, PlateI, WellI, \
     LogicalChannelI, LengthI, IlluminationI, BinningI, \
-    DetectorSettingsI, DichroicI, LightPathI
+    DetectorSettingsI, DichroicI, LightPathI, PixelsTypeI, \
+    DatasetI, DatasetImageLinkI, ImageAnnotationLinkI, ExperimenterGroupI, \
+    FilesetI
 from omero.model.enums import UnitsLength
+from omero.api import ResolutionDescription
 from omero.rtypes import rstring, rtime, rlong, rint, rdouble
 
 
@@ -49,19 +54,149 @@ class MockQueryService(object):
         return self.obj
 
 
+class MockRawPixelsStore(object):
+    """
+    Serves big-endian planes of a numpy (T, C, Z, Y, X) array
+    """
+
+    def __init__(self, data, pyramid=False, tile_size=(2, 2), levels=1):
+        self.data = data
+        self.pyramid = pyramid
+        self.tile_size = tile_size
+        self.levels = levels
+        self.level = 0
+        self.calls = []
+        self.contexts = []
+        self.resolution_levels = []
+        self.closed = False
+        self.clones = []
+        # Barrier the clones wait on in setPixelsId
+        self.clone_barrier = None
+        self.barrier = None
+
+    def clone(self):
+        store = MockRawPixelsStore(
+            self.data, self.pyramid, self.tile_size, self.levels)
+        store.barrier = self.clone_barrier
+        self.clones.append(store)
+        return store
+
+    def getResolutionLevels(self, _ctx=None):
+        return self.levels
+
+    def getResolutionDescriptions(self, _ctx=None):
+        # Each level halves the size of the previous one
+        sizeY, sizeX = self.data.shape[-2:]
+        return [ResolutionDescription(
+            -(-sizeX // 2 ** i), -(-sizeY // 2 ** i))
+            for i in range(self.levels)]
+
+    def setResolutionLevel(self, level, _ctx=None):
+        self.resolution_levels.append(level)
+        self.level = self.levels - 1 - level
+
+    def _bytes(self, pixels):
+        return pixels.astype(pixels.dtype.newbyteorder(">")).tobytes()
+
+    def requiresPixelsPyramid(self, _ctx=None):
+        return self.pyramid
+
+    def getTileSize(self, _ctx=None):
+        return list(self.tile_size)
+
+    def getTimepoint(self, t, _ctx=None):
+        self.calls.append(("getTimepoint", t))
+        return self._bytes(self.data[t])
+
+    def getStack(self, c, t, _ctx=None):
+        self.calls.append(("getStack", c, t))
+        return self._bytes(self.data[t, c])
+
+    def getHypercube(self, offset, size, step, _ctx=None):
+        self.calls.append(("getHypercube", offset, size, step))
+        x, y, z, c, t = offset
+        w, h, sz, sc, st = size
+        return self._bytes(
+            self.data[t:t+st, c:c+sc, z:z+sz, y:y+h, x:x+w])
+
+    def setPixelsId(self, pixels_id, bypass, _ctx=None):
+        self.contexts.append(_ctx)
+        if self.barrier is not None:
+            self.barrier.wait()
+
+    def getPlane(self, z, c, t, _ctx=None):
+        self.calls.append(("getPlane", z, c, t))
+        return self._bytes(self.data[t, c, z])
+
+    def getTile(self, z, c, t, x, y, w, h, _ctx=None):
+        self.calls.append(("getTile", z, c, t, x, y, w, h))
+        step = 2 ** self.level
+        plane = self.data[t, c, z, ::step, ::step]
+        return self._bytes(plane[y:y+h, x:x+w])
+
+    def begin_getPlane(self, z, c, t, _ctx=None):
+        self.calls.append(("begin_getPlane", z, c, t))
+        return self.getPlane(z, c, t)
+
+    def end_getPlane(self, result):
+        self.calls.append(("end_getPlane",))
+        return result
+
+    def begin_getTile(self, z, c, t, x, y, w, h, _ctx=None):
+        self.calls.append(("begin_getTile", z, c, t, x, y, w, h))
+        return self.getTile(z, c, t, x, y, w, h)
+
+    def end_getTile(self, result):
+        self.calls.append(("end_getTile",))
+        return result
+
+    def close(self, _ctx=None):
+        self.closed = True
+
+
 class MockConnection(BlitzGateway):
 
-    def __init__(self, obj_to_be_returned):
+    def __init__(self, obj_to_be_returned, raw_pixels_store=None):
         self.obj = obj_to_be_returned
+        self.raw_pixels_store = raw_pixels_store
         self.SERVICE_OPTS = dict()
 
     def getQueryService(self):
         return MockQueryService(self.obj)
 
+    def createRawPixelsStore(self):
+        return self.raw_pixels_store
+
     def getMaxPlaneSize(self):
         return (64, 64)
 
 
+class MockCloneConnection(MockConnection):
+    """
+    Keeps track of its clones, which like BlitzGateway.clone() start with
+    empty options
+    """
+
+    def __init__(self, obj_to_be_returned, raw_pixels_store=None):
+        super(MockCloneConnection, self).__init__(
+            obj_to_be_returned, raw_pixels_store)
+        self._sessionUuid = "uuid"
+        self.clones = []
+        self.closed = False
+
+    def clone(self):
+        conn = MockCloneConnection(self.obj, self.raw_pixels_store)
+        self.clones.append(conn)
+        return conn
+
+    def connect(self, sUuid=None):
+        return sUuid == self._sessionUuid
+
+    def close(self, hard=True):
+        assert not hard
+        self.closed = True
+
+
 @pytest.fixture(scope='function')
 def wrapped_image():
     experimenter = ExperimenterI()
@@ -360,3 +495,449 @@ class TestBlitzGatewayImageWrapper(object):
         data = wrapped_image.simpleMarshal(xtra={'tiled': True})
         self.assert_data(data)
         assert data['tiled'] is False
+
+
+@pytest.fixture(scope='function')
+def pixels_data():
+    numpy = pytest.importorskip("numpy")
+    return numpy.arange(2 * 2 * 3 * 4, dtype=numpy.uint16).reshape(
+        (1, 2, 2, 3, 4)) * 257
+
+
+@pytest.fixture(scope='function')
+def wrapped_pixels(pixels_data):
+    pixels = PixelsI(1, True)
+    pixels.sizeX = rint(4)
+    pixels.sizeY = rint(3)
+    pixels.sizeZ = rint(2)
+    pixels.sizeC = rint(2)
+    pixels.sizeT = rint(1)
+    pixels_type = PixelsTypeI()
+    pixels_type.value = rstring('uint16')
+    pixels.pixelsType = pixels_type
+    conn = MockConnection(None, MockRawPixelsStore(pixels_data))
+    return PixelsWrapper(conn=conn, obj=pixels)
+
+
+class TestPixelsWrapper(object):
+    """Tests for decoding of planes and tiles by `PixelsWrapper`."""
+
+    def test_get_planes(self, wrapped_pixels, pixels_data):
+        planes = list(wrapped_pixels.getPlanes([(0, 0, 0), (1, 0, 0)]))
+        assert len(planes) == 2
+        for z, plane in enumerate(planes):
+            assert plane.dtype == pixels_data.dtype
+            assert plane.dtype.isnative
+            assert (plane == pixels_data[0, 0, z]).all()
+        assert wrapped_pixels._conn.raw_pixels_store.closed
+
+    def test_get_tile(self, wrapped_pixels, pixels_data):
+        tile = wrapped_pixels.getTile(1, 0, 0, (1, 1, 2, 2))
+        assert tile.shape == (2, 2)
+        assert (tile == pixels_data[0, 0, 1, 1:3, 1:3]).all()
+
+    def test_get_planes_out(self, wrapped_pixels, pixels_data):
+        import numpy
+        out = numpy.zeros((2, 3, 4), dtype=pixels_data.dtype)
+        planes = list(wrapped_pixels.getPlanes(
+            [(0, 0, 0), (1, 0, 0)], out=out))
+        assert (out == pixels_data[0, 0]).all()
+        for plane in planes:
+            assert plane.base is not None
+
+    def test_get_planes_out_wrong_size(self, wrapped_pixels, pixels_data):
+        import numpy
+        out = numpy.zeros((1, 3, 4), dtype=pixels_data.dtype)
+        with pytest.raises(ValueError):
+            list(wrapped_pixels.getPlanes([(0, 0, 0), (1, 0, 0)], out=out))
+
+    def test_get_tiles_prefetch(self, wrapped_pixels, pixels_data):
+        tiles = [(z, 0, 0, (0, y, 4, 1)) for z in range(2) for y in range(3)]
+        store = wrapped_pixels._conn.raw_pixels_store
+        rv = wrapped_pixels.getTiles(tiles, prefetch=2)
+        first = next(rv)
+        assert (first == pixels_data[0, 0, 0, 0:1]).all()
+        # Two requests were sent before the first result was consumed
+        begun = [x for x in store.calls if x[0] == "begin_getTile"]
+        assert len(begun) == 2
+        rest = list(rv)
+        assert len(rest) == 5
+        for (z, c, t, (x, y, w, h)), tile in zip(tiles[1:], rest):
+            assert (tile == pixels_data[t, c, z, y:y+h, x:x+w]).all()
+        assert store.closed
+
+    def call_names(self, wrapped_pixels):
+        store = wrapped_pixels._conn.raw_pixels_store
+        return set(call[0] for call in store.calls)
+
+    def test_get_hyperstack_timepoint(self, wrapped_pixels, pixels_data):
+        data = wrapped_pixels.getHyperstack()
+        assert data.shape == (1, 2, 2, 3, 4)
+        assert (data == pixels_data).all()
+        assert self.call_names(wrapped_pixels) == set(["getTimepoint"])
+
+    def test_get_hyperstack_stack(self, wrapped_pixels, pixels_data):
+        data = wrapped_pixels.getHyperstack(maxBytes=3 * 4 * 2 * 2)
+        assert (data == pixels_data).all()
+        assert self.call_names(wrapped_pixels) == set(["getStack"])
+
+    def test_get_hyperstack_region(self, wrapped_pixels, pixels_data):
+        import numpy
+        out = numpy.zeros((1, 2, 1, 2, 3), dtype=pixels_data.dtype)
+        data = wrapped_pixels.getHyperstack(
+            z=(1, 2), tile=(1, 1, 3, 2), out=out)
+        assert data is out
+        assert (data == pixels_data[:, :, 1:2, 1:3, 1:4]).all()
+        assert self.call_names(wrapped_pixels) == set(["getHypercube"])
+
+    def test_get_hyperstack_planes(self, wrapped_pixels, pixels_data):
+        data = wrapped_pixels.getHyperstack(maxBytes=1)
+        assert (data == pixels_data).all()
+        assert self.call_names(wrapped_pixels) == set(["getPlane"])
+
+    def test_get_hyperstack_pyramid(self, wrapped_pixels, pixels_data):
+        wrapped_pixels._conn.raw_pixels_store.pyramid = True
+        data = wrapped_pixels.getHyperstack(tile=(1, 0, 3, 3), prefetch=3)
+        assert (data == pixels_data[..., 0:3, 1:4]).all()
+        assert self.call_names(wrapped_pixels) == set(
+            ["begin_getTile", "end_getTile", "getTile"])
+
+    def test_get_hyperstack_invalid(self, wrapped_pixels):
+        with pytest.raises(ValueError):
+            wrapped_pixels.getHyperstack(z=(0, 3))
+        with pytest.raises(ValueError):
+            wrapped_pixels.getHyperstack(tile=(2, 0, 4, 3))
+
+    def test_get_region(self, wrapped_pixels, pixels_data):
+        store = wrapped_pixels._conn.raw_pixels_store
+        region = wrapped_pixels.getRegion(1, 1, 0, tile=(1, 1, 3, 2),
+                                          workers=2)
+        assert (region == pixels_data[0, 1, 1, 1:3, 1:4]).all()
+        # Tiles are aligned to the 2x2 tile grid
+        tiles = sorted(call[4:] for clone in store.clones
+                       for call in clone.calls)
+        assert tiles == [(1, 1, 1, 1), (1, 2, 1, 1), (2, 1, 2, 1),
+                         (2, 2, 2, 1)]
+        assert 1 <= len(store.clones) <= 2
+        assert all(clone.closed for clone in store.clones)
+
+    def test_get_region_connections(self, wrapped_pixels, pixels_data):
+        store = wrapped_pixels._conn.raw_pixels_store
+        conn = MockCloneConnection(None, store)
+        conn.SERVICE_OPTS = {"omero.group": "5"}
+        wrapped_pixels._conn = conn
+        # Both workers wait for each other so that each opens a store,
+        # the second one on the cloned connection
+        store.clone_barrier = threading.Barrier(2, timeout=10)
+        region = wrapped_pixels.getRegion(0, 0, 0, workers=2, connections=2)
+        assert (region == pixels_data[0, 0, 0]).all()
+        assert len(conn.clones) == 1
+        assert conn.clones[0].closed
+        assert not conn.closed
+        # Every store uses the group of the connection
+        assert len(store.clones) == 2
+        for clone in store.clones:
+            assert clone.contexts == [{"omero.group": "5"}]
+
+    def test_get_region_level(self, pixels_data):
+        store = MockRawPixelsStore(pixels_data, pyramid=True, levels=2)
+        pixels = PixelsI(1, True)
+        pixels_type = PixelsTypeI()
+        pixels_type.value = rstring('uint16')
+        pixels.pixelsType = pixels_type
+        wrapped = PixelsWrapper(conn=MockConnection(None, store), obj=pixels)
+        # The 4x3 plane is 2x2 at level 1, the server's resolution 0
+        region = wrapped.getRegion(1, 0, 0, level=1)
+        assert region.shape == (2, 2)
+        assert (region == pixels_data[0, 0, 1, ::2, ::2]).all()
+        assert store.resolution_levels == [0]
+        assert store.clones
+        for clone in store.clones:
+            assert clone.resolution_levels == [0]
+        region = wrapped.getRegion(1, 0, 0, tile=(1, 1, 2, 1), level=0)
+        assert (region == pixels_data[0, 0, 1, 1:2, 1:3]).all()
+        assert store.resolution_levels == [0, 1]
+        with pytest.raises(ValueError):
+            wrapped.getRegion(level=2)
+
+    def test_get_tile_size(self, wrapped_pixels):
+        store = wrapped_pixels._conn.raw_pixels_store
+        assert wrapped_pixels.getTileSize() == (2, 2)
+        assert store.closed
+
+
+class MockPrefetchQueryService(object):
+    """
+    Answers the set-based prefetch queries from a list of links
+    """
+
+    def __init__(self, links, experimenters):
+        self.links = links
+        self.experimenters = experimenters
+        self.queries = []
+
+    def findAllByQuery(self, query, params, _ctx=None):
+        ids = [x.val for x in params.map["ids"].val]
+        self.queries.append((query, ids))
+        if "from Experimenter" in query:
+            return [e for e in self.experimenters if e.id.val in ids]
+        if "from WellSample" in query:
+            return []
+        attr = "parent" if "l.parent.id" in query else "child"
+        return [x for x in self.links
+                if "%s " % x.__class__.__name__[:-1] in query and
+                getattr(x, attr).id.val in ids]
+
+
+class MockPrefetchConnection(BlitzGateway):
+
+    def __init__(self, query_service):
+        self.query_service = query_service
+        self.SERVICE_OPTS = ServiceOptsDict()
+
+    def getQueryService(self):
+        return self.query_service
+
+
+class TestPrefetch(object):
+
+    def images(self, conn, count):
+        rv = []
+        for i in range(1, count + 1):
+            image = ImageI(i)
+            image.name = rstring('image %s' % i)
+            image.details.owner = ExperimenterI(i % 2 + 1, False)
+            image.details.group = ExperimenterGroupI(3, False)
+            image.unloadAnnotationLinks()
+            rv.append(ImageWrapper(conn, image))
+        return rv
+
+    def test_prefetch(self):
+        dataset = DatasetI(10)
+        dataset.name = rstring('dataset')
+        tag = TagAnnotationI(20)
+        tag.textValue = rstring('tag')
+        links = []
+        for i in range(1, 2502):
+            link = DatasetImageLinkI(100 + i)
+            link.parent = dataset
+            link.child = ImageI(i, False)
+            links.append(link)
+        link = ImageAnnotationLinkI(30)
+        link.parent = ImageI(2, False)
+        link.child = tag
+        links.append(link)
+        experimenters = [ExperimenterI(1), ExperimenterI(2)]
+        for e in experimenters:
+            e.omeName = rstring('user-%s' % e.id.val)
+
+        qs = MockPrefetchQueryService(links, experimenters)
+        conn = MockPrefetchConnection(qs)
+        images = self.images(conn, 2501)
+        assert conn.prefetch(iter(images), "parents", "annotations",
+                             "owner") == images
+        # Parents and annotations are loaded in chunks of 1000 ids
+        assert [len(ids) for q, ids in qs.queries] == [
+            1000, 1000, 501, 1000, 1000, 501, 1000, 1000, 501, 2]
+        qs.queries = []
+
+        for image in images[:3]:
+            parent = image.getParent()
+            assert parent.getId() == 10
+            assert parent.getName() == 'dataset'
+            parent, link = image.listParents(withlinks=True)[0]
+            assert link.getId() == 100 + image.getId()
+            assert image.getOwner().getOmeName() == (
+                'user-%s' % (image.getId() % 2 + 1))
+        assert [a.getId() for a in images[1].listAnnotations()] == [20]
+        assert list(images[0].listAnnotations()) == []
+        assert qs.queries == []
+
+    def test_prefetch_unknown(self):
+        conn = MockPrefetchConnection(MockPrefetchQueryService([], []))
+        with pytest.raises(ValueError):
+            conn.prefetch([], "children")
+
+
+class MockPagedQueryService(object):
+    """
+    Evaluates the id clauses and pagination of the queries selecting the
+    ids of each page of getObjects(), then returns the objects by id
+    """
+
+    def __init__(self, count, klass=ProjectI):
+        self.objects = [klass(i) for i in range(count)]
+        self.pages = []
+
+    def select(self, query, params):
+        rv = self.objects
+        if "obj.id in (:ids)" in query:
+            ids = set(x.val for x in params.map["ids"].val)
+            rv = [x for x in rv if x.id.val in ids]
+        if "obj.id > :last" in query:
+            rv = [x for x in rv if x.id.val > params.map["last"].val]
+        return rv
+
+    def projection(self, query, params, _ctx=None):
+        assert query.startswith("select distinct obj.id ")
+        assert query.endswith(" order by obj.id")
+        assert "fetch" not in query
+        rv = self.select(query, params)
+        offset = params.theFilter.offset.val
+        rv = rv[offset:offset + params.theFilter.limit.val]
+        self.pages.append(len(rv))
+        return [[rlong(x.id.val)] for x in rv]
+
+    def findAllByQuery(self, query, params, _ctx=None):
+        # Neither limited nor ordered, as the collections are fetched
+        assert params.theFilter is None
+        assert "obj.id > :last" not in query
+        return list(reversed(self.select(query, params)))
+
+
+class TestStreamObjects(object):
+
+    @pytest.fixture
+    def conn(self):
+        return MockPrefetchConnection(MockPagedQueryService(2500))
+
+    def ids(self, wrappers):
+        return [x.getId() for x in wrappers]
+
+    def test_pages(self, conn):
+        projects = conn.getObjects("Project", page_size=1000)
+        assert conn.getQueryService().pages == []
+        assert self.ids(projects) == list(range(2500))
+        assert conn.getQueryService().pages == [1000, 1000, 500]
+
+    def test_limit(self, conn):
+        projects = conn.getObjects("Project", page_size=1000,
+                                   opts={'limit': 1500})
+        assert self.ids(projects) == list(range(1500))
+        assert conn.getQueryService().pages == [1000, 500]
+
+    def test_last_id(self, conn):
+        projects = conn.getObjects("Project", page_size=1000,
+                                   opts={'last_id': 2000})
+        assert self.ids(projects) == list(range(2001, 2500))
+
+    def test_ids(self, conn):
+        ids = list(range(2400, 0, -3))
+        projects = conn.getObjects("Project", ids, respect_order=True,
+                                   page_size=300)
+        assert self.ids(projects) == ids
+        assert conn.getQueryService().pages == [300, 300, 200]
+
+    @pytest.mark.parametrize('obj_type,klass,opts', [
+        ("Well", WellI, {'load_images': True}),
+        ("Plate", PlateI, None),
+        ("Experimenter", ExperimenterI, None),
+        ("ExperimenterGroup", ExperimenterGroupI, None),
+        ("Fileset", FilesetI, None)])
+    def test_collections(self, obj_type, klass, opts):
+        conn = MockPrefetchConnection(MockPagedQueryService(25, klass))
+        objects = conn.getObjects(obj_type, page_size=10, opts=opts)
+        assert self.ids(objects) == list(range(25))
+        assert conn.getQueryService().pages == [10, 10, 5]
+
+    @pytest.mark.parametrize('opts', [
+        {'order_by': 'obj.name'}, {'offset': 10, 'limit': 10}])
+    def test_invalid(self, conn, opts):
+        with pytest.raises(ValueError):
+            list(conn.getObjects("Project", page_size=10, opts=opts))
+
+
+class MockTypesService(object):
+
+    def __init__(self):
+        self.calls = 0
+
+    def getEnumeration(self, klass, value, _ctx=None):
+        self.calls += 1
+        rv = PixelsTypeI(self.calls)
+        rv.value = rstring(value)
+        return rv
+
+    def createEnumeration(self, obj, _ctx=None):
+        pass
+
+
+class MockClient(object):
+    """
+    omero.client whose session returns the submitted requests
+    """
+
+    def __init__(self):
+        self.sf = self
+
+    def submit(self, request, _ctx=None):
+        return request
+
+
+class MockCachedConnection(MockPrefetchConnection):
+
+    def __init__(self, query_service):
+        super(MockCachedConnection, self).__init__(query_service)
+        self.types_service = MockTypesService()
+        self._sessionUuid = "session"
+
+    def getTypesService(self):
+        return self.types_service
+
+
+class TestGatewayCache(object):
+
+    @pytest.fixture
+    def conn(self):
+        return MockCachedConnection(MockQueryService(ExperimenterI(2)))
+
+    def test_disabled(self, conn):
+        assert conn.getCacheStats() is None
+        assert conn.getEnumeration("PixelsType", "uint8").getId() == 1
+        assert conn.getEnumeration("PixelsType", "uint8").getId() == 2
+
+    def test_enumeration(self, conn):
+        conn.enableCache(maxsize=10, ttl=60)
+        assert conn.getEnumeration("PixelsType", "uint8").getId() == 1
+        assert conn.getEnumeration("PixelsType", "uint8").getId() == 1
+        assert conn.getEnumeration("PixelsType", "int8").getId() == 2
+        stats = conn.getCacheStats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+        # Updates invalidate the cache
+        conn.createEnumeration(PixelsTypeI())
+        assert conn.getCacheStats()["size"] == 0
+        assert conn.getEnumeration("PixelsType", "uint8").getId() == 3
+
+    def test_shared(self, conn):
+        cache = conn.enableCache()
+        other = MockCachedConnection(MockQueryService(None))
+        other.enableCache(cache=cache)
+        conn.getEnumeration("PixelsType", "uint8")
+        assert other.getEnumeration("PixelsType", "uint8").getId() == 1
+        assert other.types_service.calls == 0
+
+    def test_experimenter(self, conn):
+        conn.enableCache()
+        assert conn.getObject("Experimenter", 2).getId() == 2
+        conn.getQueryService().obj = None
+        assert conn.getObject("Experimenter", 2).getId() == 2
+        # Other types are not cached
+        assert conn.getObject("Project", 2) is None
+        assert conn.getCacheStats()["hits"] == 1
+
+    def test_copies(self, conn):
+        conn.enableCache()
+        first = conn.getObject("Experimenter", 2)
+        first._obj.firstName = rstring("changed")
+        second = conn.getObject("Experimenter", 2)
+        assert second._obj is not first._obj
+        assert second._obj.firstName is None
+        assert conn.getCacheStats()["hits"] == 1
+
+    def test_chmod_group(self, conn):
+        conn.c = MockClient()
+        conn.enableCache()
+        conn.getObject("ExperimenterGroup", 2)
+        assert conn.getCacheStats()["size"] == 1
+        conn.chmodGroup(2, "rwr---")
+        assert conn.getCacheStats()["size"] == 0
@@ -15,7 +15,10 @@ from builtins import str
 from builtins import range
 from past.utils import old_div
 from builtins import object
+import numpy
 import pytest
+import subprocess
+import sys
 import omero
 import omero.clients
 from omero_model_ChannelI import ChannelI
@@ -404,3 +407,62 @@ class TestModel(object):
         q_to = Type(v_to, u_to)
         q_from = Type(q_to, u_from)
         pytest.assertAlmostEqual(v_from, q_from.getValue(), places=4)
+
+    @pytest.mark.parametrize("data", CONV_DATA, ids=CONV_IDS)
+    def testConvertArray(self, data):
+        Type, v_from, u_from, v_to, u_to = data
+        values = numpy.array([v_from] * 3)
+        converted = Type.convert(values, u_from, u_to)
+        assert converted.shape == (3,)
+        for v in converted:
+            pytest.assertAlmostEqual(v_to, v, places=4)
+        pytest.assertAlmostEqual(
+            v_to, Type.convert(v_from, u_from, u_to), places=4)
+
+    def testConvertSameUnit(self):
+        um = omero.model.enums.UnitsLength.MICROMETER
+        assert list(LengthI.convert([1, 2], um, "MICROMETER")) == [1.0, 2.0]
+
+    def testConvertUnknown(self):
+        with pytest.raises(Exception):
+            LengthI.convert([1.0], "PIXEL", "MICROMETER")
+
+
+UNIT_MODULES = ["omero_model_%sI" % x for x in (
+    "ElectricPotential", "Frequency", "Length", "Power",
+    "Pressure", "Temperature", "Time")]
+
+IMPORT_SCRIPT = """
+import gc
+import omero.clients
+%s
+from omero.conversions import Conversion
+print(sum(isinstance(o, Conversion) for o in gc.get_objects()))
+""" % "\n".join("import %s" % x for x in UNIT_MODULES)
+
+
+class TestUnitImport(object):
+
+    def testImportBenchmark(self):
+        """
+        Importing the unit classes should not build any conversion.
+        The self import time of each module is reported (see -s).
+        """
+        p = subprocess.Popen(
+            [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = p.communicate()
+        assert p.returncode == 0, err
+        assert int(out.strip()) == 0
+        for line in err.decode("utf-8").splitlines():
+            parts = [x.strip() for x in line.split("|")]
+            if len(parts) == 3 and parts[2] in UNIT_MODULES:
+                print("%s: %s us" % (parts[2], parts[0].split()[-1]))
+
+    def testLazyLookup(self):
+        table = LengthI.CONVERSIONS
+        ul = omero.model.enums.UnitsLength
+        c = table[ul.THOU][ul.MILE]
+        assert c is table.get(ul.THOU).get("MILE")
+        assert ul.MILE in table[ul.THOU]
+        assert table.get(ul.PIXEL).get(ul.MILE) is None
@@ -24,8 +24,41 @@ Simple tests of various ROI utilities
 """
 
 from builtins import object
+import numpy
+import pytest
 from omero.util.ROI_utils import pointsStringToXYlist, xyListToBbox
 from omero.util.roi_handling_utils import points_string_to_xy_list
+from omero.util.roi_handling_utils import (
+    get_line_data, get_polyline_data, interpolate, line_coordinates,
+    line_tiles)
+
+
+class MockPixels(object):
+    """
+    Pixels of a (T, Z, Y, X) array with a single channel
+    """
+
+    def __init__(self, data, tile_size=None):
+        self.data = data
+        self.tile_size = tile_size or data.shape[:-3:-1]
+        self.tiles = []
+
+    def getSizeX(self):
+        return self.data.shape[-1]
+
+    def getSizeY(self):
+        return self.data.shape[-2]
+
+    def _getNumpyType(self):
+        return self.data.dtype
+
+    def getTileSize(self):
+        return self.tile_size
+
+    def getTiles(self, zctTileList, prefetch=0):
+        for z, c, t, (x, y, w, h) in zctTileList:
+            self.tiles.append((z, c, t, (x, y, w, h)))
+            yield self.data[t, z, y:y + h, x:x + w]
 
 
 class TestRoiUtils(object):
@@ -60,3 +93,78 @@ class TestRoiUtils(object):
             "1,2 3,4 5,6"
         ))
         assert xy_list == [(1, 2), (3, 4), (5, 6)]
+
+
+class TestLineData(object):
+
+    @pytest.fixture
+    def pixels(self):
+        data = numpy.arange(3 * 2 * 20 * 20, dtype=numpy.uint16)
+        return MockPixels(data.reshape((3, 2, 20, 20)))
+
+    def test_line_coordinates(self):
+        ys, xs = line_coordinates([(1, 2), (5, 2)], 2)
+        assert numpy.array_equal(xs, [[1, 2, 3, 4], [1, 2, 3, 4]])
+        assert numpy.array_equal(ys, [[1.5] * 4, [2.5] * 4])
+
+        ys, xs = line_coordinates([(0, 0), (3, 0), (3, 3)], 1)
+        assert numpy.array_equal(xs, [[0, 1, 2, 3, 3, 3]])
+        assert numpy.array_equal(ys, [[0, 0, 0, 0, 1, 2]])
+
+        with pytest.raises(ValueError):
+            line_coordinates([(1, 2)])
+
+    def test_interpolate(self):
+        data = numpy.arange(100, dtype=numpy.float32).reshape((10, 10))
+        rv = interpolate(data, numpy.array([[2.5, -1]]),
+                         numpy.array([[3.5, 0]]))
+        assert rv.dtype == numpy.float32
+        assert rv.tolist() == [[28.5, 0]]
+
+    def test_get_line_data(self, pixels):
+        data = get_line_data(pixels, 12, 3, 2, 3, line_w=1, the_z=1,
+                             the_t=2)
+        assert data.dtype == numpy.uint16
+        assert data.tolist() == [list(range(2072, 2062, -1))]
+        # Only the tile around the line is fetched
+        assert pixels.tiles == [(1, 0, 2, (3, 3, 11, 2))]
+
+    def test_kymograph(self, pixels):
+        data = get_polyline_data(
+            pixels, [(2, 3), (12, 3)], line_w=2, the_t=list(range(3)))
+        assert data.shape == (3, 2, 10)
+        assert data[:, 1, 0].tolist() == [72, 872, 1672]
+        assert [t[2] for t in pixels.tiles] == [0, 1, 2]
+
+    def test_outside(self, pixels):
+        data = get_line_data(pixels, 30, 30, 40, 30)
+        assert data.shape == (2, 10)
+        assert not data.any()
+        assert pixels.tiles == []
+
+    def test_tiles(self, pixels):
+        # Lines across several cells of the tile grid, each tile
+        # bounding the pixels next to the line within a cell
+        points = [(1.5, 2), (17, 9.5), (4, 18)]
+        ys, xs = line_coordinates(points, 3)
+        expected = interpolate(pixels.data[2, 1], ys, xs)
+        pixels.tile_size = (7, 5)
+        data = get_polyline_data(pixels, points, line_w=3, the_z=1,
+                                 the_t=2)
+        assert numpy.array_equal(data, expected)
+        assert len(pixels.tiles) > 1
+        for z, c, t, (x, y, w, h) in pixels.tiles:
+            assert x // 7 == (x + w - 1) // 7
+            assert y // 5 == (y + h - 1) // 5
+
+    def test_tiles_diagonal(self):
+        data = numpy.zeros((1, 1, 2000, 2000), dtype=numpy.uint8)
+        pixels = MockPixels(data, tile_size=(256, 256))
+        get_polyline_data(pixels, [(10, 20), (1990, 1980)])
+        area = sum(w * h for z, c, t, (x, y, w, h) in pixels.tiles)
+        assert area < 1980 * 1960 / 5
+
+        # Only the pixels next to the line are fetched in each cell
+        ys, xs = line_coordinates([(10, 20), (1990, 1980)], 2)
+        tiles, indexes = line_tiles(ys, xs, 2000, 2000, (16, 16))
+        assert sum(w * h for x, y, w, h in tiles) < 1980 * 1960 / 50
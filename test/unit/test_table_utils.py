@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2026 University of Dundee & Open Microscopy Environment.
+# All rights reserved.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, write to the Free Software Foundation, Inc.,
+# 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+
+"""
+Test of table_utils
+"""
+
+from builtins import object
+import numpy
+import pytest
+
+from omero.grid import Data
+from omero.columns import LongColumnI, StringColumnI, MaskColumnI
+from omero.util.table_utils import ROW_NUMBERS, read_chunks, column_values
+
+
+class MockTable(object):
+
+    def __init__(self, nrows):
+        self.nrows = nrows
+        self.reads = []
+
+    def getHeaders(self, ctx=None):
+        return [LongColumnI("a"), StringColumnI("s", "", 8)]
+
+    def getNumberOfRows(self, ctx=None):
+        return self.nrows
+
+    def begin_read(self, colNumbers, start, stop, ctx=None):
+        self.reads.append((colNumbers, start, stop, ctx))
+        cols = self.getHeaders()
+        cols[0].values = list(range(start, stop))
+        cols[1].values = ["row%s" % x for x in range(start, stop)]
+        data = Data()
+        data.columns = [cols[i] for i in colNumbers]
+        data.rowNumbers = []
+        return data
+
+    def end_read(self, data):
+        return data
+
+
+class TestReadChunks(object):
+
+    def testChunks(self):
+        table = MockTable(25)
+        chunks = list(read_chunks(table, chunk_size=10))
+        assert [len(c["a"]) for c in chunks] == [10, 10, 5]
+        assert numpy.array_equal(
+            numpy.concatenate([c["a"] for c in chunks]), numpy.arange(25))
+        assert chunks[2]["s"][-1] == "row24"
+        assert [r[1:3] for r in table.reads] == [(0, 10), (10, 20), (20, 25)]
+        assert table.reads[0][3] == {ROW_NUMBERS: "false"}
+
+    def testRange(self):
+        table = MockTable(25)
+        chunks = list(read_chunks(table, [1], 3, 8, chunk_size=4))
+        assert [list(c.keys()) for c in chunks] == [["s"], ["s"]]
+        assert list(chunks[1]["s"]) == ["row7"]
+        assert list(read_chunks(table, start=5, stop=5)) == []
+        with pytest.raises(ValueError):
+            list(read_chunks(table, chunk_size=0))
+
+    def testPrefetch(self):
+        table = MockTable(30)
+        chunks = read_chunks(table, chunk_size=10)
+        next(chunks)
+        # The second chunk is requested before the first is consumed
+        assert len(table.reads) == 2
+
+    def testPandas(self):
+        pytest.importorskip("pandas")
+        table = MockTable(15)
+        chunks = list(read_chunks(table, chunk_size=10, pandas=True))
+        assert list(chunks[1].index) == list(range(10, 15))
+        assert list(chunks[1]["a"]) == list(range(10, 15))
+
+    def testMaskValues(self):
+        mask = MaskColumnI("m")
+        mask.imageId = [1, 2]
+        mask.theZ = [0, 0]
+        mask.theT = [0, 1]
+        mask.x = [0.0, 1.0]
+        mask.y = [0.0, 1.0]
+        mask.w = [2.0, 2.0]
+        mask.h = [2.0, 2.0]
+        mask.bytes = [b"\x01", b"\x02\x03"]
+        values = column_values(mask)
+        assert list(values.imageId) == [1, 2]
+        assert values.bytes[1] == b"\x02\x03"
@@ -33,14 +33,16 @@ from past.utils import old_div
 from builtins import object
 import json
 import pytest
+import threading
 from omero_ext.path import path
 from os import linesep
 
 from omero.util.text import CSVStyle, JSONStyle, PlainStyle, TableBuilder
 from omero.util.upgrade_check import UpgradeCheck
 from omero.util.temp_files import manager
+from omero.util.concurrency import ReadWriteLock
 from omero.util import (
-    get_omero_userdir, get_omero_user_cache_dir, get_user_dir)
+    get_omero_userdir, get_omero_user_cache_dir, get_user_dir, Resources)
 from omero_version import omero_version
 import omero.util.image_utils as image_utils
 try:
@@ -345,3 +347,110 @@ class TestUserdirs(object):
         assert get_omero_userdir() == tmpdir
 
         assert get_omero_user_cache_dir() == tmpdir / "cache"
+
+
+class TestReadWriteLock(object):
+
+    def testReadersShare(self):
+        lock = ReadWriteLock()
+        both = threading.Barrier(2, timeout=10)
+        held = []
+
+        def read():
+            lock.acquire_read()
+            try:
+                both.wait()
+                held.append(True)
+            finally:
+                lock.release_read()
+
+        threads = [threading.Thread(target=read) for x in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert held == [True, True]
+
+    def testWriterExcludesReaders(self):
+        lock = ReadWriteLock()
+        events = []
+        lock.acquire()
+        t = threading.Thread(
+            target=lambda: (lock.acquire_read(), events.append("read"),
+                            lock.release_read()))
+        t.start()
+        t.join(0.2)
+        assert events == []
+        events.append("write")
+        lock.release()
+        t.join()
+        assert events == ["write", "read"]
+
+    def testReentrant(self):
+        lock = ReadWriteLock()
+        with lock:
+            with lock:
+                lock.acquire_read()
+                lock.release_read()
+        lock.acquire_read()
+        lock.acquire_read()
+        lock.release_read()
+        lock.release_read()
+
+    def testNoUpgrade(self):
+        lock = ReadWriteLock()
+        lock.acquire_read()
+        try:
+            with pytest.raises(RuntimeError):
+                lock.acquire()
+        finally:
+            lock.release_read()
+        with pytest.raises(RuntimeError):
+            lock.release()
+
+
+class MockResource(object):
+
+    def __init__(self, alive):
+        self.alive = alive
+        self.checks = 0
+        self.cleaned = False
+
+    def check(self):
+        self.checks += 1
+        return self.alive
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+class TestResources(object):
+
+    def testStaggeredSweeps(self):
+        stop_event = threading.Event()
+        resources = Resources(600, stop_event, buckets=3, workers=2)
+        try:
+            # Wait for the initial sweep of the internal thread
+            for x in range(100):
+                if resources.getMetrics()["sweeps"]:
+                    break
+                stop_event.wait(0.05)
+            stuff = [MockResource(i % 2 == 0) for i in range(6)]
+            for r in stuff:
+                resources.add(r)
+
+            resources.sweep()
+            assert sum(r.checks for r in stuff) == 2
+            resources.sweep()
+            resources.sweep()
+            assert [r.checks for r in stuff] == [1] * 6
+            assert [r.cleaned for r in stuff] == [False, True] * 3
+
+            metrics = resources.getMetrics()
+            assert metrics["sweeps"] == 4
+            assert metrics["checked"] == 6
+            assert metrics["removed"] == 3
+            assert metrics["max_seconds"] >= metrics["last_seconds"]
+        finally:
+            resources.cleanup()
+        assert all(r.cleaned for r in stuff)